@@ -0,0 +1,7 @@
+"""
+Load-testing harness for the Saga Golf API.
+
+Starts the app against a disposable Postgres, a stub North gateway and an
+SMTP sink, then drives scripted scenarios and compares the results with the
+stored baselines.  See benchmarks/README.md for usage.
+"""
@@ -0,0 +1,133 @@
+"""
+Email rendering microbenchmark.
+
+Renders N personalized membership-renewal emails (subject, text and HTML)
+along each path:
+
+  fstring       the previous inline f-strings (no HTML escaping), as a baseline
+  render        EmailTemplates.render once per message
+  render_batch  one EmailTemplates.render_batch call with shared fields
+
+Template compilation is timed separately; the app pays it once at startup.
+
+    python -m benchmarks.email_templates              # 5,000 emails
+    python -m benchmarks.email_templates -n 20000 -r 3
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from services.email_templates import EmailTemplates  # noqa: E402
+
+SEASON    = 2027
+RENEW_URL = "https://sagafe.vercel.app/membership"
+
+
+def make_members(count: int) -> list[dict]:
+    tiers = [("Individual", Decimal("150.00")), ("Family", Decimal("250.00")), ("Senior", Decimal("100.00"))]
+    return [
+        {
+            "first_name": f"Member {i} <&>",
+            "tier_name": tiers[i % 3][0],
+            "amount": tiers[i % 3][1],
+        }
+        for i in range(count)
+    ]
+
+
+def _fstring(member: dict) -> tuple[str, str, str]:
+    first_name, tier_name, amount = member["first_name"], member["tier_name"], member["amount"]
+    subject = f"SAGA Golf — Renew your membership for {SEASON}"
+    text_body = (
+        f"Hi {first_name},\n\n"
+        f"The {SEASON} season is coming up and your {tier_name} membership is ready to renew.\n"
+        f"Amount due: ${amount:.2f}\n\n"
+        f"Renew here: {RENEW_URL}\n\n"
+        f"Thank you for being part of SAGA Golf!"
+    )
+    html_body = f"""
+    <html>
+    <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <div style="background-color: #2d5016; color: white; padding: 20px; text-align: center;">
+            <h1 style="margin: 0;">SAGA Golf</h1>
+        </div>
+        <div style="padding: 20px; background-color: #f9f9f9;">
+            <h2>Time to renew for {SEASON}</h2>
+            <p>Hi {first_name},</p>
+            <p>The {SEASON} season is coming up and your <strong>{tier_name}</strong> membership is ready to renew.</p>
+            <table style="width: 100%; border-collapse: collapse;">
+                <tr><td style="padding: 8px; font-weight: bold;">Membership Tier</td><td style="padding: 8px;">{tier_name}</td></tr>
+                <tr><td style="padding: 8px; font-weight: bold;">Season Year</td><td style="padding: 8px;">{SEASON}</td></tr>
+                <tr><td style="padding: 8px; font-weight: bold;">Amount Due</td><td style="padding: 8px;">${amount:.2f}</td></tr>
+            </table>
+            <p style="text-align: center; margin: 30px 0;">
+                <a href="{RENEW_URL}" style="background-color: #2d5016; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px;">Renew my membership</a>
+            </p>
+            <p>Thank you for being part of SAGA Golf!</p>
+        </div>
+        <div style="padding: 10px; text-align: center; color: #666; font-size: 12px;">
+            <p>SAGA Golf — A Non-Profit Golf Organization</p>
+        </div>
+    </body>
+    </html>
+    """
+    return subject, text_body, html_body
+
+
+def paths(members: list[dict], templates: EmailTemplates) -> dict[str, Callable[[], list]]:
+    return {
+        "fstring": lambda: [_fstring(member) for member in members],
+        "render": lambda: [
+            templates.render("membership_renewal", season_year=SEASON, renew_url=RENEW_URL, **member)
+            for member in members
+        ],
+        "render_batch": lambda: templates.render_batch(
+            "membership_renewal", members, season_year=SEASON, renew_url=RENEW_URL
+        ),
+    }
+
+
+def run(count: int = 5000, repeat: int = 5) -> tuple[float, dict[str, float]]:
+    """(compile seconds, median seconds per path for `count` emails)."""
+    started = time.perf_counter()
+    templates = EmailTemplates()
+    compile_seconds = time.perf_counter() - started
+
+    members = make_members(count)
+    timings = {}
+    for name, render in paths(members, templates).items():
+        render()  # warm up
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            render()
+            samples.append(time.perf_counter() - started)
+        timings[name] = statistics.median(samples)
+    return compile_seconds, timings
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--emails", type=int, default=5000, help="emails per render pass")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed passes per path")
+    args = parser.parse_args(argv)
+
+    compile_seconds, timings = run(args.emails, args.repeat)
+    print(f"compile all templates: {compile_seconds * 1000:.1f} ms (once per worker)\n")
+    print(f"{'path':<14} {'ms':>9} {'µs/email':>9}   ({args.emails} emails, median of {args.repeat})")
+    for name, seconds in timings.items():
+        print(f"{name:<14} {seconds * 1000:>9.1f} {seconds / args.emails * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Cold-start import-time benchmark.
+
+Imports the app (`import main`) in fresh interpreters under
+`python -X importtime`, reports the median cumulative import time and the
+heaviest modules, and fails if the median exceeds the budget. Worker boot
+time is dominated by this import, so it's what scale-out waits on.
+
+    python -m benchmarks.import_time                    # 7 runs, default budget
+    python -m benchmarks.import_time -r 15 --top 25
+    python -m benchmarks.import_time --budget-ms 900
+
+The budget defaults to IMPORT_TIME_BUDGET_MS. Modules in DEFERRED_MODULES are
+meant to load on first use, never at startup; importing one at startup also
+fails the run.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+# Heavy dependencies only some requests need (North calls, JWTs, password
+# hashing). smtplib isn't one: services.email_service needs it at startup,
+# and with ssl already loaded by asyncio it costs about 1.5 ms.
+DEFERRED_MODULES = ("httpx", "jose", "jinja2", "passlib")
+
+_PROBE = "import sys, main; print(','.join(m for m in {mods!r} if m in sys.modules))"
+
+
+@dataclass
+class ImportSample:
+    total_us:   int
+    modules:    dict[str, int]  # module → cumulative µs
+    deferred:   list[str]       # DEFERRED_MODULES that were imported anyway
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """`-X importtime` output → {module: cumulative µs}."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        try:
+            modules[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return modules
+
+
+def sample() -> ImportSample:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "postgresql+psycopg2://bench@127.0.0.1:1/saga")
+    env.setdefault("SECRET_KEY", "import-time-benchmark")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(mods=DEFERRED_MODULES)],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    modules = parse_importtime(result.stderr)
+    last_line = (result.stdout.strip().splitlines() or [""])[-1]  # the probe prints last
+    deferred = [m for m in last_line.split(",") if m]
+    return ImportSample(modules.get("main", 0), modules, deferred)
+
+
+def run(repeat: int = 7) -> list[ImportSample]:
+    sample()  # warm the bytecode cache
+    return [sample() for _ in range(repeat)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-r", "--repeat", type=int, default=7, help="fresh interpreters to time")
+    parser.add_argument("--top", type=int, default=15, help="heaviest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    samples = run(args.repeat)
+    median_ms = statistics.median(s.total_us for s in samples) / 1000
+    heaviest = samples[len(samples) // 2].modules
+
+    print(f"{'module':<48} {'ms':>9}")
+    for name, us in sorted(heaviest.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:<48} {us / 1000:>9.1f}")
+    print(f"\nimport main: median {median_ms:.1f} ms over {args.repeat} runs (budget {args.budget_ms:.0f} ms)")
+
+    failures = []
+    if median_ms > args.budget_ms:
+        failures.append(f"import time {median_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    deferred = sorted({m for s in samples for m in s.deferred})
+    if deferred:
+        failures.append(f"imported at startup but should load lazily: {', '.join(deferred)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+North Gateway Simulator
+ASGI stand-in for the North endpoints used by services/north_payment_service:
+
+  POST /auth                                  → JWT with a configurable TTL
+  POST /mids/{mid}/gateways/payment           → charge (HTTP 201, decline in body)
+  POST /accounts/{accountId}/transactions     → refund or void
+  GET  /accounts/{accountId}/transactions     → paged transaction listing
+
+Behaviour is deterministic for a given seed and script:
+  - latency is injected per endpoint (auth / charge / transactions)
+  - tokens expire after token_ttl_s and then yield 401 like the real gateway
+  - declines come from, in order: the scripted outcome queue, magic payment
+    tokens ("tok_decline…", "tok_error…"), then decline_rate
+  - voids are only allowed before settlement, refunds only after
+
+Control endpoints under /_sim let a benchmark running in another process
+reconfigure latency, script outcomes, expire tokens or settle the batch.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import secrets
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi import FastAPI, Header, Request
+from fastapi.responses import HTMLResponse, JSONResponse
+
+
+@dataclass
+class SimulatorConfig:
+    mid:                    str   = "sim-mid"
+    developer_key:          str   = "sim-dev-key"
+    password:               str   = "sim-password"
+    account_id:             str   = "sim-account"
+    auth_latency_ms:        float = 50.0
+    charge_latency_ms:      float = 150.0
+    transaction_latency_ms: float = 100.0
+    token_ttl_s:            float = 300.0
+    decline_rate:           float = 0.0
+    seed:                   int   = 0
+
+
+@dataclass
+class SimTransaction:
+    id:              int
+    uniq_id:         str
+    amount:          Decimal
+    status:          str                    # "approved" | "declined" | "voided" | "refunded"
+    card_last_four:  str
+    created_at:      datetime
+    settled:         bool    = False
+    refunded_amount: Decimal = Decimal("0")
+    history:         list[dict] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "id":              self.id,
+            "uniq_id":         self.uniq_id,
+            "amount":          f"{self.amount:.2f}",
+            "status":          self.status,
+            "card_last_four":  self.card_last_four,
+            "created_at":      self.created_at.isoformat(),
+            "settled":         self.settled,
+            "refunded_amount": f"{self.refunded_amount:.2f}",
+        }
+
+
+class NorthSimulator:
+    """In-memory gateway state plus the ASGI app that serves it."""
+
+    def __init__(
+        self,
+        config: SimulatorConfig | None = None,
+        clock:  Callable[[], float] = time.monotonic,
+        now:    Callable[[], datetime] = datetime.now,
+    ):
+        self.config  = config or SimulatorConfig()
+        self._clock  = clock
+        self._now    = now
+        self.reset()
+        self.app     = self._build_app()
+
+    # ── State ───────────────────────────────────────────────────────────────────
+
+    def reset(self) -> None:
+        self.rng          = random.Random(self.config.seed)
+        self.tokens:       dict[str, float] = {}
+        self.transactions: dict[int, SimTransaction] = {}
+        self.script:       deque[str] = deque()
+        self.calls:        dict[str, int] = {"auth": 0, "charge": 0, "transactions": 0}
+        self._ids         = itertools.count(87_654_321)
+
+    def script_outcomes(self, *outcomes: str) -> None:
+        """
+        Queue outcomes for the next charges: "APPROVAL", "DECLINE", "ERROR"
+        (North's JSON 500) or "PROXY_ERROR" (an HTML 502 from the proxy in front).
+        """
+        self.script.extend(o.upper() for o in outcomes)
+
+    def expire_tokens(self) -> None:
+        self.tokens.clear()
+
+    def settle(self) -> int:
+        """Close the batch: every approved transaction becomes refundable, not voidable."""
+        count = 0
+        for txn in self.transactions.values():
+            if not txn.settled and txn.status == "approved":
+                txn.settled = True
+                count += 1
+        return count
+
+    def _issue_token(self) -> str:
+        token = secrets.token_urlsafe(24)
+        self.tokens[token] = self._clock() + self.config.token_ttl_s
+        return token
+
+    def _token_valid(self, authorization: str | None) -> bool:
+        if not authorization or not authorization.startswith("Bearer "):
+            return False
+        expires = self.tokens.get(authorization.removeprefix("Bearer "))
+        return expires is not None and expires > self._clock()
+
+    def _next_outcome(self, payment_token: str) -> str:
+        if self.script:
+            return self.script.popleft()
+        if payment_token.startswith("tok_decline"):
+            return "DECLINE"
+        if payment_token.startswith("tok_error"):
+            return "ERROR"
+        if self.config.decline_rate and self.rng.random() < self.config.decline_rate:
+            return "DECLINE"
+        return "APPROVAL"
+
+    @staticmethod
+    async def _delay(latency_ms: float) -> None:
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+    # ── Gateway endpoints ───────────────────────────────────────────────────────
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(title="North gateway simulator")
+        sim = self
+
+        @app.post("/auth")
+        async def auth(request: Request):
+            sim.calls["auth"] += 1
+            await sim._delay(sim.config.auth_latency_ms)
+            body = await request.json()
+            cfg  = sim.config
+            if (
+                body.get("mid") != cfg.mid
+                or body.get("developerKey") != cfg.developer_key
+                or body.get("password") != cfg.password
+            ):
+                return JSONResponse({"message": "Invalid credentials"}, status_code=401)
+            return {
+                "token":     sim._issue_token(),
+                "accountId": cfg.account_id,
+                "expiresIn": cfg.token_ttl_s,
+            }
+
+        @app.post("/mids/{mid}/gateways/payment")
+        async def charge(mid: str, request: Request, authorization: str | None = Header(None)):
+            sim.calls["charge"] += 1
+            await sim._delay(sim.config.charge_latency_ms)
+            if not sim._token_valid(authorization):
+                return JSONResponse({"message": "Token expired"}, status_code=401)
+            if mid != sim.config.mid:
+                return JSONResponse({"message": "Unknown merchant"}, status_code=404)
+
+            body    = await request.json()
+            outcome = sim._next_outcome(str(body.get("token", "")))
+            if outcome == "ERROR":
+                return JSONResponse({"message": "Processor unavailable"}, status_code=500)
+            if outcome == "PROXY_ERROR":
+                return HTMLResponse("<html><body><h1>502 Bad Gateway</h1></body></html>", status_code=502)
+
+            txn_id = next(sim._ids)
+            txn    = SimTransaction(
+                id=txn_id,
+                uniq_id=f"ccs_{txn_id}",
+                amount=Decimal(str(body.get("amount", "0"))),
+                status="approved" if outcome == "APPROVAL" else "declined",
+                card_last_four="4242",
+                created_at=sim._now(),
+            )
+            sim.transactions[txn_id] = txn
+
+            # Like the real gateway, declines are HTTP 201 with the reason in the body
+            return JSONResponse(
+                {
+                    "uniq_id":        txn.uniq_id,
+                    "responseText":   outcome,
+                    "approved":       outcome == "APPROVAL",
+                    "amount":         f"{txn.amount:.2f}",
+                    "card_last_four": txn.card_last_four,
+                },
+                status_code=201,
+            )
+
+        @app.post("/accounts/{account_id}/transactions")
+        async def transact(account_id: str, request: Request, authorization: str | None = Header(None)):
+            sim.calls["transactions"] += 1
+            await sim._delay(sim.config.transaction_latency_ms)
+            if not sim._token_valid(authorization):
+                return JSONResponse({"message": "Token expired"}, status_code=401)
+
+            body = await request.json()
+            kind = body.get("type")
+            if kind == "void":
+                return sim._void(int(body.get("transaction_id", 0)), body.get("username"))
+            if kind == "refund":
+                return sim._refund(
+                    int(body.get("ccs_pk", 0)),
+                    Decimal(str(body.get("amount", "0"))),
+                    body.get("username"),
+                )
+            return JSONResponse({"message": f"Unsupported type: {kind}"}, status_code=400)
+
+        @app.get("/accounts/{account_id}/transactions")
+        async def list_transactions(
+            account_id:    str,
+            date:          str | None = None,
+            page:          int = 1,
+            pageSize:      int = 100,
+            authorization: str | None = Header(None),
+        ):
+            sim.calls["transactions"] += 1
+            await sim._delay(sim.config.transaction_latency_ms)
+            if not sim._token_valid(authorization):
+                return JSONResponse({"message": "Token expired"}, status_code=401)
+
+            rows = sorted(sim.transactions.values(), key=lambda t: t.id)
+            if date:
+                rows = [t for t in rows if t.created_at.date().isoformat() == date]
+            start = (page - 1) * pageSize
+            chunk = rows[start:start + pageSize]
+            return {
+                "transactions": [t.to_dict() for t in chunk],
+                "page":         page,
+                "pageSize":     pageSize,
+                "total":        len(rows),
+                "hasMore":      start + pageSize < len(rows),
+            }
+
+        # ── Control endpoints ───────────────────────────────────────────────────
+
+        @app.get("/_sim/state")
+        async def state():
+            return {
+                "config":       asdict(sim.config),
+                "calls":        sim.calls,
+                "scripted":     list(sim.script),
+                "transactions": [t.to_dict() for t in sim.transactions.values()],
+            }
+
+        @app.post("/_sim/config")
+        async def configure(request: Request):
+            body = await request.json()
+            for key, value in body.items():
+                if hasattr(sim.config, key):
+                    setattr(sim.config, key, value)
+            return asdict(sim.config)
+
+        @app.post("/_sim/script")
+        async def script(request: Request):
+            sim.script_outcomes(*(await request.json()).get("outcomes", []))
+            return {"scripted": list(sim.script)}
+
+        @app.post("/_sim/expire-tokens")
+        async def expire_tokens():
+            sim.expire_tokens()
+            return {"expired": True}
+
+        @app.post("/_sim/settle")
+        async def settle():
+            return {"settled": sim.settle()}
+
+        @app.post("/_sim/reset")
+        async def reset():
+            sim.reset()
+            return {"reset": True}
+
+        return app
+
+    def _void(self, txn_id: int, username: str | None) -> JSONResponse:
+        txn = self.transactions.get(txn_id)
+        if not txn:
+            return JSONResponse({"message": "Transaction not found"}, status_code=404)
+        if txn.status != "approved" or txn.refunded_amount:
+            return JSONResponse({"message": f"Cannot void a {txn.status} transaction"}, status_code=400)
+        if txn.settled:
+            return JSONResponse({"message": "Transaction is settled; refund instead"}, status_code=400)
+        txn.status = "voided"
+        txn.history.append({"type": "void", "username": username})
+        return JSONResponse({"type": "void", "transaction_id": txn_id, "status": "voided"}, status_code=201)
+
+    def _refund(self, txn_id: int, amount: Decimal, username: str | None) -> JSONResponse:
+        txn = self.transactions.get(txn_id)
+        if not txn:
+            return JSONResponse({"message": "Transaction not found"}, status_code=404)
+        if txn.status not in ("approved", "refunded"):
+            return JSONResponse({"message": f"Cannot refund a {txn.status} transaction"}, status_code=400)
+        if not txn.settled:
+            return JSONResponse({"message": "Transaction is not settled; void instead"}, status_code=400)
+        if amount <= 0 or txn.refunded_amount + amount > txn.amount:
+            return JSONResponse({"message": "Refund exceeds captured amount"}, status_code=400)
+        txn.refunded_amount += amount
+        if txn.refunded_amount == txn.amount:
+            txn.status = "refunded"
+        txn.history.append({"type": "refund", "amount": f"{amount:.2f}", "username": username})
+        return JSONResponse(
+            {"type": "refund", "ccs_pk": txn_id, "amount": f"{amount:.2f}", "status": txn.status},
+            status_code=201,
+        )
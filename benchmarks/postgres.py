@@ -0,0 +1,75 @@
+"""
+Disposable Postgres cluster for benchmark runs.
+
+If BENCH_DATABASE_URL is set it is used as-is (and is expected to point at an
+empty, throwaway database).  Otherwise a fresh cluster is created with
+initdb in a temporary directory, started on a free port and removed again
+when the context exits.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _pg_binary(name: str) -> str:
+    path = shutil.which(name)
+    if path:
+        return path
+    # Debian/Ubuntu keep the server binaries out of PATH
+    for candidate in sorted(Path("/usr/lib/postgresql").glob(f"*/bin/{name}"), reverse=True):
+        return str(candidate)
+    raise RuntimeError(
+        f"'{name}' not found. Install PostgreSQL server binaries "
+        "or set BENCH_DATABASE_URL to an empty database."
+    )
+
+
+@contextmanager
+def disposable_postgres() -> Iterator[str]:
+    """Yield a psycopg2 SQLAlchemy URL for an empty database."""
+    external = os.getenv("BENCH_DATABASE_URL")
+    if external:
+        yield external
+        return
+
+    data_dir = Path(tempfile.mkdtemp(prefix="saga-bench-pg-"))
+    port     = free_port()
+    log_file = data_dir / "postgres.log"
+
+    subprocess.run(
+        [_pg_binary("initdb"), "-D", str(data_dir / "data"), "-U", "bench", "-A", "trust"],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        [
+            _pg_binary("pg_ctl"), "-D", str(data_dir / "data"), "-l", str(log_file), "-w",
+            "-o", f"-p {port} -k {data_dir} -c listen_addresses=127.0.0.1 -c fsync=off",
+            "start",
+        ],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+    try:
+        subprocess.run(
+            [_pg_binary("createdb"), "-h", "127.0.0.1", "-p", str(port), "-U", "bench", "saga"],
+            check=True,
+        )
+        yield f"postgresql+psycopg2://bench@127.0.0.1:{port}/saga"
+    finally:
+        subprocess.run(
+            [_pg_binary("pg_ctl"), "-D", str(data_dir / "data"), "-m", "immediate", "stop"],
+            check=False, stdout=subprocess.DEVNULL,
+        )
+        shutil.rmtree(data_dir, ignore_errors=True)
@@ -0,0 +1,51 @@
+"""
+Disposable Redis server for multi-worker rate-limit runs and tests.
+
+If BENCH_REDIS_URL is set it is used as-is. Otherwise `redis-server` is
+started on a free port with no persistence and stopped again when the
+context exits.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import subprocess
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from benchmarks.postgres import free_port
+
+
+@contextmanager
+def disposable_redis() -> Iterator[str]:
+    """Yield a redis:// URL for an empty Redis."""
+    external = os.getenv("BENCH_REDIS_URL")
+    if external:
+        yield external
+        return
+
+    binary = shutil.which("redis-server")
+    if not binary:
+        raise RuntimeError("'redis-server' not found. Install Redis or set BENCH_REDIS_URL.")
+
+    port = free_port()
+    process = subprocess.Popen(
+        [binary, "--port", str(port), "--bind", "127.0.0.1", "--save", "", "--appendonly", "no"],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("redis-server did not start")
+                time.sleep(0.05)
+        yield f"redis://127.0.0.1:{port}/0"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
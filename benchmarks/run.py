@@ -0,0 +1,214 @@
+"""
+Benchmark runner.
+
+    python -m benchmarks.run                          # all scenarios, compare with baselines
+    python -m benchmarks.run -s login_storm -n 200    # one scenario, 200 steps
+    python -m benchmarks.run --save-baseline          # record the current numbers
+
+Exits non-zero when any scenario regresses past --tolerance or has no
+baseline. baselines.json is machine-specific and not committed, so the first
+run on a machine must be --save-baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+from benchmarks.north_simulator import NorthSimulator, SimulatorConfig
+from benchmarks.postgres import disposable_postgres, free_port
+from benchmarks.scenarios import SCENARIOS, run_scenario
+from benchmarks.seed import SRC_DIR, SeedInfo, seed_database
+from benchmarks.smtp_sink import start_smtp_sink
+from benchmarks.stats import (
+    DEFAULT_TOLERANCE,
+    compare_to_baseline,
+    load_baselines,
+    save_baselines,
+)
+
+BASELINES_FILE = Path(__file__).resolve().parent / "baselines.json"
+BENCH_SECRET   = "bench-secret-key"
+
+
+@contextmanager
+def serve_in_thread(app, port: int) -> Iterator[None]:
+    """Run an ASGI app with uvicorn on a background thread."""
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    try:
+        yield
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+@contextmanager
+def app_process(env: dict[str, str], port: int, workers: int) -> Iterator[str]:
+    """Start the Saga API under uvicorn and wait for /health."""
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=SRC_DIR,
+        env={**os.environ, **env},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"API exited during startup (code {proc.returncode})")
+            try:
+                if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("API did not become healthy within 30s")
+            time.sleep(0.2)
+        yield base_url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _print_table(summaries: dict[str, dict]) -> None:
+    header = f"{'scenario':<20}{'reqs':>7}{'err':>6}{'rps':>10}{'p50':>9}{'p95':>9}{'p99':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, s in summaries.items():
+        print(
+            f"{name:<20}{s['requests']:>7}{s['errors']:>6}{s['throughput_rps']:>10.1f}"
+            f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}"
+        )
+
+
+async def _run_all(base_url: str, seed: SeedInfo, args: argparse.Namespace) -> dict[str, dict]:
+    summaries = {}
+    for name in args.scenario or SCENARIOS:
+        result = await run_scenario(
+            base_url, SCENARIOS[name], seed,
+            requests=args.requests, concurrency=args.concurrency,
+        )
+        summaries[name] = result.summary()
+    return summaries
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("-n", "--requests", type=int, help="steps per scenario (default: per scenario)")
+    parser.add_argument("-c", "--concurrency", type=int, help="concurrent clients (default: per scenario)")
+    parser.add_argument("--workers", type=int, default=2, help="uvicorn worker processes")
+    parser.add_argument("--north-latency-ms", type=float, default=150.0, help="charge latency")
+    parser.add_argument("--north-auth-latency-ms", type=float, default=50.0)
+    parser.add_argument("--north-token-ttl", type=float, default=300.0, help="seconds")
+    parser.add_argument("--north-decline-rate", type=float, default=0.05)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baselines", type=Path, default=BASELINES_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--json", type=Path, help="also write the raw summaries here")
+    args = parser.parse_args(argv)
+
+    if not args.save_baseline and not args.baselines.exists():
+        print(
+            f"No baselines at {args.baselines}. Record them on this machine first:\n"
+            "    python -m benchmarks.run --save-baseline",
+            file=sys.stderr,
+        )
+        return 2
+
+    with disposable_postgres() as database_url:
+        os.environ["DATABASE_URL"] = database_url
+        os.environ.setdefault("SECRET_KEY", BENCH_SECRET)
+        seed = seed_database()
+
+        north_port, smtp_port, api_port = free_port(), free_port(), free_port()
+        north = NorthSimulator(
+            SimulatorConfig(
+                mid="bench-mid",
+                developer_key="bench-dev-key",
+                password="bench-password",
+                auth_latency_ms=args.north_auth_latency_ms,
+                charge_latency_ms=args.north_latency_ms,
+                transaction_latency_ms=args.north_latency_ms,
+                token_ttl_s=args.north_token_ttl,
+                decline_rate=args.north_decline_rate,
+            )
+        )
+        smtp, smtp_stats = start_smtp_sink(smtp_port)
+
+        env = {
+            "DATABASE_URL":        database_url,
+            "SECRET_KEY":          os.environ["SECRET_KEY"],
+            "NORTH_BASE_URL":      f"http://127.0.0.1:{north_port}",
+            "NORTH_MID":           "bench-mid",
+            "NORTH_DEVELOPER_KEY": "bench-dev-key",
+            "NORTH_PASSWORD":      "bench-password",
+            "SMTP_HOST":           "127.0.0.1",
+            "SMTP_PORT":           str(smtp_port),
+            "SMTP_TLS":            "false",
+            "SMTP_EMAIL":          "bench@bench.local",
+            "SMTP_PASSWORD":       "bench",
+            # Scenarios like login_storm measure the work behind the limiter
+            "RATE_LIMIT_ENABLED":  "false",
+            # Background jobs would add load the scenarios don't account for
+            "SCHEDULER_ENABLED":   "false",
+        }
+        try:
+            with serve_in_thread(north.app, north_port), \
+                 app_process(env, api_port, args.workers) as base_url:
+                summaries = asyncio.run(_run_all(base_url, seed, args))
+        finally:
+            smtp.stop()
+
+    _print_table(summaries)
+    print(f"\nNorth simulator calls: {north.calls}")
+    print(f"SMTP sink received {smtp_stats.messages} message(s)")
+
+    if args.json:
+        args.json.write_text(json.dumps(summaries, indent=2) + "\n")
+
+    if args.save_baseline:
+        save_baselines(args.baselines, summaries)
+        print(f"Baselines written to {args.baselines}")
+        return 0
+
+    baselines   = load_baselines(args.baselines)
+    regressions = [
+        line
+        for name, summary in summaries.items()
+        for line in compare_to_baseline(name, summary, baselines.get(name), args.tolerance)
+    ]
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
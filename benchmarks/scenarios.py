@@ -0,0 +1,180 @@
+"""
+Scripted load scenarios and the closed-loop driver that runs them.
+
+Each scenario is a setup coroutine (login, pick ids) plus a step coroutine
+that issues one or more requests through a Recorder, which times every
+request individually.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from benchmarks.seed import SeedInfo
+from benchmarks.stats import ScenarioResult
+
+
+class Recorder:
+    """Thin wrapper over an AsyncClient that records status and latency per request."""
+
+    def __init__(self, client: httpx.AsyncClient, result: ScenarioResult):
+        self.client = client
+        self.result = result
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            resp = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.result.transport_errors += 1
+            return None
+        self.result.record(resp.status_code, (time.perf_counter() - start) * 1000)
+        return resp
+
+
+Setup = Callable[[httpx.AsyncClient, SeedInfo], Awaitable[dict]]
+Step  = Callable[[Recorder, SeedInfo, dict, int], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name:        str
+    description: str
+    step:        Step
+    setup:       Setup | None = None
+    requests:    int = 1000
+    concurrency: int = 32
+
+
+async def run_scenario(
+    base_url:    str,
+    scenario:    Scenario,
+    seed:        SeedInfo,
+    requests:    int | None = None,
+    concurrency: int | None = None,
+    transport:   httpx.AsyncBaseTransport | None = None,
+) -> ScenarioResult:
+    """Run `requests` steps with `concurrency` closed-loop workers."""
+    total   = requests or scenario.requests
+    workers = concurrency or scenario.concurrency
+    result  = ScenarioResult(name=scenario.name)
+    limits  = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60, transport=transport
+    ) as client:
+        ctx      = await scenario.setup(client, seed) if scenario.setup else {}
+        recorder = Recorder(client, result)
+        counter  = itertools.count()
+
+        async def worker() -> None:
+            while (i := next(counter)) < total:
+                await scenario.step(recorder, seed, ctx, i)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        result.duration_s = time.perf_counter() - start
+
+    return result
+
+
+# ── Event page browse ───────────────────────────────────────────────────────────
+
+async def _browse_step(rec: Recorder, seed: SeedInfo, ctx: dict, i: int) -> None:
+    await rec.request("GET", "/api/events/")
+    if i % 4 == 0:
+        await rec.request("GET", "/api/banner_messages/")
+    if i % 8 == 0:
+        await rec.request("GET", "/api/partners/")
+        await rec.request("GET", "/api/photo-albums/")
+
+
+# ── Registration rush ───────────────────────────────────────────────────────────
+
+async def _registration_step(rec: Recorder, seed: SeedInfo, ctx: dict, i: int) -> None:
+    await rec.request(
+        "POST",
+        "/api/registrations/guest",
+        json={
+            "event_id":        seed.rush_event_id,
+            "payment_token":   f"tok_{i}",
+            "idempotency_key": uuid.uuid4().hex,
+            "first_name":      "Rush",
+            "last_name":       f"Guest{i}",
+            "email":           f"rush{i}@bench.local",
+            "phone":           "5551234567",
+        },
+    )
+
+
+# ── Admin export ────────────────────────────────────────────────────────────────
+
+async def _admin_setup(client: httpx.AsyncClient, seed: SeedInfo) -> dict:
+    resp = await client.post(
+        "/auth/login", json={"email": seed.admin_email, "password": seed.password}
+    )
+    resp.raise_for_status()
+    return {"headers": {"Authorization": f"Bearer {resp.json()['access_token']}"}}
+
+
+async def _admin_export_step(rec: Recorder, seed: SeedInfo, ctx: dict, i: int) -> None:
+    headers = ctx["headers"]
+    await rec.request(
+        "GET", f"/api/admin/events/{seed.export_event_id}/registrations", headers=headers
+    )
+    if i % 2 == 0:
+        await rec.request("GET", "/api/admin/events", headers=headers)
+    if i % 5 == 0:
+        await rec.request("GET", "/api/admin/users", headers=headers)
+
+
+# ── Login storm ─────────────────────────────────────────────────────────────────
+
+async def _login_step(rec: Recorder, seed: SeedInfo, ctx: dict, i: int) -> None:
+    email = random.choice(seed.user_emails)
+    # One in ten attempts uses a wrong password, as a credential-stuffing flood would
+    password = seed.password if i % 10 else "wrong-password"
+    await rec.request("POST", "/auth/login", json={"email": email, "password": password})
+
+
+SCENARIOS: dict[str, Scenario] = {
+    s.name: s
+    for s in (
+        Scenario(
+            name="event_browse",
+            description="Anonymous visitors loading the events page and its widgets",
+            step=_browse_step,
+            requests=2000,
+            concurrency=64,
+        ),
+        Scenario(
+            name="registration_rush",
+            description="Guests racing for the last seats of a capped event",
+            step=_registration_step,
+            requests=400,
+            concurrency=50,
+        ),
+        Scenario(
+            name="admin_export",
+            description="Admins pulling registration lists, events and users",
+            step=_admin_export_step,
+            setup=_admin_setup,
+            requests=300,
+            concurrency=8,
+        ),
+        Scenario(
+            name="login_storm",
+            description="Burst of logins, including bad passwords",
+            step=_login_step,
+            requests=600,
+            concurrency=32,
+        ),
+    )
+}
@@ -0,0 +1,134 @@
+"""
+Schema bootstrap and fixture data for benchmark runs.
+
+Must be imported only after DATABASE_URL / SECRET_KEY point at the benchmark
+database, because the app's core modules read settings at import time.
+"""
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import sys
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+BENCH_PASSWORD = "bench-password-123"
+ADMIN_EMAIL    = "admin@bench.local"
+
+# Last migration whose tables and columns Base.metadata.create_all() already
+# creates. Running those files on top of it fails (002 re-inserts app_settings
+# rows without updated_at), so they're recorded with baseline() instead.
+MODELS_COVER_MIGRATION = 6
+
+
+@dataclass
+class SeedInfo:
+    browse_event_ids: list[int] = field(default_factory=list)
+    rush_event_id:    int = 0
+    export_event_id:  int = 0
+    user_emails:      list[str] = field(default_factory=list)
+    admin_email:      str = ADMIN_EMAIL
+    password:         str = BENCH_PASSWORD
+
+
+def _import_models() -> None:
+    import models
+
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module.name}")
+
+
+def seed_database(
+    users:              int = 200,
+    events:             int = 40,
+    rush_capacity:      int = 100,
+    export_registrants: int = 300,
+) -> SeedInfo:
+    """Create the saga schema and fill it with enough rows to make queries realistic."""
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+
+    from sqlalchemy import text
+
+    from core.database import Base, SessionLocal, engine
+
+    _import_models()
+    from models.event import Event
+    from models.event_registration import EventRegistration
+    from models.user import User, UserAccount
+    from services.auth_service import hash_password
+
+    from core.migrations import MigrationRunner
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE SCHEMA IF NOT EXISTS saga"))
+    Base.metadata.create_all(engine)
+    # The models already cover 001–006; triggers, partial indexes and seed rows
+    # from the later ones only exist in the SQL migrations
+    runner = MigrationRunner(engine)
+    runner.baseline(MODELS_COVER_MIGRATION)
+    runner.migrate()
+
+    info          = SeedInfo()
+    password_hash = hash_password(BENCH_PASSWORD)
+    today         = date.today()
+
+    with SessionLocal() as db:
+        event_rows = [
+            Event(
+                township=f"Township {i}",
+                state="NJ",
+                zipcode="08540",
+                golf_course=f"Course {i}",
+                date=today + timedelta(days=7 + i),
+                start_time=time(8, 0),
+                member_price=75,
+                guest_price=95,
+                capacity=rush_capacity if i == 0 else 144,
+            )
+            for i in range(events)
+        ]
+        db.add_all(event_rows)
+        db.flush()
+        info.rush_event_id    = event_rows[0].id
+        info.export_event_id  = event_rows[1].id
+        info.browse_event_ids = [e.id for e in event_rows]
+
+        accounts = []
+        for i in range(users + 1):
+            email = ADMIN_EMAIL if i == 0 else f"member{i}@bench.local"
+            user  = User(first_name="Bench", last_name=f"Member{i}", membership="member")
+            db.add(user)
+            db.flush()
+            account = UserAccount(
+                user_id=user.id,
+                email=email,
+                password_hash=password_hash,
+                role="admin" if i == 0 else "user",
+            )
+            db.add(account)
+            db.flush()
+            user.user_account_id = account.id
+            accounts.append(account)
+            if i:
+                info.user_emails.append(email)
+
+        db.add_all(
+            EventRegistration(
+                event_id=info.export_event_id,
+                user_id=accounts[1 + i % users].id if i < users else None,
+                email=f"registrant{i}@bench.local",
+                phone="5550000000",
+                payment_status="paid",
+                payment_method="card",
+                amount_paid=75,
+            )
+            for i in range(export_registrants)
+        )
+        db.commit()
+
+    engine.dispose()
+    return info
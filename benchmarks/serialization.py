@@ -0,0 +1,146 @@
+"""
+Serialization microbenchmark for hot public list endpoints.
+
+Times turning N photo-album rows into a JSON body along each path the API
+has used:
+
+  model_validate   per-item PhotoAlbumResponse.model_validate, then
+                   jsonable_encoder + json.dumps (the classic FastAPI path)
+  type_adapter     one TypeAdapter(List[...]) validate + dump_json in pydantic-core
+  model_construct  trusted rows built without validation, then dump_json
+  orjson           plain dicts through orjson.dumps (only if orjson is installed)
+  cached           a SerializedCache hit: the bytes from the previous render
+
+    python -m benchmarks.serialization               # 1,000 items
+    python -m benchmarks.serialization -n 5000 -r 100
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from core.response_cache import SerializedCache  # noqa: E402
+from schemas.admin import PhotoAlbumResponse  # noqa: E402
+
+_ALBUMS = TypeAdapter(list[PhotoAlbumResponse])
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    """Stand-ins for PhotoAlbum ORM rows (attribute access, snake_case)."""
+    start = date(2026, 1, 1)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"Outing {i} at Pine Valley",
+            date=start + timedelta(days=i % 365),
+            cover_image=f"/uploads/albums/{i}.jpg",
+            google_drive_link=f"https://drive.google.com/drive/folders/{i:08d}",
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _model_validate(rows) -> bytes:
+    items = [PhotoAlbumResponse.model_validate(row) for row in rows]
+    content = jsonable_encoder([item.model_dump(by_alias=True) for item in items])
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _type_adapter(rows) -> bytes:
+    return _ALBUMS.dump_json(_ALBUMS.validate_python(rows, from_attributes=True), by_alias=True)
+
+
+def _model_construct(rows) -> bytes:
+    return _ALBUMS.dump_json(
+        [
+            PhotoAlbumResponse.model_construct(
+                id=row.id,
+                title=row.title,
+                date=row.date,
+                coverImage=row.cover_image,
+                googleDriveLink=row.google_drive_link,
+            )
+            for row in rows
+        ],
+        by_alias=True,
+    )
+
+
+def _orjson(rows) -> bytes:
+    import orjson
+
+    return orjson.dumps([
+        {
+            "id": row.id,
+            "title": row.title,
+            "date": row.date,
+            "cover_image": row.cover_image,
+            "google_drive_link": row.google_drive_link,
+        }
+        for row in rows
+    ])
+
+
+def paths(rows) -> dict[str, Callable[[], bytes]]:
+    cache = SerializedCache()
+    cache.get("albums", (1,), lambda: _type_adapter(rows))
+
+    candidates = {
+        "model_validate":  lambda: _model_validate(rows),
+        "type_adapter":    lambda: _type_adapter(rows),
+        "model_construct": lambda: _model_construct(rows),
+        "cached":          lambda: cache.get("albums", (1,), lambda: _type_adapter(rows)),
+    }
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        candidates["orjson"] = lambda: _orjson(rows)
+    return candidates
+
+
+def run(items: int = 1000, repeat: int = 50) -> dict[str, float]:
+    """Median seconds per render for each path."""
+    rows = make_rows(items)
+    timings = {}
+    for name, render in paths(rows).items():
+        render()  # warm up
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            render()
+            samples.append(time.perf_counter() - started)
+        timings[name] = statistics.median(samples)
+    return timings
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--items", type=int, default=1000, help="list length")
+    parser.add_argument("-r", "--repeat", type=int, default=50, help="timed renders per path")
+    args = parser.parse_args(argv)
+
+    timings = run(args.items, args.repeat)
+    baseline = timings["model_validate"]
+    print(f"{'path':<16} {'ms':>9} {'speedup':>8}   ({args.items} items, median of {args.repeat})")
+    for name, seconds in timings.items():
+        print(f"{name:<16} {seconds * 1000:>9.3f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
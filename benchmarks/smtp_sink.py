@@ -0,0 +1,49 @@
+"""
+SMTP sink built on aiosmtpd: accepts any login, counts messages, delivers nowhere.
+
+aiosmtpd is a benchmark-only dependency (`pip install -e ".[bench]"`).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SinkStats:
+    messages: int = 0
+    bytes:    int = 0
+
+
+class _CountingHandler:
+    def __init__(self, stats: SinkStats):
+        self.stats = stats
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.stats.messages += 1
+        self.stats.bytes    += len(envelope.content or b"")
+        return "250 Message accepted"
+
+
+def _accept_any_login(server, session, envelope, mechanism, auth_data):
+    from aiosmtpd.smtp import AuthResult
+
+    return AuthResult(success=True)
+
+
+def start_smtp_sink(port: int) -> tuple[object, SinkStats]:
+    """Start the sink on 127.0.0.1:port. Returns (controller, stats); call controller.stop()."""
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError as exc:
+        raise RuntimeError('aiosmtpd is required: pip install -e ".[bench]"') from exc
+
+    stats      = SinkStats()
+    controller = Controller(
+        _CountingHandler(stats),
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=_accept_any_login,
+        auth_require_tls=False,
+    )
+    controller.start()
+    return controller, stats
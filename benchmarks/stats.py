@@ -0,0 +1,104 @@
+"""
+Latency / throughput bookkeeping and baseline comparison for benchmark runs.
+"""
+from __future__ import annotations
+
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# A scenario regresses when p95 latency grows or throughput shrinks by more
+# than this fraction relative to the stored baseline.
+DEFAULT_TOLERANCE = 0.20
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile. Returns 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class ScenarioResult:
+    name:          str
+    duration_s:    float                = 0.0
+    latencies_ms:  list[float]          = field(default_factory=list)
+    status_counts: Counter[int]         = field(default_factory=Counter)
+    transport_errors: int               = 0
+
+    def record(self, status_code: int, latency_ms: float) -> None:
+        self.status_counts[status_code] += 1
+        self.latencies_ms.append(latency_ms)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms) + self.transport_errors
+
+    @property
+    def errors(self) -> int:
+        """5xx responses plus connections that never produced a response."""
+        server_errors = sum(n for code, n in self.status_counts.items() if code >= 500)
+        return server_errors + self.transport_errors
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration_s if self.duration_s else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "requests":       self.requests,
+            "errors":         self.errors,
+            "throughput_rps": round(self.throughput, 2),
+            "p50_ms":         round(percentile(self.latencies_ms, 50), 2),
+            "p95_ms":         round(percentile(self.latencies_ms, 95), 2),
+            "p99_ms":         round(percentile(self.latencies_ms, 99), 2),
+            "status_counts":  {str(code): n for code, n in sorted(self.status_counts.items())},
+        }
+
+
+# ── Baselines ───────────────────────────────────────────────────────────────────
+
+def load_baselines(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baselines(path: Path, summaries: dict[str, dict]) -> None:
+    baselines = load_baselines(path)
+    baselines.update(summaries)
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def compare_to_baseline(
+    name:      str,
+    summary:   dict,
+    baseline:  dict | None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """
+    Return a human-readable line for every metric that regressed. A scenario
+    with no baseline is reported too, so an unrecorded one can't pass silently.
+    """
+    if not baseline:
+        return [f"{name}: no baseline recorded (run with --save-baseline)"]
+
+    regressions = []
+    for metric in ("p50_ms", "p95_ms", "p99_ms"):
+        old, new = baseline.get(metric), summary[metric]
+        if old and new > old * (1 + tolerance):
+            regressions.append(f"{name}: {metric} {old} → {new}")
+
+    old_rps, new_rps = baseline.get("throughput_rps"), summary["throughput_rps"]
+    if old_rps and new_rps < old_rps * (1 - tolerance):
+        regressions.append(f"{name}: throughput_rps {old_rps} → {new_rps}")
+
+    if summary["errors"] > baseline.get("errors", 0):
+        regressions.append(f"{name}: errors {baseline.get('errors', 0)} → {summary['errors']}")
+
+    return regressions
@@ -0,0 +1,37 @@
+-- Migration: Payment reconciliation
+-- Date: 2026-10-19
+-- Run: psql $DATABASE_URL -f migrations/003_payment_reconciliation.sql
+-- Idempotent: safe to run multiple times.
+
+BEGIN;
+
+-- 1. CREATE saga.reconciliation_issue — discrepancies found by the nightly job
+CREATE TABLE IF NOT EXISTS saga.reconciliation_issue (
+    id               SERIAL PRIMARY KEY,
+    run_date         DATE NOT NULL,
+    kind             VARCHAR(30) NOT NULL,
+    transaction_id   VARCHAR(64) NULL,
+    registration_id  INTEGER NULL,
+    payment_id       INTEGER NULL,
+    recorded_amount  NUMERIC(10,2) NULL,
+    gateway_amount   NUMERIC(10,2) NULL,
+    recorded_status  VARCHAR(30) NULL,
+    gateway_status   VARCHAR(30) NULL,
+    created_at       TIMESTAMP NOT NULL DEFAULT NOW(),
+    resolved_at      TIMESTAMP NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_reconciliation_issue_run_date
+    ON saga.reconciliation_issue(run_date);
+
+-- 2. Indexes the job joins on
+CREATE INDEX IF NOT EXISTS idx_event_registration_transaction_id
+    ON saga.event_registration(transaction_id) WHERE transaction_id IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_event_registration_created_at
+    ON saga.event_registration(created_at);
+
+CREATE INDEX IF NOT EXISTS idx_payment_external_reference
+    ON saga.payment(external_reference) WHERE external_reference IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,42 @@
+-- Migration: Bulk refund / void jobs for cancelled events
+-- Date: 2026-10-19
+-- Run: psql $DATABASE_URL -f migrations/004_bulk_refund_jobs.sql
+-- Idempotent: safe to run multiple times.
+
+BEGIN;
+
+-- 1. CREATE saga.refund_job — one row per "refund everyone for this event" request
+CREATE TABLE IF NOT EXISTS saga.refund_job (
+    id            SERIAL PRIMARY KEY,
+    event_id      INTEGER NOT NULL REFERENCES saga.event(id),
+    requested_by  VARCHAR(255) NOT NULL,
+    status        VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending | running | completed | interrupted
+    total         INTEGER NOT NULL DEFAULT 0,
+    succeeded     INTEGER NOT NULL DEFAULT 0,
+    failed        INTEGER NOT NULL DEFAULT 0,
+    last_error    TEXT NULL,
+    created_at    TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at    TIMESTAMP NOT NULL DEFAULT NOW(),
+    finished_at   TIMESTAMP NULL
+);
+
+-- At most one unfinished job per event; a second request resumes it
+CREATE UNIQUE INDEX IF NOT EXISTS uq_refund_job_open_event
+    ON saga.refund_job(event_id) WHERE status <> 'completed';
+
+-- 2. CREATE saga.refund_job_item — per-registration progress, so a crashed job resumes
+CREATE TABLE IF NOT EXISTS saga.refund_job_item (
+    id               SERIAL PRIMARY KEY,
+    job_id           INTEGER NOT NULL REFERENCES saga.refund_job(id) ON DELETE CASCADE,
+    registration_id  INTEGER NOT NULL REFERENCES saga.event_registration(id),
+    action           VARCHAR(10) NULL,                      -- void | refund
+    status           VARCHAR(20) NOT NULL DEFAULT 'pending', -- pending | voided | refunded | failed
+    error            TEXT NULL,
+    processed_at     TIMESTAMP NULL,
+    CONSTRAINT uq_refund_job_item UNIQUE (job_id, registration_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_refund_job_item_pending
+    ON saga.refund_job_item(job_id) WHERE status = 'pending';
+
+COMMIT;
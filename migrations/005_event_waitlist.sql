@@ -0,0 +1,38 @@
+-- Migration: Event waitlist
+-- Date: 2026-10-19
+-- Run: psql $DATABASE_URL -f migrations/005_event_waitlist.sql
+-- Idempotent: safe to run multiple times.
+
+BEGIN;
+
+-- 1. CREATE saga.event_waitlist — ordered per event by id (first come, first served)
+CREATE TABLE IF NOT EXISTS saga.event_waitlist (
+    id                SERIAL PRIMARY KEY,
+    event_id          INTEGER NOT NULL REFERENCES saga.event(id) ON DELETE CASCADE,
+    user_id           INTEGER NULL REFERENCES saga.user_account(id),
+    email             VARCHAR(255) NOT NULL,
+    first_name        VARCHAR(100) NOT NULL,
+    last_name         VARCHAR(100) NOT NULL,
+    phone             VARCHAR(30) NULL,
+    access_token      VARCHAR(64) NOT NULL UNIQUE,
+    status            VARCHAR(20) NOT NULL DEFAULT 'waiting',  -- waiting | offered | claimed | expired | cancelled
+    offered_at        TIMESTAMP NULL,
+    offer_expires_at  TIMESTAMP NULL,
+    registration_id   INTEGER NULL REFERENCES saga.event_registration(id) ON DELETE SET NULL,
+    created_at        TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at        TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Next-in-line and position lookups are range scans on this index
+CREATE INDEX IF NOT EXISTS idx_event_waitlist_waiting
+    ON saga.event_waitlist(event_id, id) WHERE status = 'waiting';
+
+-- Outstanding offers count against capacity until they expire
+CREATE INDEX IF NOT EXISTS idx_event_waitlist_offered
+    ON saga.event_waitlist(event_id, offer_expires_at) WHERE status = 'offered';
+
+-- One live spot per person per event
+CREATE UNIQUE INDEX IF NOT EXISTS uq_event_waitlist_active_email
+    ON saga.event_waitlist(event_id, lower(email)) WHERE status IN ('waiting', 'offered');
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Migration: Two-phase registration holds
+-- Date: 2026-10-19
+-- Run: psql $DATABASE_URL -f migrations/006_registration_holds.sql
+-- Idempotent: safe to run multiple times.
+
+BEGIN;
+
+-- 1. ALTER saga.event_registration — a pending row with an expiry holds a seat during checkout
+ALTER TABLE saga.event_registration
+    ADD COLUMN IF NOT EXISTS hold_expires_at TIMESTAMP NULL;
+
+-- 2. Capacity checks count paid + live pending rows per event
+CREATE INDEX IF NOT EXISTS idx_event_registration_event_status
+    ON saga.event_registration(event_id, payment_status);
+
+-- 3. The sweeper walks lapsed holds oldest first
+CREATE INDEX IF NOT EXISTS idx_event_registration_hold_expires
+    ON saga.event_registration(hold_expires_at)
+    WHERE payment_status = 'pending' AND hold_expires_at IS NOT NULL;
+
+COMMIT;
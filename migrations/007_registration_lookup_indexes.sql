@@ -0,0 +1,27 @@
+-- Migration: Indexes for registration hot paths
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+-- Transaction: none — CREATE INDEX CONCURRENTLY cannot run inside BEGIN/COMMIT,
+-- so the tables stay writable while the indexes build. A failed concurrent
+-- build leaves an INVALID index behind, hence DROP … IF EXISTS before each CREATE.
+
+-- 1. Duplicate-guest check and register_for_event: WHERE event_id = ? AND email = ?
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_registration_event_email;
+CREATE INDEX CONCURRENTLY idx_event_registration_event_email
+    ON saga.event_registration(event_id, email);
+
+-- 2. Duplicate-member check: WHERE event_id = ? AND user_id = ? (guests have no user_id)
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_registration_event_user;
+CREATE INDEX CONCURRENTLY idx_event_registration_event_user
+    ON saga.event_registration(event_id, user_id) WHERE user_id IS NOT NULL;
+
+-- 3. Per-event counts and listings: WHERE event_id = ?
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_registration_event_id;
+CREATE INDEX CONCURRENTLY idx_event_registration_event_id
+    ON saga.event_registration(event_id);
+
+-- 4. Guest lookup by email when reusing a guest record
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_guest_email;
+CREATE INDEX CONCURRENTLY idx_guest_email
+    ON saga.guest(email);
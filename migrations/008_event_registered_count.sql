@@ -0,0 +1,61 @@
+-- Migration: Denormalized registered_count on saga.event
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- registered_count = registrations that occupy a seat (payment_status 'paid' or
+-- 'pending'). Kept in step by a row trigger, so every writer — ORM, raw SQL in
+-- the refund job and hold sweeper, manual fixes in psql — updates it in the same
+-- transaction as the registration row. Drift can be repaired with
+-- `python -m services.event_service`.
+
+BEGIN;
+
+-- 1. ALTER saga.event
+ALTER TABLE saga.event
+    ADD COLUMN IF NOT EXISTS registered_count INTEGER NOT NULL DEFAULT 0;
+
+-- 2. Trigger function: -1 for the old row if it held a seat, +1 for the new one
+CREATE OR REPLACE FUNCTION saga.sync_event_registered_count() RETURNS trigger AS $$
+DECLARE
+    old_counts BOOLEAN := TG_OP <> 'INSERT' AND OLD.payment_status IN ('paid', 'pending');
+    new_counts BOOLEAN := TG_OP <> 'DELETE' AND NEW.payment_status IN ('paid', 'pending');
+BEGIN
+    IF TG_OP = 'UPDATE' AND old_counts = new_counts AND OLD.event_id = NEW.event_id THEN
+        RETURN NULL;
+    END IF;
+    IF old_counts THEN
+        UPDATE saga.event SET registered_count = registered_count - 1 WHERE id = OLD.event_id;
+    END IF;
+    IF new_counts THEN
+        UPDATE saga.event SET registered_count = registered_count + 1 WHERE id = NEW.event_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_event_registration_count_ins_del ON saga.event_registration;
+CREATE TRIGGER trg_event_registration_count_ins_del
+    AFTER INSERT OR DELETE ON saga.event_registration
+    FOR EACH ROW EXECUTE FUNCTION saga.sync_event_registered_count();
+
+DROP TRIGGER IF EXISTS trg_event_registration_count_upd ON saga.event_registration;
+CREATE TRIGGER trg_event_registration_count_upd
+    AFTER UPDATE OF payment_status, event_id ON saga.event_registration
+    FOR EACH ROW
+    WHEN (OLD.payment_status IS DISTINCT FROM NEW.payment_status OR OLD.event_id IS DISTINCT FROM NEW.event_id)
+    EXECUTE FUNCTION saga.sync_event_registered_count();
+
+-- 3. Backfill
+UPDATE saga.event e
+SET registered_count = COALESCE(c.n, 0)
+FROM saga.event e2
+LEFT JOIN (
+    SELECT event_id, count(*) AS n
+    FROM saga.event_registration
+    WHERE payment_status IN ('paid', 'pending')
+    GROUP BY event_id
+) c ON c.event_id = e2.id
+WHERE e.id = e2.id;
+
+COMMIT;
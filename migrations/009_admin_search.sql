@@ -0,0 +1,77 @@
+-- Migration: Full-text and fuzzy search for the admin search API
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+-- Transaction: none — indexes are built CONCURRENTLY (see 007).
+--
+-- Every searchable table gets two generated columns:
+--   search_text   — lower-cased display text, GIN trigram index (typos, substrings)
+--   search_vector — 'simple' tsvector of the same text, GIN index (prefix word matches)
+-- 'simple' rather than 'english' because these are names, emails and places,
+-- which must not be stemmed. Expressions use || rather than concat_ws(), which
+-- is only STABLE and so not allowed in a generated column.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 1. Members: first + last name
+ALTER TABLE saga."user"
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+        GENERATED ALWAYS AS (lower(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))) STORED,
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, ''))) STORED;
+
+-- 2. Member login email
+ALTER TABLE saga.user_account
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+        GENERATED ALWAYS AS (lower(email)) STORED,
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+        GENERATED ALWAYS AS (to_tsvector('simple', email)) STORED;
+
+-- 3. Guests: name + email
+ALTER TABLE saga.guest
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+        GENERATED ALWAYS AS (lower(first_name || ' ' || last_name || ' ' || email)) STORED,
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+        GENERATED ALWAYS AS (to_tsvector('simple', first_name || ' ' || last_name || ' ' || email)) STORED;
+
+-- 4. Events: course + township
+ALTER TABLE saga.event
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+        GENERATED ALWAYS AS (lower(golf_course || ' ' || township)) STORED,
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+        GENERATED ALWAYS AS (to_tsvector('simple', golf_course || ' ' || township)) STORED;
+
+-- 5. Sponsor registrations: company name
+ALTER TABLE saga.event_registration
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+        GENERATED ALWAYS AS (lower(company_name)) STORED,
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(company_name, ''))) STORED;
+
+-- 6. Indexes
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_user_search_vector;
+CREATE INDEX CONCURRENTLY idx_user_search_vector ON saga."user" USING gin (search_vector);
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_user_search_trgm;
+CREATE INDEX CONCURRENTLY idx_user_search_trgm ON saga."user" USING gin (search_text gin_trgm_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_user_account_search_vector;
+CREATE INDEX CONCURRENTLY idx_user_account_search_vector ON saga.user_account USING gin (search_vector);
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_user_account_search_trgm;
+CREATE INDEX CONCURRENTLY idx_user_account_search_trgm ON saga.user_account USING gin (search_text gin_trgm_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_guest_search_vector;
+CREATE INDEX CONCURRENTLY idx_guest_search_vector ON saga.guest USING gin (search_vector);
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_guest_search_trgm;
+CREATE INDEX CONCURRENTLY idx_guest_search_trgm ON saga.guest USING gin (search_text gin_trgm_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_search_vector;
+CREATE INDEX CONCURRENTLY idx_event_search_vector ON saga.event USING gin (search_vector);
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_search_trgm;
+CREATE INDEX CONCURRENTLY idx_event_search_trgm ON saga.event USING gin (search_text gin_trgm_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_registration_search_vector;
+CREATE INDEX CONCURRENTLY idx_event_registration_search_vector
+    ON saga.event_registration USING gin (search_vector) WHERE company_name IS NOT NULL;
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_registration_search_trgm;
+CREATE INDEX CONCURRENTLY idx_event_registration_search_trgm
+    ON saga.event_registration USING gin (search_text gin_trgm_ops) WHERE company_name IS NOT NULL;
@@ -0,0 +1,159 @@
+-- Migration: Registration rollups for the admin statistics dashboard
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- saga.event_stats                 one row per event: paid registrations, member /
+--                                  guest / sponsor mix, revenue, refunds
+-- saga.event_registration_daily    paid registrations and revenue per event per
+--                                  signup day (the run-up to each event)
+--
+-- Both are kept in step by a row trigger on saga.event_registration, the same
+-- way as registered_count (008): every writer adjusts them in its own
+-- transaction, so /api/admin/stats never scans event_registration or payment.
+-- Season totals are summed from event_stats (a few dozen rows per season)
+-- rather than kept in a single season row, which every checkout in the season
+-- would have to lock.
+--
+-- A row contributes while it is 'paid'; once it is 'refunded' or 'voided' its
+-- amount moves to the refund columns and it drops out of the daily series.
+-- Drift can be repaired with `python -m services.stats_service`.
+
+BEGIN;
+
+-- 1. Rollup tables
+CREATE TABLE IF NOT EXISTS saga.event_stats (
+    event_id         INTEGER PRIMARY KEY REFERENCES saga.event(id) ON DELETE CASCADE,
+    registrations    INTEGER NOT NULL DEFAULT 0,
+    members          INTEGER NOT NULL DEFAULT 0,
+    guests           INTEGER NOT NULL DEFAULT 0,
+    sponsors         INTEGER NOT NULL DEFAULT 0,
+    revenue          NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    sponsor_revenue  NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    refunds          INTEGER NOT NULL DEFAULT 0,
+    refunded_amount  NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    updated_at       TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS saga.event_registration_daily (
+    event_id       INTEGER NOT NULL REFERENCES saga.event(id) ON DELETE CASCADE,
+    day            DATE NOT NULL,
+    registrations  INTEGER NOT NULL DEFAULT 0,
+    revenue        NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (event_id, day)
+);
+
+-- 2. Add (sign = 1) or remove (sign = -1) one registration's contribution
+CREATE OR REPLACE FUNCTION saga.apply_registration_stats(r saga.event_registration, sign INTEGER)
+RETURNS void AS $$
+DECLARE
+    paid     BOOLEAN := r.payment_status = 'paid';
+    refunded BOOLEAN := r.payment_status IN ('refunded', 'voided');
+    amount   NUMERIC := sign * COALESCE(r.amount_paid, 0);
+BEGIN
+    IF NOT paid AND NOT refunded THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO saga.event_stats AS s (
+        event_id, registrations, members, guests, sponsors,
+        revenue, sponsor_revenue, refunds, refunded_amount
+    )
+    VALUES (
+        r.event_id,
+        CASE WHEN paid THEN sign ELSE 0 END,
+        CASE WHEN paid AND r.user_id IS NOT NULL THEN sign ELSE 0 END,
+        CASE WHEN paid AND r.user_id IS NULL THEN sign ELSE 0 END,
+        CASE WHEN paid AND r.is_sponsor THEN sign ELSE 0 END,
+        CASE WHEN paid THEN amount ELSE 0 END,
+        CASE WHEN paid AND r.is_sponsor THEN sign * COALESCE(r.sponsor_amount, 0) ELSE 0 END,
+        CASE WHEN refunded THEN sign ELSE 0 END,
+        CASE WHEN refunded THEN amount ELSE 0 END
+    )
+    ON CONFLICT (event_id) DO UPDATE SET
+        registrations   = s.registrations   + EXCLUDED.registrations,
+        members         = s.members         + EXCLUDED.members,
+        guests          = s.guests          + EXCLUDED.guests,
+        sponsors        = s.sponsors        + EXCLUDED.sponsors,
+        revenue         = s.revenue         + EXCLUDED.revenue,
+        sponsor_revenue = s.sponsor_revenue + EXCLUDED.sponsor_revenue,
+        refunds         = s.refunds         + EXCLUDED.refunds,
+        refunded_amount = s.refunded_amount + EXCLUDED.refunded_amount,
+        updated_at      = NOW();
+
+    IF paid THEN
+        INSERT INTO saga.event_registration_daily AS d (event_id, day, registrations, revenue)
+        VALUES (r.event_id, r.created_at::date, sign, amount)
+        ON CONFLICT (event_id, day) DO UPDATE SET
+            registrations = d.registrations + EXCLUDED.registrations,
+            revenue       = d.revenue       + EXCLUDED.revenue;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. Trigger: take the old row out, put the new one in
+CREATE OR REPLACE FUNCTION saga.sync_registration_stats() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM saga.apply_registration_stats(OLD, -1);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM saga.apply_registration_stats(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_event_registration_stats_ins_del ON saga.event_registration;
+CREATE TRIGGER trg_event_registration_stats_ins_del
+    AFTER INSERT OR DELETE ON saga.event_registration
+    FOR EACH ROW EXECUTE FUNCTION saga.sync_registration_stats();
+
+DROP TRIGGER IF EXISTS trg_event_registration_stats_upd ON saga.event_registration;
+CREATE TRIGGER trg_event_registration_stats_upd
+    AFTER UPDATE OF payment_status, event_id, user_id, is_sponsor, amount_paid, sponsor_amount, created_at
+    ON saga.event_registration
+    FOR EACH ROW
+    WHEN ((OLD.payment_status, OLD.event_id, OLD.user_id, OLD.is_sponsor, OLD.amount_paid, OLD.sponsor_amount, OLD.created_at)
+          IS DISTINCT FROM
+          (NEW.payment_status, NEW.event_id, NEW.user_id, NEW.is_sponsor, NEW.amount_paid, NEW.sponsor_amount, NEW.created_at))
+    EXECUTE FUNCTION saga.sync_registration_stats();
+
+-- 4. Full rebuild (backfill and drift repair). The table lock waits for
+--    in-flight registrations and holds off new ones until the rebuild commits.
+CREATE OR REPLACE FUNCTION saga.rebuild_registration_stats() RETURNS void AS $$
+BEGIN
+    LOCK TABLE saga.event_stats, saga.event_registration_daily IN EXCLUSIVE MODE;
+    DELETE FROM saga.event_registration_daily;
+    DELETE FROM saga.event_stats;
+
+    INSERT INTO saga.event_stats (
+        event_id, registrations, members, guests, sponsors,
+        revenue, sponsor_revenue, refunds, refunded_amount
+    )
+    SELECT
+        event_id,
+        count(*) FILTER (WHERE payment_status = 'paid'),
+        count(*) FILTER (WHERE payment_status = 'paid' AND user_id IS NOT NULL),
+        count(*) FILTER (WHERE payment_status = 'paid' AND user_id IS NULL),
+        count(*) FILTER (WHERE payment_status = 'paid' AND is_sponsor),
+        COALESCE(sum(amount_paid) FILTER (WHERE payment_status = 'paid'), 0),
+        COALESCE(sum(sponsor_amount) FILTER (WHERE payment_status = 'paid' AND is_sponsor), 0),
+        count(*) FILTER (WHERE payment_status IN ('refunded', 'voided')),
+        COALESCE(sum(amount_paid) FILTER (WHERE payment_status IN ('refunded', 'voided')), 0)
+    FROM saga.event_registration
+    WHERE payment_status IN ('paid', 'refunded', 'voided')
+    GROUP BY event_id;
+
+    INSERT INTO saga.event_registration_daily (event_id, day, registrations, revenue)
+    SELECT event_id, created_at::date, count(*), COALESCE(sum(amount_paid), 0)
+    FROM saga.event_registration
+    WHERE payment_status = 'paid'
+    GROUP BY event_id, created_at::date;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. Backfill
+SELECT saga.rebuild_registration_stats();
+
+COMMIT;
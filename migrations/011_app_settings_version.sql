@@ -0,0 +1,34 @@
+-- Migration: Version stamp for saga.app_settings
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- Each API worker caches all app_settings in memory (services/app_settings_service.py)
+-- and polls this single-row version to find out when its copy is stale. A
+-- statement trigger bumps the version on any write, including manual edits in
+-- psql, so no writer has to remember to do it.
+
+BEGIN;
+
+-- 1. CREATE saga.app_settings_version (exactly one row)
+CREATE TABLE IF NOT EXISTS saga.app_settings_version (
+    id       BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version  BIGINT NOT NULL DEFAULT 1
+);
+
+INSERT INTO saga.app_settings_version (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+-- 2. Bump on every write to app_settings
+CREATE OR REPLACE FUNCTION saga.bump_app_settings_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE saga.app_settings_version SET version = version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_app_settings_version ON saga.app_settings;
+CREATE TRIGGER trg_app_settings_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON saga.app_settings
+    FOR EACH STATEMENT EXECUTE FUNCTION saga.bump_app_settings_version();
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Migration: Season renewal pipeline for member memberships
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+
+BEGIN;
+
+-- 1. ALTER saga.member_memberships — when the renewal reminder went out
+ALTER TABLE saga.member_memberships
+    ADD COLUMN IF NOT EXISTS renewal_notified_at TIMESTAMP NULL;
+
+-- 2. Rolling a season over reads every paid membership of the current season
+CREATE INDEX IF NOT EXISTS idx_member_memberships_season_status
+    ON saga.member_memberships(season_year, status);
+
+-- 3. The mailer walks next season's un-notified pending rows in id order
+CREATE INDEX IF NOT EXISTS idx_member_memberships_renewal_queue
+    ON saga.member_memberships(season_year, id)
+    WHERE status = 'pending' AND renewal_notified_at IS NULL;
+
+COMMIT;
@@ -0,0 +1,49 @@
+-- Migration: Per-table data versions for cached public responses
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- Hot public lists (photo albums, partners, carousel, banners) are served from
+-- pre-serialized JSON bytes held by each worker (core/response_cache.py). A
+-- cached body is reused while saga.data_version for its tables is unchanged; a
+-- statement trigger bumps the version on any write, including manual edits.
+
+BEGIN;
+
+-- 1. CREATE saga.data_version — one row per versioned table
+CREATE TABLE IF NOT EXISTS saga.data_version (
+    name     VARCHAR(63) PRIMARY KEY,
+    version  BIGINT NOT NULL DEFAULT 1
+);
+
+-- 2. Bump the writing table's version
+CREATE OR REPLACE FUNCTION saga.bump_data_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO saga.data_version AS v (name) VALUES (TG_TABLE_NAME)
+    ON CONFLICT (name) DO UPDATE SET version = v.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. Attach to every cached table that exists in this database
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['photo_albums', 'partners', 'carousel_images', 'banner_messages', 'banner_settings']
+    LOOP
+        IF to_regclass('saga.' || quote_ident(tbl)) IS NOT NULL THEN
+            INSERT INTO saga.data_version (name) VALUES (tbl) ON CONFLICT (name) DO NOTHING;
+            EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_data_version ON saga.%I', tbl, tbl);
+            EXECUTE format(
+                'CREATE TRIGGER trg_%s_data_version '
+                'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON saga.%I '
+                'FOR EACH STATEMENT EXECUTE FUNCTION saga.bump_data_version()',
+                tbl, tbl
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+COMMIT;
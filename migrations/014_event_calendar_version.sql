@@ -0,0 +1,25 @@
+-- Migration: Data version for the events calendar feeds
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- The iCalendar feeds (/api/events/calendar.ics and the per-user feeds) are
+-- rendered once and cached under saga.data_version('event')
+-- (see 013_data_versions.sql). The trigger only fires for columns that appear
+-- in the feed: registered_count, rewritten by 008's trigger on every
+-- registration, does not invalidate it.
+
+BEGIN;
+
+-- 1. Seed the version row
+INSERT INTO saga.data_version (name) VALUES ('event') ON CONFLICT (name) DO NOTHING;
+
+-- 2. Bump it on inserts, deletes and edits to calendar-visible columns
+DROP TRIGGER IF EXISTS trg_event_data_version ON saga.event;
+CREATE TRIGGER trg_event_data_version
+    AFTER INSERT OR DELETE OR TRUNCATE
+       OR UPDATE OF township, state, zipcode, golf_course, date, start_time
+    ON saga.event
+    FOR EACH STATEMENT EXECUTE FUNCTION saga.bump_data_version();
+
+COMMIT;
@@ -0,0 +1,32 @@
+-- Migration: Admin broadcast emails
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- One row per broadcast. Recipients are not copied here: the mailer streams
+-- them from the live audience query in email order and checkpoints the last
+-- address it finished in `cursor_email`, so an interrupted send resumes after
+-- it (see services/broadcast_service.py).
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS saga.broadcast (
+    id            SERIAL PRIMARY KEY,
+    audience      VARCHAR(20) NOT NULL,                    -- members | event_guests | unrenewed
+    event_id      INTEGER NULL REFERENCES saga.event(id),  -- event_guests
+    season_year   INTEGER NULL,                            -- unrenewed
+    subject       VARCHAR(200) NOT NULL,
+    message       TEXT NOT NULL,
+    requested_by  VARCHAR(255) NOT NULL,
+    status        VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending | running | completed | interrupted
+    total         INTEGER NOT NULL DEFAULT 0,
+    sent          INTEGER NOT NULL DEFAULT 0,
+    failed        INTEGER NOT NULL DEFAULT 0,
+    cursor_email  VARCHAR(255) NULL,
+    last_error    TEXT NULL,
+    created_at    TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at    TIMESTAMP NOT NULL DEFAULT NOW(),
+    finished_at   TIMESTAMP NULL
+);
+
+COMMIT;
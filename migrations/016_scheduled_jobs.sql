@@ -0,0 +1,25 @@
+-- Migration: Shared state for the in-process job scheduler
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- Every worker runs the same schedule (core/scheduler.py). A job runs under
+-- pg_try_advisory_lock(1004, hashtext(name)); holding it, a worker reads
+-- next_run_at here, and if another worker already ran that slot it only
+-- adopts the new due time. Rows are created on a job's first run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS saga.scheduled_job (
+    name              VARCHAR(100) PRIMARY KEY,
+    next_run_at       TIMESTAMP NOT NULL,
+    last_started_at   TIMESTAMP NULL,
+    last_finished_at  TIMESTAMP NULL,
+    last_duration_ms  INTEGER NULL,
+    last_status       VARCHAR(20) NULL,  -- ok | failed | skipped
+    last_error        TEXT NULL,
+    runs              INTEGER NOT NULL DEFAULT 0,
+    failures          INTEGER NOT NULL DEFAULT 0
+);
+
+COMMIT;
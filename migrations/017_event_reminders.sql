@@ -0,0 +1,25 @@
+-- Migration: Reminder emails before events
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- services/event_reminder_service.py finds due registrations with one query
+-- per reminder window: a range scan of events by start time, then each
+-- event's paid registrations, skipping those already marked here.
+
+BEGIN;
+
+-- 1. CREATE saga.event_reminder_sent — one row per reminder that went out
+CREATE TABLE IF NOT EXISTS saga.event_reminder_sent (
+    registration_id  INTEGER NOT NULL REFERENCES saga.event_registration(id) ON DELETE CASCADE,
+    reminder         VARCHAR(10) NOT NULL,  -- 7d | 1d | …
+    sent_at          TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (registration_id, reminder)
+);
+
+-- 2. Events starting in a window: WHERE date + start_time > ? AND date + start_time <= ?
+--    (saga.event is small, so this builds inside the transaction)
+CREATE INDEX IF NOT EXISTS idx_event_starts_at
+    ON saga.event ((date + start_time));
+
+COMMIT;
@@ -0,0 +1,28 @@
+-- Migration: When a registration's card was charged
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- created_at is when the registration row was first written. A seat held on
+-- one day can be charged on another (retry-payment after a decline, a
+-- failed hold re-held later, a waitlist claim), so the refund job's void vs
+-- refund choice needs the time of the charge itself, and reconciliation
+-- compares each day's gateway transactions with the charges made that day.
+-- confirm_hold() sets it.
+
+BEGIN;
+
+-- 1. ADD saga.event_registration.paid_at
+ALTER TABLE saga.event_registration
+    ADD COLUMN IF NOT EXISTS paid_at TIMESTAMP NULL;
+
+-- 2. Charges made before this column existed: created_at is the best record left
+UPDATE saga.event_registration
+SET paid_at = created_at
+WHERE paid_at IS NULL AND transaction_id IS NOT NULL;
+
+-- 3. Reconciliation's day range: WHERE paid_at >= ? AND paid_at < ?
+CREATE INDEX IF NOT EXISTS idx_event_registration_paid_at
+    ON saga.event_registration(paid_at) WHERE paid_at IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- Migration: Price edits invalidate the events calendar feeds
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- The feeds render member_price and guest_price into each event's
+-- DESCRIPTION, but 014's trigger didn't list them, so a price edit kept the
+-- old feed (and its ETag) cached. Recreate it with the price columns.
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_event_data_version ON saga.event;
+CREATE TRIGGER trg_event_data_version
+    AFTER INSERT OR DELETE OR TRUNCATE
+       OR UPDATE OF township, state, zipcode, golf_course, date, start_time, member_price, guest_price
+    ON saga.event
+    FOR EACH STATEMENT EXECUTE FUNCTION saga.bump_data_version();
+
+COMMIT;
@@ -0,0 +1,27 @@
+-- Migration: app_settings on the shared data_version table
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+--
+-- 011 gave app_settings a single-row version table and trigger of its own.
+-- 013 then added saga.data_version and bump_data_version() for every cached
+-- table, so app_settings moves onto it and the 011 objects are dropped.
+-- Workers compare versions for equality only, so starting the row over at 1
+-- just makes each of them reload its snapshot once.
+
+BEGIN;
+
+-- 1. Seed the version row and bump it on every write
+INSERT INTO saga.data_version (name) VALUES ('app_settings') ON CONFLICT (name) DO NOTHING;
+
+DROP TRIGGER IF EXISTS trg_app_settings_data_version ON saga.app_settings;
+CREATE TRIGGER trg_app_settings_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON saga.app_settings
+    FOR EACH STATEMENT EXECUTE FUNCTION saga.bump_data_version();
+
+-- 2. DROP 011's version table and trigger
+DROP TRIGGER IF EXISTS trg_app_settings_version ON saga.app_settings;
+DROP FUNCTION IF EXISTS saga.bump_app_settings_version();
+DROP TABLE IF EXISTS saga.app_settings_version;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Migration: Drop the redundant single-column event_id index from 007
+-- Date: 2026-10-19
+-- Run: python -m core.migrations   (from src/)
+-- Idempotent: safe to run multiple times.
+-- Transaction: none — DROP INDEX CONCURRENTLY cannot run inside BEGIN/COMMIT,
+-- and a plain DROP INDEX would lock registrations out while it waits.
+--
+-- idx_event_registration_event_id repeats the model's ix_event_registration_event_id
+-- (event_id, index=True) and the leading column of 006's
+-- idx_event_registration_event_status (event_id, payment_status). Per-event
+-- counts and listings are served by those; this one only added a write to
+-- every registration insert.
+
+-- 1. DROP the duplicate
+DROP INDEX CONCURRENTLY IF EXISTS saga.idx_event_registration_event_id;
@@ -0,0 +1,188 @@
+"""
+Content-negotiated response compression.
+
+CompressionMiddleware compresses text and JSON responses with Brotli (when
+the `brotli` package is installed) or gzip, picking whichever the client's
+Accept-Encoding ranks highest. Bodies under COMPRESSION_MINIMUM_SIZE go out
+as-is, streaming responses are compressed chunk by chunk (each chunk is
+flushed so clients see data as it is produced), and responses that already
+carry a Content-Encoding are left alone.
+
+Dynamic responses use fast settings. Cached bodies (core.response_cache)
+are compressed once per data version at maximum settings via `compress()`
+and sent with their Content-Encoding already set.
+"""
+from __future__ import annotations
+
+import os
+import zlib
+from typing import Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+COMPRESSION_MINIMUM_SIZE    = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL      = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY  = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+PRECOMPRESS_GZIP_LEVEL      = int(os.getenv("PRECOMPRESS_GZIP_LEVEL", "9"))
+PRECOMPRESS_BROTLI_QUALITY  = int(os.getenv("PRECOMPRESS_BROTLI_QUALITY", "11"))
+
+# Chunks this large are compressed in a worker thread, not on the event loop
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+# Server preference when the client ranks several equally
+AVAILABLE_ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def negotiate(accept_encoding: str, available: tuple[str, ...] = AVAILABLE_ENCODINGS) -> Optional[str]:
+    """Pick the encoding the client ranks highest (by q-value) among `available`."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+    )
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """One-shot compression at maximum settings, for bodies compressed once and reused."""
+    if encoding == "br":
+        return brotli.compress(body, quality=PRECOMPRESS_BROTLI_QUALITY)
+    compressor = zlib.compressobj(PRECOMPRESS_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def __call__(self, chunk: bytes, final: bool) -> bytes:
+        if self._brotli is not None:
+            data = self._brotli.process(chunk)
+            return data + (self._brotli.finish() if final else self._brotli.flush())
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        await _Responder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _Responder:
+    def __init__(self, app: ASGIApp, encoding: Optional[str], minimum_size: int) -> None:
+        self.app          = app
+        self.encoding     = encoding
+        self.minimum_size = minimum_size
+        self.start:       Message = {}
+        self.passthrough  = False
+        self.started      = False
+        self.compressor:  Optional[_StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self._send)
+
+    async def _send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if self.passthrough or message_type != "http.response.body":
+            if not self.passthrough and not self.started:
+                self.started = True
+                await self.send(self.start)  # e.g. pathsend: nothing for us to compress
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.start["headers"])
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            if self.encoding is None or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+
+            self.compressor = _StreamCompressor(self.encoding)
+            message["body"] = await self._compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        message["body"] = await self._compress(body, final=not more_body)
+        await self.send(message)
+
+    async def _compress(self, chunk: bytes, final: bool) -> bytes:
+        if len(chunk) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self.compressor, chunk, final)
+        return self.compressor(chunk, final)
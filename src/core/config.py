@@ -8,7 +8,9 @@ import os
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
 
-load_dotenv()
+# Module-level os.getenv() settings elsewhere (e.g. NORTH_*, RATE_LIMIT_*) read
+# .env through this; an explicit path skips the directory search.
+load_dotenv(ENV_FILE)
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -17,7 +19,6 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    print("Loading env from:", ENV_FILE)
     # Database
     DATABASE_URL: str
 
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from core.config import settings
 from core.database import get_db
 from models.user import User
+from services.app_settings_service import AppSettings, cached_settings
 from services.auth_service import AuthService, decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -65,9 +66,19 @@ async def get_current_user_optional(
     except:
         return None
 
+
+def get_app_settings(db: Session = Depends(get_db)) -> AppSettings:
+    """
+    Dependency that returns the cached, typed app_settings snapshot.
+    Runs no query unless the snapshot is due for a version check.
+    """
+    return cached_settings(db)
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 AdminUser = Annotated[User, Depends(get_admin_user)]
 OptionalUser = Annotated[Optional[User], Depends(get_current_user_optional)]
+RuntimeSettings = Annotated[AppSettings, Depends(get_app_settings)]
 
 
 @lru_cache
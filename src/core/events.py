@@ -0,0 +1,141 @@
+"""
+Post-commit domain events, bound to a SQLAlchemy session.
+
+Code that changes something others react to publishes an event on the
+session doing the change:
+
+    publish(db, RegistrationPaid(registration_id))
+    db.commit()
+
+Nothing happens until that session's outermost transaction commits. Then
+the events it collected are handed to a small thread pool, and the request
+returns without waiting for them. A rollback, or a session closed without
+committing, drops them: a receipt is never sent for a payment that was
+rolled back, and a file is never deleted while the row still points to it.
+
+Handlers subscribe per event type (services/event_handlers.py, imported by
+main.py):
+
+    @subscribe(RegistrationPaid)
+    def send_receipt(event: RegistrationPaid) -> None: ...
+
+They run outside the session that published the event, so they load what
+they need with a session of their own, like the *_in_background helpers.
+A handler that raises is logged and doesn't stop the others. Events are
+in-process and best-effort. One lost to a crash between the commit and
+its handler isn't redelivered, so anything that must not be lost belongs
+in a table a scheduled job sweeps (holds, reminders, refunds).
+
+EVENT_HANDLER_WORKERS bounds the threads handlers share. drain() waits for
+queued handlers, at shutdown and in tests.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+EVENT_HANDLER_WORKERS = int(os.getenv("EVENT_HANDLER_WORKERS", "4"))
+
+_PENDING_KEY = "domain_events"
+
+
+# ── Events ──────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class RegistrationPaid:
+    """An event registration went from pending to paid."""
+
+    registration_id: int
+
+
+@dataclass(frozen=True)
+class EventUpdated:
+    """An event was created, edited or deleted."""
+
+    event_id: int
+
+
+@dataclass(frozen=True)
+class UploadDiscarded:
+    """An uploaded file (an /uploads/... URL) is no longer referenced."""
+
+    url: str
+
+
+# ── Publishing ──────────────────────────────────────────────────────────────────
+
+_handlers: dict[type, list[Callable[[object], None]]] = defaultdict(list)
+
+
+def subscribe(event_type: type) -> Callable:
+    """Decorator: call the function with every `event_type` event, after commit."""
+    def register(handler: Callable) -> Callable:
+        _handlers[event_type].append(handler)
+        return handler
+    return register
+
+
+def publish(db: Session, event: object) -> None:
+    """Queue `event` until `db` commits. Publish alongside the changes it describes."""
+    db.info.setdefault(_PENDING_KEY, []).append(event)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    # Releasing a savepoint commits nothing yet; wait for the outermost transaction
+    if session.in_nested_transaction():
+        return
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        _dispatch(events)
+
+
+@sa_event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # Anything still queued when the outermost transaction ends was rolled back
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+# ── Dispatch ────────────────────────────────────────────────────────────────────
+
+_executor: Optional[ThreadPoolExecutor] = None
+_futures: set[Future] = set()
+_lock = threading.Lock()
+
+
+def _dispatch(events: list) -> None:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(EVENT_HANDLER_WORKERS, thread_name_prefix="domain-events")
+        # One task per commit, so a commit's events are handled in the order they were published
+        future = _executor.submit(_handle, events)
+        _futures.add(future)
+    future.add_done_callback(_futures.discard)
+
+
+def _handle(events: list) -> None:
+    for event in events:
+        for handler in _handlers.get(type(event), ()):
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Handler %s failed for %s", handler.__qualname__, event)
+
+
+def drain(timeout: Optional[float] = None) -> bool:
+    """Wait for every queued handler. Returns False if some were still running at `timeout`."""
+    with _lock:
+        futures = set(_futures)
+    return not wait(futures, timeout=timeout).not_done
@@ -0,0 +1,250 @@
+"""
+Versioned SQL migration runner.
+
+Applies migrations/NNN_name.sql files in version order and records each one
+in saga.schema_migrations, so every environment knows exactly what it has.
+
+Statements run one at a time on an autocommit connection. Files that need a
+transaction wrap themselves in BEGIN/COMMIT (as all of ours do); files that
+build indexes CONCURRENTLY simply leave it out, since Postgres refuses
+CONCURRENTLY inside a transaction block.
+
+    python -m core.migrations            # apply everything pending
+    python -m core.migrations status     # list applied / pending versions
+    python -m core.migrations baseline 6 # record 001–006 as applied without running them
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+# Advisory lock key: two deploys starting at once must not race on the same file
+MIGRATION_LOCK_KEY = 1003
+
+_FILENAME = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version:  int
+    name:     str
+    path:     Path
+    checksum: str
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+
+def discover(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations = []
+    for path in directory.glob("*.sql"):
+        match = _FILENAME.match(path.name)
+        if not match:
+            continue
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            path=path,
+            checksum=hashlib.sha256(path.read_bytes()).hexdigest(),
+        ))
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def split_statements(sql: str) -> list[str]:
+    """
+    Split a script on top-level semicolons, ignoring those inside quotes,
+    dollar-quoted bodies and comments. Comment-only chunks are dropped.
+    """
+    statements: list[str] = []
+    current:    list[str] = []
+    i, n = 0, len(sql)
+    has_code = False
+
+    while i < n:
+        ch = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            end = n if end == -1 else end
+            current.append(sql[i:end])
+            i = end
+            continue
+        if sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            current.append(sql[i:end])
+            i = end
+            continue
+        if ch in ("'", '"'):
+            end = i + 1
+            while end < n:
+                if sql[end] == ch:
+                    if end + 1 < n and sql[end + 1] == ch:   # escaped '' or ""
+                        end += 2
+                        continue
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            has_code = True
+            i = end + 1
+            continue
+        if ch == "$":
+            tag = re.match(r"\$[A-Za-z_]*\$", sql[i:])
+            if tag:
+                end = sql.find(tag.group(0), i + len(tag.group(0)))
+                end = n if end == -1 else end + len(tag.group(0))
+                current.append(sql[i:end])
+                has_code = True
+                i = end
+                continue
+        if ch == ";":
+            if has_code:
+                statements.append("".join(current).strip())
+            current, has_code = [], False
+            i += 1
+            continue
+        if not ch.isspace():
+            has_code = True
+        current.append(ch)
+        i += 1
+
+    if has_code:
+        statements.append("".join(current).strip())
+    return statements
+
+
+class MigrationRunner:
+    def __init__(self, engine: Engine, directory: Path = MIGRATIONS_DIR):
+        self.engine    = engine
+        self.directory = directory
+
+    def _connect(self) -> Connection:
+        return self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+    @staticmethod
+    def _ensure_table(conn: Connection) -> None:
+        conn.exec_driver_sql("CREATE SCHEMA IF NOT EXISTS saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE IF NOT EXISTS saga.schema_migrations (
+                version     INTEGER PRIMARY KEY,
+                name        VARCHAR(255) NOT NULL,
+                checksum    CHAR(64) NOT NULL,
+                applied_at  TIMESTAMP NOT NULL DEFAULT NOW()
+            )
+        """)
+
+    @staticmethod
+    def _applied(conn: Connection) -> dict[int, str]:
+        rows = conn.execute(text("SELECT version, checksum FROM saga.schema_migrations")).all()
+        return {version: checksum for version, checksum in rows}
+
+    @staticmethod
+    def _record(conn: Connection, migration: Migration) -> None:
+        conn.execute(
+            text("""
+                INSERT INTO saga.schema_migrations (version, name, checksum)
+                VALUES (:version, :name, :checksum)
+            """),
+            {"version": migration.version, "name": migration.name, "checksum": migration.checksum},
+        )
+
+    def status(self) -> list[tuple[Migration, bool]]:
+        with self._connect() as conn:
+            self._ensure_table(conn)
+            applied = self._applied(conn)
+        return [(m, m.version in applied) for m in discover(self.directory)]
+
+    def pending(self) -> list[Migration]:
+        return [m for m, applied in self.status() if not applied]
+
+    def migrate(self, target: int | None = None) -> list[Migration]:
+        """Apply pending migrations up to `target` (inclusive). Returns what ran."""
+        ran = []
+        with self._connect() as conn:
+            self._ensure_table(conn)
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            try:
+                applied = self._applied(conn)
+                for migration in discover(self.directory):
+                    if target is not None and migration.version > target:
+                        break
+                    if migration.version in applied:
+                        if applied[migration.version] != migration.checksum:
+                            logger.warning(
+                                "Migration %03d_%s changed after it was applied",
+                                migration.version, migration.name,
+                            )
+                        continue
+
+                    logger.info("Applying migration %03d_%s", migration.version, migration.name)
+                    try:
+                        for statement in split_statements(migration.sql):
+                            # No parameters, so psycopg2 leaves a literal % (format(), LIKE) alone
+                            conn.exec_driver_sql(statement, execution_options={"no_parameters": True})
+                    except Exception:
+                        # Don't leave a half-open BEGIN from the file on this connection
+                        conn.exec_driver_sql("ROLLBACK")
+                        raise
+                    self._record(conn, migration)
+                    ran.append(migration)
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        return ran
+
+    def baseline(self, version: int) -> list[Migration]:
+        """Record migrations up to `version` as applied without running them."""
+        recorded = []
+        with self._connect() as conn:
+            self._ensure_table(conn)
+            applied = self._applied(conn)
+            for migration in discover(self.directory):
+                if migration.version > version:
+                    break
+                if migration.version not in applied:
+                    self._record(conn, migration)
+                    recorded.append(migration)
+        return recorded
+
+
+def main(argv: list[str] | None = None) -> None:
+    from core.database import engine
+
+    parser = argparse.ArgumentParser(description="Apply versioned SQL migrations.")
+    parser.add_argument("command", nargs="?", default="up", choices=["up", "status", "baseline"])
+    parser.add_argument("version", nargs="?", type=int, help="target version (up) or last version to record (baseline)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    runner = MigrationRunner(engine)
+
+    if args.command == "status":
+        for migration, applied in runner.status():
+            print(f"{'applied' if applied else 'pending'}  {migration.version:03d}_{migration.name}")
+    elif args.command == "baseline":
+        if args.version is None:
+            parser.error("baseline needs a version")
+        for migration in runner.baseline(args.version):
+            print(f"recorded {migration.version:03d}_{migration.name}")
+    else:
+        ran = runner.migrate(args.version)
+        print(f"Applied {len(ran)} migration(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Token-bucket rate limiting for unauthenticated, expensive endpoints
+(login, signup, forgot-password, contact form, guest registration).
+
+Every limited route has up to two buckets per request: one keyed by client IP
+and one keyed by the identity the request is about (the email in the body),
+so a flood from one address and a spread-out attack on one account are both
+caught. A bucket holds `count` tokens, refills at `count` per `period` and
+each request takes one; an empty bucket answers 429 with Retry-After set to
+the seconds until the next token.
+
+Limits come from ROUTE_LIMITS and can be overridden per route through the
+environment, e.g. RATE_LIMIT_LOGIN_PER_IP=30/minute or
+RATE_LIMIT_CONTACT_PER_IDENTITY=off.
+
+Buckets live in process memory by default, which is exact for one worker.
+With several workers set RATE_LIMIT_BACKEND=redis and RATE_LIMIT_REDIS_URL
+so they share buckets; each hit is one atomic Lua script round trip.
+`benchmarks.redis_server.disposable_redis()` starts a local Redis for tests.
+If the store can't be reached (Redis down or timing out) the limiter logs it
+and counts in per-worker memory until it answers again, rather than failing
+the requests it guards.
+
+The client IP is request.client.host. Behind a proxy, run uvicorn with
+--proxy-headers and --forwarded-allow-ips so it reflects X-Forwarded-For.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Protocol
+
+import anyio.to_thread
+from fastapi import Depends, HTTPException, Request, status
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ENABLED   = os.getenv("RATE_LIMIT_ENABLED", "true").lower() not in ("0", "false", "no")
+RATE_LIMIT_BACKEND   = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@dataclass(frozen=True)
+class Rate:
+    count:  int
+    period: float  # seconds
+
+    @property
+    def per_second(self) -> float:
+        return self.count / self.period
+
+    @classmethod
+    def parse(cls, spec: str) -> Optional[Rate]:
+        """'5/minute' → Rate(5, 60). 'off' (or '0') → None."""
+        spec = spec.strip().lower()
+        if spec in ("off", "none", "0", ""):
+            return None
+        count, _, unit = spec.partition("/")
+        unit = unit.strip().rstrip("s")
+        if unit not in _PERIODS:
+            raise ValueError(f"Invalid rate {spec!r}: expected '<count>/<second|minute|hour|day>'")
+        return cls(int(count), _PERIODS[unit])
+
+
+@dataclass(frozen=True)
+class RouteLimit:
+    per_ip:       Optional[Rate]
+    per_identity: Optional[Rate] = None
+
+
+def _route_limit(route: str, per_ip: str, per_identity: str) -> RouteLimit:
+    prefix = f"RATE_LIMIT_{route.upper()}"
+    return RouteLimit(
+        per_ip=Rate.parse(os.getenv(f"{prefix}_PER_IP", per_ip)),
+        per_identity=Rate.parse(os.getenv(f"{prefix}_PER_IDENTITY", per_identity)),
+    )
+
+
+ROUTE_LIMITS: dict[str, RouteLimit] = {
+    "login":              _route_limit("login",              "20/minute", "5/minute"),
+    "signup":             _route_limit("signup",             "5/minute",  "3/hour"),
+    "forgot_password":    _route_limit("forgot_password",    "5/minute",  "3/hour"),
+    "contact":            _route_limit("contact",            "5/minute",  "10/hour"),
+    "guest_registration": _route_limit("guest_registration", "10/minute", "5/minute"),
+}
+
+
+class BucketStore(Protocol):
+    blocking: bool
+
+    def take(self, key: str, rate: Rate) -> float:
+        """Take a token from `key`'s bucket. Returns 0 if granted, else seconds until one is."""
+        ...
+
+
+class MemoryBucketStore:
+    """Buckets in a dict, for a single worker. Full (idle) buckets are pruned as it grows."""
+
+    blocking = False
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, prune_every: int = 10_000):
+        self._clock       = clock
+        self._prune_every = prune_every
+        self._lock        = threading.Lock()
+        self._buckets:    dict[str, tuple[float, float, float]] = {}  # key → (tokens, stamp, full_at)
+        self._hits        = 0
+
+    def take(self, key: str, rate: Rate) -> float:
+        now = self._clock()
+        with self._lock:
+            tokens, stamp, _ = self._buckets.get(key, (rate.count, now, now))
+            tokens = min(rate.count, tokens + (now - stamp) * rate.per_second)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate.per_second
+            full_at = now + (rate.count - tokens) / rate.per_second
+            self._buckets[key] = (tokens, now, full_at)
+
+            self._hits += 1
+            if self._hits >= self._prune_every:
+                self._hits = 0
+                self._buckets = {k: v for k, v in self._buckets.items() if v[2] > now}
+            return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+# Refill, take and store in one step so concurrent workers can't double-spend.
+# Uses the server clock (TIME) so workers' clocks don't have to agree.
+_TAKE_SCRIPT = """
+local count, period = tonumber(ARGV[1]), tonumber(ARGV[2])
+local rate = count / period
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'stamp')
+local tokens = tonumber(bucket[1]) or count
+local stamp = tonumber(bucket[2]) or now
+tokens = math.min(count, tokens + math.max(0, now - stamp) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'stamp', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((count - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore:
+    """Buckets shared by every worker through Redis (needs the `redis` package)."""
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "saga:ratelimit:"):
+        self._prefix = prefix
+        self._take   = client.register_script(_TAKE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisBucketStore:
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0))
+
+    def take(self, key: str, rate: Rate) -> float:
+        return float(self._take(keys=[self._prefix + key], args=[rate.count, rate.period]))
+
+
+def _default_store() -> BucketStore:
+    if RATE_LIMIT_BACKEND == "redis":
+        return RedisBucketStore.from_url(RATE_LIMIT_REDIS_URL)
+    return MemoryBucketStore()
+
+
+class RateLimiter:
+    def __init__(self, store: BucketStore, limits: dict[str, RouteLimit] = ROUTE_LIMITS):
+        self.store  = store
+        self.limits = limits
+        # Per-worker buckets used while `store` is unreachable
+        self._fallback   = MemoryBucketStore()
+        self._store_down = False
+
+    def _take(self, key: str, rate: Rate) -> float:
+        try:
+            wait = self.store.take(key, rate)
+        except Exception:
+            if not self._store_down:
+                self._store_down = True
+                logger.exception("Rate limit store unavailable; limiting per worker until it recovers")
+            return self._fallback.take(key, rate)
+        if self._store_down:
+            self._store_down = False
+            logger.info("Rate limit store recovered")
+        return wait
+
+    def check(self, route: str, ip: Optional[str], identity: Optional[str] = None) -> float:
+        """
+        Take a token from each of the route's buckets.
+        Returns 0 if the request may proceed, else the Retry-After in seconds.
+        """
+        limit = self.limits[route]
+        wait = 0.0
+        if limit.per_ip and ip:
+            wait = self._take(f"{route}:ip:{ip}", limit.per_ip)
+        if limit.per_identity and identity and not wait:
+            wait = self._take(f"{route}:id:{identity.strip().lower()}", limit.per_identity)
+        return wait
+
+
+_limiter: Optional[RateLimiter] = None
+
+
+def get_limiter() -> RateLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter(_default_store())
+    return _limiter
+
+
+def set_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Swap the process-wide limiter (tests, or a custom store). None resets to the default."""
+    global _limiter
+    _limiter = limiter
+
+
+def rate_limit(route: str, identity_field: Optional[str] = None):
+    """
+    Route dependency enforcing ROUTE_LIMITS[route]. `identity_field` names the
+    JSON body field used for the per-identity bucket (e.g. "email").
+
+        @router.post("/login", dependencies=[rate_limit("login", identity_field="email")])
+
+    Runs before the body is validated, so throttled requests do no other work.
+    """
+    if route not in ROUTE_LIMITS:
+        raise KeyError(f"No rate limit configured for route '{route}'")
+
+    async def dependency(request: Request) -> None:
+        if not RATE_LIMIT_ENABLED:
+            return
+        identity = None
+        if identity_field:
+            try:
+                body = await request.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and isinstance(body.get(identity_field), str):
+                identity = body[identity_field]
+
+        limiter = get_limiter()
+        ip = request.client.host if request.client else None
+        if limiter.store.blocking:
+            wait = await anyio.to_thread.run_sync(limiter.check, route, ip, identity)
+        else:
+            wait = limiter.check(route, ip, identity)
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+
+    return Depends(dependency)
@@ -0,0 +1,149 @@
+"""
+Pre-serialized JSON bodies for hot, rarely-changing public lists.
+
+A cached body is keyed by the saga.data_version of the tables it was built
+from (migrations/013_data_versions.sql). Each request costs one primary-key
+read of those versions; only when one moved are the rows loaded and
+serialized again. Otherwise the stored bytes go straight out, skipping the
+query, validation and JSON encoding.
+
+Bodies are rendered with pydantic-core (TypeAdapter.dump_json / to_json),
+which writes JSON bytes directly instead of building Python dicts for
+json.dumps. `python -m benchmarks.serialization` compares the paths.
+
+Each entry also keeps its compressed variants (br, gzip), built on first
+request for that encoding and dropped with the body, so a hot list is
+compressed once per data version rather than once per request. The
+CompressionMiddleware passes these through untouched.
+
+Entries carry an ETag (a digest of the body), and a request whose
+If-None-Match matches gets an empty 304 — a poller that already has the
+current body costs one version read.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Callable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from core.compression import COMPRESSION_MINIMUM_SIZE, compress, negotiate
+
+
+class CacheEntry:
+    """A serialized body plus the compressed variants built from it so far."""
+
+    __slots__ = ("version", "body", "etag", "_variants")
+
+    def __init__(self, version: tuple, body: bytes):
+        self.version   = version
+        self.body      = body
+        self.etag      = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self._variants: dict[str, bytes] = {}
+
+    def variant(self, encoding: str) -> bytes:
+        data = self._variants.get(encoding)
+        if data is None:
+            # Two threads may both compress on a cold miss; either result is fine
+            data = self._variants[encoding] = compress(self.body, encoding)
+        return data
+
+
+class SerializedCache:
+    """Serialized bodies by key, each stored with the data version it was built from."""
+
+    def __init__(self) -> None:
+        self._lock    = threading.Lock()
+        self._entries: dict[str, CacheEntry] = {}
+
+    def entry(self, key: str, version: tuple, render: Callable[[], bytes]) -> CacheEntry:
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+        entry = CacheEntry(version, render())
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def get(self, key: str, version: tuple, render: Callable[[], bytes]) -> bytes:
+        return self.entry(key, version, render).body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = SerializedCache()
+
+
+def table_versions(db: Session, tables: tuple[str, ...]) -> tuple[Optional[int], ...]:
+    rows = dict(
+        db.execute(
+            text("SELECT name, version FROM saga.data_version WHERE name IN :names")
+            .bindparams(bindparam("names", expanding=True)),
+            {"names": list(tables)},
+        ).all()
+    )
+    return tuple(rows.get(table) for table in tables)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        # Weak or strong, identity or encoded variant ("<digest>-gzip"): same body
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag.partition("-")[0] == etag:
+            return True
+    return False
+
+
+def cached_response(
+    key:           str,
+    version:       tuple,
+    render:        Callable[[], bytes],
+    request:       Optional[Request] = None,
+    media_type:    str = "application/json",
+    cache_control: Optional[str] = None,
+) -> Response:
+    """
+    Serve `render()`'s bytes for `key`, re-rendering only when `version` changed.
+
+    Given the request, answers 304 if If-None-Match already names this body,
+    and otherwise sends the best encoding its Accept-Encoding allows, from the
+    entry's precompressed variants.
+    """
+    entry = response_cache.entry(key, version, render)
+    headers = {"Vary": "Accept-Encoding", "ETag": f'"{entry.etag}"'}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    if request is not None and _etag_matches(request.headers.get("if-none-match", ""), entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = None
+    if request is not None and len(entry.body) >= COMPRESSION_MINIMUM_SIZE:
+        encoding = negotiate(request.headers.get("accept-encoding", ""))
+    if encoding is None:
+        return Response(content=entry.body, media_type=media_type, headers=headers)
+    headers["Content-Encoding"] = encoding
+    headers["ETag"] = f'"{entry.etag}-{encoding}"'
+    return Response(content=entry.variant(encoding), media_type=media_type, headers=headers)
+
+
+def cached_json(
+    db:      Session,
+    key:     str,
+    tables:  tuple[str, ...],
+    render:  Callable[[], bytes],
+    request: Optional[Request] = None,
+) -> Response:
+    """
+    Serve `render()`'s JSON, re-rendering only when a table in `tables` changed.
+    Versions are read before rendering: a write landing in between leaves a
+    newer body under an older version, which the next request replaces.
+    """
+    return cached_response(key, table_versions(db, tables), render, request)
@@ -0,0 +1,277 @@
+"""
+In-process scheduler for recurring jobs, started from the app lifespan.
+
+Every worker runs the same Scheduler, yet each due run of a job happens once
+across the cluster:
+
+  - a run takes pg_try_advisory_lock(SCHEDULER_LOCK_NAMESPACE, hashtext(name))
+    on a connection of its own; a worker that doesn't get it sits this run out;
+  - holding the lock, it reads the job's next_run_at from saga.scheduled_job
+    (migrations/016_scheduled_jobs.sql). If another worker already ran that
+    slot, it just adopts the new due time and goes back to sleep.
+
+The lock is session-level and no transaction stays open while the job runs.
+Jobs with exclusive=False (per-process cache warm-ups) run in every worker
+with neither lock nor row.
+
+Jobs run in a thread (asyncio.to_thread), never on the event loop. Each
+wake-up is delayed by up to `jitter` seconds, so workers don't all reach for
+the lock, and jobs don't all hit the database, at the same instant.
+
+Missed runs (every worker down, a deploy across the due time): with
+misfire="coalesce" a job runs once however late it is, then is due again
+`interval` later; with misfire="skip" a job more than `grace` late skips
+straight to its next slot.
+
+Durations are logged for every run and recorded in saga.scheduled_job
+(last_duration_ms, runs, failures). Each worker also keeps JobStats (runs,
+failures, mean and max seconds) for its own runs.
+GET /api/admin/scheduler shows both.
+
+Set SCHEDULER_ENABLED=false to run no jobs in a process (one-off scripts,
+benchmarks), or list job names in SCHEDULER_DISABLED_JOBS.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import Engine, text
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_ENABLED       = os.getenv("SCHEDULER_ENABLED", "true").lower() not in ("0", "false", "no")
+SCHEDULER_DISABLED_JOBS = {name.strip() for name in os.getenv("SCHEDULER_DISABLED_JOBS", "").split(",") if name.strip()}
+
+# First key of the two-int advisory lock; idempotency uses 1001, migrations 1003
+SCHEDULER_LOCK_NAMESPACE = 1004
+
+MISFIRE_POLICIES = ("coalesce", "skip")
+
+
+@dataclass(frozen=True)
+class Job:
+    name:      str
+    func:      Callable[[], object]
+    interval:  timedelta
+    jitter:    float = 0.0                    # seconds added to each wake-up, at random
+    misfire:   str = "coalesce"               # "coalesce" | "skip"
+    grace:     timedelta = timedelta(minutes=5)
+    exclusive: bool = True                    # False: every worker runs it
+
+    def __post_init__(self):
+        if self.misfire not in MISFIRE_POLICIES:
+            raise ValueError(f"Unknown misfire policy '{self.misfire}' for job '{self.name}'")
+
+
+@dataclass
+class JobStats:
+    """One worker's runs of one job."""
+
+    runs:          int = 0
+    failures:      int = 0
+    skipped:       int = 0
+    total_seconds: float = 0.0
+    max_seconds:   float = 0.0
+    last_seconds:  Optional[float] = None
+    last_error:    Optional[str] = None
+
+    def record(self, seconds: float, error: Optional[str]) -> None:
+        self.runs += 1
+        self.failures += error is not None
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.last_seconds = seconds
+        self.last_error = error
+
+    @property
+    def mean_seconds(self) -> Optional[float]:
+        return self.total_seconds / self.runs if self.runs else None
+
+
+@dataclass
+class _Slot:
+    now:         datetime
+    next_run_at: datetime
+
+
+class Scheduler:
+    def __init__(self, jobs: list[Job], engine: Optional[Engine] = None):
+        if engine is None:
+            from core.database import engine
+        self.engine = engine
+        self.jobs = [job for job in jobs if job.name not in SCHEDULER_DISABLED_JOBS]
+        self.stats: dict[str, JobStats] = {job.name: JobStats() for job in self.jobs}
+        self._tasks: list[asyncio.Task] = []
+
+    # ── Lifecycle ───────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        for job in self.jobs:
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}"))
+        logger.info("Scheduler started: %s", ", ".join(job.name for job in self.jobs))
+
+    async def stop(self) -> None:
+        """Stop scheduling. A run already in its thread finishes in the background."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _loop(self, job: Job) -> None:
+        delay = 0.0
+        while True:
+            await asyncio.sleep(delay + random.uniform(0, job.jitter))
+            try:
+                delay = await asyncio.to_thread(self.run_once, job)
+            except Exception:
+                logger.exception("Scheduler could not run job %s", job.name)
+                delay = job.interval.total_seconds()
+
+    # ── One run ─────────────────────────────────────────────────────────────────
+
+    def run_once(self, job: Job) -> float:
+        """Run `job` if it's due cluster-wide. Returns seconds until it's next due."""
+        if not job.exclusive:
+            self._execute(job)
+            return job.interval.total_seconds()
+
+        with self.engine.connect() as conn:
+            locked = conn.execute(
+                text("SELECT pg_try_advisory_lock(:ns, hashtext(:name))"),
+                {"ns": SCHEDULER_LOCK_NAMESPACE, "name": job.name},
+            ).scalar()
+            conn.commit()
+            if not locked:
+                # Another worker is running it; it will have moved next_run_at by then
+                return job.interval.total_seconds()
+            try:
+                return self._run_locked(conn, job)
+            finally:
+                conn.rollback()
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:ns, hashtext(:name))"),
+                    {"ns": SCHEDULER_LOCK_NAMESPACE, "name": job.name},
+                )
+                conn.commit()
+
+    def _slot(self, conn, job: Job) -> _Slot:
+        conn.execute(
+            text("""
+                INSERT INTO saga.scheduled_job (name, next_run_at) VALUES (:name, now())
+                ON CONFLICT (name) DO NOTHING
+            """),
+            {"name": job.name},
+        )
+        row = conn.execute(
+            # next_run_at is a plain TIMESTAMP: compare it with the same
+            text("SELECT LOCALTIMESTAMP AS now, next_run_at FROM saga.scheduled_job WHERE name = :name"),
+            {"name": job.name},
+        ).one()
+        conn.commit()
+        return _Slot(row.now, row.next_run_at)
+
+    def _run_locked(self, conn, job: Job) -> float:
+        slot = self._slot(conn, job)
+        interval = job.interval.total_seconds()
+        if slot.next_run_at > slot.now:
+            return (slot.next_run_at - slot.now).total_seconds()
+
+        if job.misfire == "skip" and slot.now - slot.next_run_at > job.grace:
+            logger.warning(
+                "Scheduled job %s missed its run at %s; skipping to the next one",
+                job.name, slot.next_run_at,
+            )
+            self.stats[job.name].skipped += 1
+            conn.execute(
+                text("""
+                    UPDATE saga.scheduled_job
+                    SET next_run_at = now() + make_interval(secs => :interval), last_status = 'skipped'
+                    WHERE name = :name
+                """),
+                {"name": job.name, "interval": interval},
+            )
+            conn.commit()
+            return interval
+
+        seconds, error = self._execute(job)
+        # Keep to the slot grid, unless the run was so late or long that the next slot has passed
+        until_next = conn.execute(
+            text("""
+                UPDATE saga.scheduled_job
+                SET next_run_at      = CASE
+                                         WHEN next_run_at + make_interval(secs => :interval) > now()
+                                         THEN next_run_at + make_interval(secs => :interval)
+                                         ELSE now() + make_interval(secs => :interval)
+                                       END,
+                    last_started_at  = :started_at,
+                    last_finished_at = now(),
+                    last_duration_ms = :duration_ms,
+                    last_status      = :status,
+                    last_error       = :error,
+                    runs             = runs + 1,
+                    failures         = failures + :failed
+                WHERE name = :name
+                RETURNING next_run_at - LOCALTIMESTAMP
+            """),
+            {
+                "name": job.name,
+                "interval": interval,
+                "started_at": slot.now,
+                "duration_ms": round(seconds * 1000),
+                "status": "failed" if error else "ok",
+                "error": error,
+                "failed": int(error is not None),
+            },
+        ).scalar()
+        conn.commit()
+        return until_next.total_seconds()
+
+    def _execute(self, job: Job) -> tuple[float, Optional[str]]:
+        started = time.perf_counter()
+        error = None
+        try:
+            job.func()
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception("Scheduled job %s failed", job.name)
+        seconds = time.perf_counter() - started
+        self.stats[job.name].record(seconds, error)
+        logger.info("Scheduled job %s %s in %.3fs", job.name, "failed" if error else "finished", seconds)
+        return seconds, error
+
+    # ── Reporting ───────────────────────────────────────────────────────────────
+
+    def report(self) -> list[dict]:
+        """Every job with its cluster-wide row (if it has run) and this worker's stats."""
+        with self.engine.connect() as conn:
+            rows = {
+                row.name: row._asdict()
+                for row in conn.execute(text("SELECT * FROM saga.scheduled_job")).all()
+            }
+        report = []
+        for job in self.jobs:
+            stats = self.stats[job.name]
+            report.append({
+                **rows.get(job.name, {}),
+                "name": job.name,
+                "interval_seconds": job.interval.total_seconds(),
+                "exclusive": job.exclusive,
+                "misfire": job.misfire,
+                "worker": {
+                    "runs": stats.runs,
+                    "failures": stats.failures,
+                    "skipped": stats.skipped,
+                    "mean_seconds": stats.mean_seconds,
+                    "max_seconds": stats.max_seconds,
+                    "last_seconds": stats.last_seconds,
+                    "last_error": stats.last_error,
+                },
+            })
+        return report
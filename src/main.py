@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
+from core.compression import CompressionMiddleware
 from core.config import settings
+from core.events import drain as drain_event_handlers
+from core.scheduler import SCHEDULER_ENABLED, Scheduler
 from routers import (
     admin_router,
     auth_router,
@@ -21,13 +28,38 @@ from routers import (
     standings_router
 )
 from routers.registrations import router as registrations_router
+from routers.standings import UPLOAD_DIR as LEADERBOARD_UPLOAD_DIR
+from routers.waitlist import router as waitlist_router
+from services import event_handlers  # noqa: F401  (registers the post-commit handlers)
+from services.email_templates import get_templates
+from services.scheduled_jobs import JOBS
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Startup side effects live here, not at import time, so importing the app stays cheap."""
+    os.makedirs("uploads", exist_ok=True)
+    os.makedirs(LEADERBOARD_UPLOAD_DIR, exist_ok=True)
+    get_templates()  # compile every email template once, before the first send
+
+    # Recurring jobs; advisory locks keep each run to one worker across the cluster
+    app.state.scheduler = Scheduler(JOBS) if SCHEDULER_ENABLED else None
+    if app.state.scheduler:
+        app.state.scheduler.start()
+    try:
+        yield
+    finally:
+        if app.state.scheduler:
+            await app.state.scheduler.stop()
+        # Let receipts and file cleanup from the last requests finish
+        await asyncio.to_thread(drain_event_handlers, 30)
 
-os.makedirs("uploads", exist_ok=True)
 
 app = FastAPI(
     title="Saga Golf API",
     description="API for Saga Golf non-profit organization",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -38,8 +70,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# br (if the brotli package is installed) or gzip, negotiated per request
+app.add_middleware(CompressionMiddleware)
+
 # Mount static files
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount("/uploads", StaticFiles(directory="uploads", check_dir=False), name="uploads")
 
 app.include_router(auth_router)
 app.include_router(events_router)
@@ -55,6 +90,7 @@ app.include_router(scholarship_recipients_router)
 app.include_router(membership_options_router)
 app.include_router(standings_router)
 app.include_router(registrations_router)
+app.include_router(waitlist_router)
 
 @app.get("/health")
 def health_check() -> dict[str, str]:
@@ -3,6 +3,7 @@ from .banner_message import Banner
 from .carousel_image import CarouselImage
 from .event import Event
 from .event_registration import EventRegistration
+from .guest import Guest
 from .guest_registration import GuestRegistration
 from .member_membership import MemberMembership
 from .membership_tier import MembershipTier
@@ -18,6 +19,7 @@ __all__ = [
     "CarouselImage",
     "Event",
     "EventRegistration",
+    "Guest",
     "GuestRegistration",
     "MemberMembership",
     "MembershipTier",
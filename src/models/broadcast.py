@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class Broadcast(Base):
+    """An admin email to everyone in an audience, sent in the background."""
+
+    __tablename__ = "broadcast"
+    __table_args__ = {"schema": "saga"}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    audience: Mapped[str] = mapped_column(
+        String(20), nullable=False
+        # Values: "members" | "event_guests" | "unrenewed"
+    )
+    event_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("saga.event.id"), nullable=True)
+    season_year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    subject: Mapped[str] = mapped_column(String(200), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    requested_by: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending"
+        # Values: "pending" | "running" | "completed" | "interrupted"
+    )
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sent: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cursor_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(), onupdate=lambda: datetime.now()
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -16,5 +16,8 @@ class Event(Base):
     member_price = Column(Numeric(10, 2), nullable=False)
     guest_price = Column(Numeric(10, 2), nullable=False)
     capacity = Column(Integer, nullable=False)
+    # Seats taken (paid + pending registrations); maintained by a trigger on
+    # saga.event_registration — see migrations/008_event_registered_count.sql
+    registered_count = Column(Integer, nullable=False, default=0, server_default="0")
     image_url = Column(String, nullable=True)
 
@@ -63,6 +63,14 @@ class EventRegistration(Base):
         String(64), nullable=True, unique=True,
         comment="UUID v4 from client — prevents duplicate charges on retry"
     )
+    hold_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True,
+        comment="Set while a pending registration holds a seat during checkout"
+    )
+    paid_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True,
+        comment="When the card was charged — decides void vs refund"
+    )
     # ───────────────────────────────────────────────────────────────────────────
 
     created_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class EventWaitlistEntry(Base):
+    """
+    A place in an event's waitlist. Entries are served in id order; when a
+    seat frees up the next one is offered a time-boxed hold on it.
+    """
+
+    __tablename__ = "event_waitlist"
+    __table_args__ = {"schema": "saga"}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    event_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("saga.event.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("saga.user_account.id"), nullable=True
+    )
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    phone: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    access_token: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True,
+        comment="Bearer secret for checking, leaving and claiming this spot"
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="waiting"
+        # Values: "waiting" | "offered" | "claimed" | "expired" | "cancelled"
+    )
+    offered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    offer_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    registration_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("saga.event_registration.id", ondelete="SET NULL"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(), onupdate=lambda: datetime.now()
+    )
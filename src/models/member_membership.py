@@ -37,6 +37,10 @@ class MemberMembership(Base):
     season_year: Mapped[int] = mapped_column(Integer, nullable=False)
     status: Mapped[str] = mapped_column(String(30), nullable=False, default="pending")
     marked_paid_by_admin: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    renewal_notified_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True,
+        comment="When the season renewal reminder was sent"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=lambda: datetime.now()
     )
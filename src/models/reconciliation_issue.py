@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class ReconciliationIssue(Base):
+    """
+    A discrepancy between our payment records and what North settled,
+    found by the nightly reconciliation job for `run_date`.
+    """
+
+    __tablename__ = "reconciliation_issue"
+    __table_args__ = {"schema": "saga"}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    run_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    kind: Mapped[str] = mapped_column(
+        String(30), nullable=False
+        # Values: "orphan_charge" | "orphan_record" | "amount_mismatch"
+        #         | "unrecorded_void" | "unrecorded_refund"
+    )
+    transaction_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    registration_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    payment_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    recorded_amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    gateway_amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    recorded_status: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    gateway_status: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now()
+    )
+    resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class RefundJob(Base):
+    """An admin request to refund or void every paid registration of an event."""
+
+    __tablename__ = "refund_job"
+    __table_args__ = {"schema": "saga"}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    event_id: Mapped[int] = mapped_column(Integer, ForeignKey("saga.event.id"), nullable=False)
+    requested_by: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending"
+        # Values: "pending" | "running" | "completed" | "interrupted"
+    )
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    succeeded: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(), onupdate=lambda: datetime.now()
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class RefundJobItem(Base):
+    """Progress of one registration within a RefundJob."""
+
+    __tablename__ = "refund_job_item"
+    __table_args__ = (
+        UniqueConstraint("job_id", "registration_id", name="uq_refund_job_item"),
+        {"schema": "saga"},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    job_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("saga.refund_job.id", ondelete="CASCADE"), nullable=False
+    )
+    registration_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("saga.event_registration.id"), nullable=False
+    )
+    action: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # "void" | "refund"
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending"
+        # Values: "pending" | "voided" | "refunded" | "failed"
+    )
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -1,7 +1,9 @@
 import json
+from datetime import datetime
 from typing import Optional, List, Tuple, Dict
 
 from sqlalchemy import select, desc, asc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, joinedload
 
 from models.banner_message import Banner
@@ -11,6 +13,7 @@ from models.event_registration import EventRegistration
 from models.photo_album import PhotoAlbum
 from models.site_content import SiteContent
 from models.user import User, UserAccount
+from repositories.banner_repository import sync_banner_messages
 
 
 class AdminRepository:
@@ -113,18 +116,8 @@ class AdminRepository:
         return list(self.db.execute(stmt).scalars().all())
 
     def update_banner_messages(self, messages: List[str]) -> None:
-        """Replace all banner messages with new ones."""
-        # Delete existing banners
-        stmt = select(Banner)
-        existing = self.db.execute(stmt).scalars().all()
-        for banner in existing:
-            self.db.delete(banner)
-
-        # Create new banners
-        for message in messages:
-            banner = Banner(message=message)
-            self.db.add(banner)
-        self.db.flush()
+        """Replace all banner messages with new ones, keeping ids of unchanged slots."""
+        sync_banner_messages(self.db, messages)
 
 
     # Photo Album Management
@@ -185,16 +178,19 @@ class AdminRepository:
         return list(self.db.execute(stmt).scalars().all())
 
     def update_content(self, content_dict: Dict[str, str]) -> None:
-        """Update or create site content."""
-        for key, value in content_dict.items():
-            stmt = select(SiteContent).where(SiteContent.key == key)
-            content = self.db.execute(stmt).scalar_one_or_none()
-            if content:
-                content.value = value
-            else:
-                content = SiteContent(key=key, value=value)
-                self.db.add(content)
-        self.db.flush()
+        """Update or create site content in a single upsert."""
+        if not content_dict:
+            return
+        now = datetime.now()
+        stmt = pg_insert(SiteContent).values(
+            [{"key": key, "value": value, "updated_at": now} for key, value in content_dict.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SiteContent.key],
+            set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+            where=SiteContent.value.is_distinct_from(stmt.excluded.value),
+        )
+        self.db.execute(stmt)
 
     # Carousel Images Management
     def get_carousel_images(self) -> List[CarouselImage]:
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from typing import Optional
 from models.user import User, UserAccount
@@ -87,5 +87,13 @@ class AuthRepository:
         account.reset_token = None
         account.reset_token_expires = None
 
+    def purge_expired_reset_tokens(self, now: datetime) -> int:
+        stmt = (
+            update(UserAccount)
+            .where(UserAccount.reset_token_expires < now)
+            .values(reset_token=None, reset_token_expires=None)
+        )
+        return self.db.execute(stmt).rowcount
+
     def update_password(self, account: UserAccount, password_hash: str) -> None:
         account.password_hash = password_hash
@@ -1,10 +1,11 @@
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from models.banner_message import Banner
 from models.banner_settings import BannerSettings
 
 def get_banners(db: Session):
-    return db.query(Banner).all()
+    return db.query(Banner).order_by(Banner.id).all()
 
 def get_banner_display_count(db: Session) -> int:
     """Get the display count from banner_settings table."""
@@ -28,17 +29,48 @@ def update_banner_display_count(db: Session, count: int) -> int:
     return settings.count
 
 
+def sync_banner_messages(db: Session, messages: list[str]) -> None:
+    """
+    Make the banner list equal `messages` in one statement, diffing by
+    position: the Nth banner (by id) takes the Nth message, surplus rows are
+    deleted and extra messages appended. Unchanged banners keep their ids and
+    aren't written at all. Does not commit.
+    """
+    db.execute(
+        text("""
+            WITH wanted AS (
+                SELECT position, message
+                FROM unnest(CAST(:messages AS text[])) WITH ORDINALITY AS w (message, position)
+            ),
+            existing AS (
+                SELECT id, message, row_number() OVER (ORDER BY id) AS position
+                FROM saga.banner_messages
+            ),
+            deleted AS (
+                DELETE FROM saga.banner_messages b
+                USING existing e
+                WHERE b.id = e.id AND e.position > :count
+            ),
+            updated AS (
+                UPDATE saga.banner_messages b
+                SET message = w.message
+                FROM existing e
+                JOIN wanted w USING (position)
+                WHERE b.id = e.id AND b.message IS DISTINCT FROM w.message
+            )
+            INSERT INTO saga.banner_messages (message)
+            SELECT message FROM wanted
+            WHERE position > (SELECT count(*) FROM existing)
+            ORDER BY position
+        """),
+        {"messages": messages, "count": len(messages)},
+    )
+
+
 def update_banner_messages(db: Session, messages: list):
     """Update all banner messages."""
-    # Delete all existing banners
-    db.query(Banner).delete()
-    
-    # Add new banners
-    for msg in messages:
-        banner = Banner(message=msg['message'])
-        db.add(banner)
-    
+    sync_banner_messages(db, [msg['message'] for msg in messages])
     db.commit()
     
     # Return updated banners
-    return db.query(Banner).all()
\ No newline at end of file
+    return get_banners(db)
\ No newline at end of file
@@ -16,17 +16,31 @@ class CarouselRepository:
         return [row[0] for row in result.fetchall()]
     
     def update_images(self, image_urls: list):
-        """Replace all carousel images with new list."""
-        # Delete existing images
-        delete_query = text("DELETE FROM saga.carousel_images")
-        self.db.execute(delete_query)
-        
-        # Insert new images with order
-        for index, url in enumerate(image_urls):
-            insert_query = text("""
-                INSERT INTO saga.carousel_images (image_url, display_order)
-                VALUES (:url, :order)
-            """)
-            self.db.execute(insert_query, {"url": url, "order": index})
-        
-        self.db.commit()
\ No newline at end of file
+        """
+        Make the carousel equal `image_urls` in one statement, diffing by URL:
+        images no longer listed are deleted, kept images only have their
+        display_order rewritten (so their rows and ids survive a reorder), and
+        new URLs are inserted. A URL listed twice is kept once.
+        """
+        urls = list(dict.fromkeys(image_urls))
+        query = text("""
+            WITH wanted AS (
+                SELECT image_url, (display_order - 1)::int AS display_order
+                FROM unnest(CAST(:urls AS text[])) WITH ORDINALITY AS w (image_url, display_order)
+            ),
+            deleted AS (
+                DELETE FROM saga.carousel_images c
+                WHERE NOT EXISTS (SELECT 1 FROM wanted w WHERE w.image_url = c.image_url)
+            ),
+            reordered AS (
+                UPDATE saga.carousel_images c
+                SET display_order = w.display_order
+                FROM wanted w
+                WHERE c.image_url = w.image_url AND c.display_order IS DISTINCT FROM w.display_order
+            )
+            INSERT INTO saga.carousel_images (image_url, display_order)
+            SELECT image_url, display_order FROM wanted w
+            WHERE NOT EXISTS (SELECT 1 FROM saga.carousel_images c WHERE c.image_url = w.image_url)
+        """)
+        self.db.execute(query, {"urls": urls})
+        self.db.commit()
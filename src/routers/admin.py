@@ -1,25 +1,42 @@
 import os
 import uuid
-from typing import List
+from datetime import date as dt_date, timedelta
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Path, Request, UploadFile, status, Query
 from sqlalchemy.orm import Session
 
 from core.database import get_db
 from core.dependencies import AdminUser
 from schemas.admin import (
+    AdminStatsResponse,
+    AppSettingItem,
     BannerResponse,
+    BroadcastRequest,
+    BroadcastResponse,
     CarouselImagesResponse,
     ContentResponse,
     CreateEventRequest,
     DeleteUserResponse,
     EventRegistrationsResponse,
     EventResponse,
+    MarkMembershipsPaidRequest,
+    MarkMembershipsPaidResponse,
     MediaUploadResponse,
+    MembershipRolloverRequest,
+    MembershipRolloverResponse,
     PhotoAlbumCreate,
     PhotoAlbumListResponse,
     PhotoAlbumResponse,
     PhotoAlbumUpdate,
+    ReconciliationIssueListResponse,
+    ReconciliationReport,
+    RefundJobResponse,
+    RegistrationDayItem,
+    ScheduledJobItem,
+    SearchResponse,
+    WaitlistEntryItem,
+    UpdateAppSettingRequest,
     UpdateBannerMessagesRequest,
     UpdateBannerSettingsRequest,
     UpdateCarouselImagesRequest,
@@ -28,7 +45,17 @@ from schemas.admin import (
     UpdateUserRoleRequest,
     UpdateUserRoleResponse
 )
+from models.event_registration import EventRegistration
 from services.admin_service import AdminService
+from services.app_settings_service import AppSettingsService
+from services.broadcast_service import BroadcastService, run_in_background as send_broadcast_in_background
+from services.membership_renewal_service import MembershipRenewalService, send_reminders_in_background
+from services.north_payment_service import NorthGatewayError
+from services.reconciliation_service import ReconciliationService
+from services.refund_job_service import RefundJobService, run_in_background
+from services.search_service import SEARCH_TYPES, SearchService
+from services.stats_service import StatsService
+from services.waitlist_service import WaitlistService, promote_in_background
 
 from schemas.partner import PartnerCreate, PartnerUpdate, PartnerResponse, PartnerListResponse
 
@@ -36,6 +63,81 @@ from schemas.partner import PartnerCreate, PartnerUpdate, PartnerResponse, Partn
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
 
+# ===== Admin Search API =====
+@router.get("/search", response_model=SearchResponse)
+def search(
+    admin_user: AdminUser,
+    q: str = Query(..., min_length=2, max_length=100),
+    types: Optional[List[str]] = Query(None, description=f"Any of: {', '.join(SEARCH_TYPES)}"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> SearchResponse:
+    """
+    Ranked, typo-tolerant search over members, guests, events and sponsor companies.
+    Requires admin authentication.
+    """
+    unknown = set(types or []) - set(SEARCH_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown search types: {', '.join(sorted(unknown))}",
+        )
+    results, total = SearchService(db).search(q, types, skip, limit)
+    return SearchResponse(results=results, total=total)
+
+
+# ===== Admin Stats API =====
+@router.get("/stats", response_model=AdminStatsResponse)
+def get_stats(
+    admin_user: AdminUser,
+    season: Optional[int] = Query(None, ge=2000, le=2100, description="Defaults to the current year"),
+    db: Session = Depends(get_db),
+) -> AdminStatsResponse:
+    """
+    Revenue, sponsor totals, member/guest mix and fill rate per season and per event.
+    Requires admin authentication.
+    """
+    return StatsService(db).overview(season)
+
+
+@router.get("/stats/events/{event_id}/daily", response_model=List[RegistrationDayItem])
+def get_event_daily_stats(
+    event_id: int,
+    admin_user: AdminUser,
+    db: Session = Depends(get_db),
+) -> List[RegistrationDayItem]:
+    """
+    Paid registrations per day in the run-up to an event.
+    Requires admin authentication.
+    """
+    return StatsService(db).daily(event_id)
+
+
+# ===== Admin App Settings API =====
+@router.get("/settings", response_model=List[AppSettingItem])
+def get_app_settings(admin_user: AdminUser, db: Session = Depends(get_db)) -> List[AppSettingItem]:
+    """
+    List runtime settings (e.g. guest_event_rate).
+    Requires admin authentication.
+    """
+    return AppSettingsService(db).list_settings()
+
+
+@router.put("/settings/{key}", response_model=AppSettingItem)
+def update_app_setting(
+    key: Annotated[str, Path(max_length=100)],
+    request: UpdateAppSettingRequest,
+    admin_user: AdminUser,
+    db: Session = Depends(get_db),
+) -> AppSettingItem:
+    """
+    Create or update a runtime setting. Typed settings are validated before saving.
+    Requires admin authentication.
+    """
+    return AppSettingsService(db).update_setting(key, request.value, admin_user.id)
+
+
 # ===== Admin Users API =====
 @router.get("/users")
 def get_all_users(
@@ -112,14 +214,20 @@ def get_event_registrations(
 
 @router.delete("/event-registrations/{registration_id}")
 def delete_event_registration(
-    registration_id: int, admin_user: AdminUser, db: Session = Depends(get_db)
+    registration_id: int,
+    admin_user: AdminUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
 ):
     """
-    Delete an event registration.
+    Delete an event registration and offer the freed seat to the waitlist.
     Requires admin authentication.
     """
     service = AdminService(db)
+    registration = db.get(EventRegistration, registration_id)
     success = service.delete_event_registration(registration_id)
+    if success and registration:
+        background_tasks.add_task(promote_in_background, registration.event_id)
 
     if not success:
         raise HTTPException(
@@ -405,4 +513,187 @@ def delete_partner(
     """Delete partner. Requires admin authentication."""
     service = AdminService(db)
     service.delete_partner(partner_id)
-    return {"message": "Partner deleted successfully"}
\ No newline at end of file
+    return {"message": "Partner deleted successfully"}
+
+
+# ── Payment reconciliation ─────────────────────────────────────────────────────
+
+@router.post("/payments/reconcile", response_model=ReconciliationReport)
+async def reconcile_payments(
+    admin_user: AdminUser,
+    day: Optional[dt_date] = Query(None, description="Day to reconcile (defaults to yesterday)"),
+    db: Session = Depends(get_db),
+) -> ReconciliationReport:
+    """Re-run reconciliation against North for one day. Requires admin authentication."""
+    day = day or dt_date.today() - timedelta(days=1)
+    try:
+        return await ReconciliationService(db).reconcile_day(day)
+    except NorthGatewayError as exc:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
+
+
+@router.get("/payments/reconciliation-issues", response_model=ReconciliationIssueListResponse)
+def get_reconciliation_issues(
+    admin_user: AdminUser,
+    run_date: Optional[dt_date] = None,
+    kind: Optional[str] = None,
+    include_resolved: bool = False,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+) -> ReconciliationIssueListResponse:
+    """List payment discrepancies found by reconciliation. Requires admin authentication."""
+    issues, total = ReconciliationService(db).list_issues(run_date, kind, include_resolved, skip, limit)
+    return ReconciliationIssueListResponse(issues=issues, total=total)
+
+
+# ── Bulk refunds ───────────────────────────────────────────────────────────────
+
+@router.post(
+    "/events/{event_id}/refunds",
+    response_model=RefundJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def refund_event_registrations(
+    event_id: int,
+    admin_user: AdminUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> RefundJobResponse:
+    """
+    Void or refund every paid card registration for an event (e.g. a rain-out).
+    Calling again resumes an unfinished job. Requires admin authentication.
+    """
+    username = admin_user.account.email if admin_user.account else str(admin_user.id)
+    job = RefundJobService(db).start(event_id, username)
+    if job.status != "completed":
+        background_tasks.add_task(run_in_background, job.id, username)
+    return job
+
+
+@router.get("/refund-jobs/{job_id}", response_model=RefundJobResponse)
+def get_refund_job(job_id: int, admin_user: AdminUser, db: Session = Depends(get_db)) -> RefundJobResponse:
+    """Progress of a bulk refund job. Requires admin authentication."""
+    return RefundJobService(db).get(job_id)
+
+
+# ── Broadcasts ─────────────────────────────────────────────────────────────────
+
+@router.post("/broadcasts", response_model=BroadcastResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_broadcast(
+    request: BroadcastRequest,
+    admin_user: AdminUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> BroadcastResponse:
+    """
+    Email everyone in an audience: all members, the guests registered for an
+    event, or members who haven't renewed for a season. Sent in the background
+    at a throttled rate; poll GET /broadcasts/{id} for progress.
+    Requires admin authentication.
+    """
+    username = admin_user.account.email if admin_user.account else str(admin_user.id)
+    broadcast = BroadcastService(db).start(
+        request.audience,
+        request.subject,
+        request.message,
+        username,
+        event_id=request.event_id,
+        season_year=request.season_year,
+    )
+    if broadcast.status != "completed":
+        background_tasks.add_task(send_broadcast_in_background, broadcast.id)
+    return broadcast
+
+
+@router.get("/broadcasts/{broadcast_id}", response_model=BroadcastResponse)
+def get_broadcast(broadcast_id: int, admin_user: AdminUser, db: Session = Depends(get_db)) -> BroadcastResponse:
+    """Progress of a broadcast. Requires admin authentication."""
+    return BroadcastService(db).get(broadcast_id)
+
+
+@router.post(
+    "/broadcasts/{broadcast_id}/resume",
+    response_model=BroadcastResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def resume_broadcast(
+    broadcast_id: int,
+    admin_user: AdminUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> BroadcastResponse:
+    """
+    Carry on an interrupted broadcast after the last address it finished.
+    A no-op for completed broadcasts. Requires admin authentication.
+    """
+    broadcast = BroadcastService(db).get(broadcast_id)
+    if broadcast.status != "completed":
+        background_tasks.add_task(send_broadcast_in_background, broadcast.id)
+    return broadcast
+
+
+# ── Waitlist ───────────────────────────────────────────────────────────────────
+
+@router.get("/events/{event_id}/waitlist", response_model=List[WaitlistEntryItem])
+def get_event_waitlist(event_id: int, admin_user: AdminUser, db: Session = Depends(get_db)) -> List[WaitlistEntryItem]:
+    """Every waitlist entry for an event, in line order. Requires admin authentication."""
+    return WaitlistService(db).list_for_event(event_id)
+
+
+@router.post("/events/{event_id}/waitlist/promote", response_model=List[WaitlistEntryItem])
+def promote_event_waitlist(event_id: int, admin_user: AdminUser, db: Session = Depends(get_db)) -> List[WaitlistEntryItem]:
+    """Offer any free seats to the waitlist now (e.g. after raising capacity). Requires admin authentication."""
+    return WaitlistService(db).promote(event_id)
+
+
+# ── Scheduler ──────────────────────────────────────────────────────────────────
+
+@router.get("/scheduler", response_model=List[ScheduledJobItem])
+def get_scheduled_jobs(request: Request, admin_user: AdminUser) -> List[ScheduledJobItem]:
+    """
+    Recurring jobs: when each last ran anywhere in the cluster, how long it
+    took and when it's next due, plus this worker's run stats.
+    Empty when the scheduler is disabled. Requires admin authentication.
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    return scheduler.report() if scheduler else []
+
+
+# ===== Admin Membership Renewals API =====
+@router.post("/memberships/rollover", response_model=MembershipRolloverResponse)
+def roll_over_memberships(
+    request: MembershipRolloverRequest,
+    background_tasks: BackgroundTasks,
+    admin_user: AdminUser,
+    db: Session = Depends(get_db),
+) -> MembershipRolloverResponse:
+    """
+    Create next-season pending memberships for everyone paid up this season and
+    mail renewal reminders in the background. Safe to run more than once.
+    Requires admin authentication.
+    """
+    result = MembershipRenewalService(db).roll_over(request.season_year or dt_date.today().year)
+    if request.send_reminders:
+        background_tasks.add_task(send_reminders_in_background, result.next_season)
+    return MembershipRolloverResponse(
+        season_year=result.season_year,
+        next_season=result.next_season,
+        eligible=result.eligible,
+        created=result.created,
+        reminders_queued=request.send_reminders,
+    )
+
+
+@router.post("/memberships/mark-paid", response_model=MarkMembershipsPaidResponse)
+def mark_memberships_paid(
+    request: MarkMembershipsPaidRequest,
+    admin_user: AdminUser,
+    db: Session = Depends(get_db),
+) -> MarkMembershipsPaidResponse:
+    """
+    Mark pending memberships as paid (cheque, Zelle) in one update.
+    Returns the ids that changed; ids already paid or unknown are ignored.
+    Requires admin authentication.
+    """
+    return MarkMembershipsPaidResponse(updated=MembershipRenewalService(db).mark_paid(request.membership_ids))
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from core.database import get_db
 from core.dependencies import CurrentUser
+from core.rate_limit import rate_limit
 from schemas.auth import (
     ForgotPasswordRequest,
     ForgotPasswordResponse,
@@ -20,7 +21,11 @@ from services.auth_service import AuthService
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-@router.post("/signup", response_model=SignUpResponse)
+@router.post(
+    "/signup",
+    response_model=SignUpResponse,
+    dependencies=[rate_limit("signup", identity_field="email")],
+)
 def signup(data: SignUpRequest, db: Session = Depends(get_db)) -> SignUpResponse:
     """
     Register a new user.
@@ -45,7 +50,11 @@ def signup(data: SignUpRequest, db: Session = Depends(get_db)) -> SignUpResponse
     return SignUpResponse(message="User created successfully", user=user_response)
 
 
-@router.post("/login", response_model=LoginResponse)
+@router.post(
+    "/login",
+    response_model=LoginResponse,
+    dependencies=[rate_limit("login", identity_field="email")],
+)
 def login(data: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
     """
     Authenticate user and return JWT token.
@@ -76,7 +85,11 @@ def logout(current_user: CurrentUser, db: Session = Depends(get_db)) -> LogoutRe
     return LogoutResponse(message="Successfully logged out")
 
 
-@router.post("/forgot-password", response_model=ForgotPasswordResponse)
+@router.post(
+    "/forgot-password",
+    response_model=ForgotPasswordResponse,
+    dependencies=[rate_limit("forgot_password", identity_field="email")],
+)
 def forgot_password(data: ForgotPasswordRequest, db: Session = Depends(get_db)) -> ForgotPasswordResponse:
     """
     Initiate password reset flow.
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 from typing import List
 from pydantic import BaseModel
 from core.database import get_db
+from core.response_cache import cached_json
 from schemas.banner_message import BannerRead
 from services.banner_service import list_banners, update_display_count, update_messages
 
@@ -17,9 +19,12 @@ class UpdateMessagesRequest(BaseModel):
     messages: List[MessageItem]
 
 @router.get("/")  
-def get_banner_messages(db: Session = Depends(get_db)):
-    """Get banner messages with display count."""
-    return list_banners(db)
+def get_banner_messages(request: Request, db: Session = Depends(get_db)):
+    """Get banner messages with display count. Served from cache until either changes."""
+    return cached_json(
+        db, "banner_messages", ("banner_messages", "banner_settings"), lambda: to_json(list_banners(db)),
+        request,
+    )
 
 @router.put("/display-count")
 def update_banner_display_count(
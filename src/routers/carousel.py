@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 from core.database import get_db
+from core.response_cache import cached_json
 from repositories.carousel_repository import CarouselRepository
 
 router = APIRouter(prefix="/api/carousel", tags=["Carousel"])
 
 @router.get("/")
-def get_carousel_images(db: Session = Depends(get_db)):
-    """Get carousel images (public endpoint)."""
-    repo = CarouselRepository(db)
-    images = repo.get_all_images()
-    return {"images": images}
\ No newline at end of file
+def get_carousel_images(request: Request, db: Session = Depends(get_db)):
+    """Get carousel images (public endpoint). Served from cache until the carousel changes."""
+    def render() -> bytes:
+        return to_json({"images": CarouselRepository(db).get_all_images()})
+
+    return cached_json(db, "carousel", ("carousel_images",), render, request)
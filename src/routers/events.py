@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from core.database import get_db
-from core.dependencies import OptionalUser
+from core.dependencies import CurrentUser, OptionalUser
+from schemas.event import CalendarSubscriptionResponse
+from services.calendar_service import CalendarService, feed_token, user_id_from_token
 from services.event_service import list_events
+from services.registration_hold_service import lock_event
 from models.event_registration import EventRegistration
 from models.guest import Guest
 from models.user import User, UserAccount
 from pydantic import BaseModel, EmailStr
-from models.event import Event
 
 router = APIRouter(prefix="/api/events", tags=["Events"])
 
@@ -36,6 +38,28 @@ def get_events(db: Session = Depends(get_db)):
     return list_events(db)
 
 
+@router.get("/calendar.ics")
+def get_events_calendar(request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of every event (public). Supports If-None-Match."""
+    return CalendarService(db).events_feed(request)
+
+
+@router.get("/calendar/subscription", response_model=CalendarSubscriptionResponse)
+def get_calendar_subscription(request: Request, current_user: CurrentUser):
+    """The current user's private calendar feed URL, for subscribing in a calendar app."""
+    url = request.url_for("get_user_calendar", token=feed_token(current_user.id))
+    return CalendarSubscriptionResponse(url=str(url))
+
+
+@router.get("/calendar/{token}.ics")
+def get_user_calendar(token: str, request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of the events a member is registered for, authorized by the signed token."""
+    user_id = user_id_from_token(token)
+    if user_id is None:
+        raise HTTPException(status_code=404, detail="Calendar not found")
+    return CalendarService(db).user_feed(user_id, request)
+
+
 @router.post("/register")
 async def register_for_event(
     data: EventRegistrationRequest,
@@ -61,17 +85,11 @@ async def register_for_event(
             detail="You are already registered for this event"
         )
     
-    event = db.query(Event).filter(Event.id == data.event_id).first()
+    event = lock_event(db, data.event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    registration_count = (
-        db.query(EventRegistration)
-        .filter(EventRegistration.event_id == data.event_id)
-        .count()
-    )
-    
-    if registration_count >= event.capacity:
+    if event.registered_count >= event.capacity:
         raise HTTPException(
             status_code=400,
             detail="This event is at full capacity. Registration is closed."
@@ -1,23 +1,21 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from typing import List
 from core.database import get_db
+from core.response_cache import cached_json
 from repositories.partner_repository import PartnerRepository
+from schemas.partner import PartnerResponse
 
 router = APIRouter(prefix="/api/partners", tags=["Partners"])
 
-@router.get("/")
-def get_all_partners(db: Session = Depends(get_db)):
-    """Get all partners (public endpoint)."""
-    repo = PartnerRepository(db)
-    partners = repo.get_all()
-    
-    return [
-        {
-            'id': p.id,
-            'name': p.name,
-            'logo_url': p.logo_url,
-            'website_url': p.website_url,
-            'display_order': p.display_order
-        }
-        for p in partners
-    ]
\ No newline at end of file
+_PARTNERS = TypeAdapter(List[PartnerResponse])
+
+@router.get("/", response_model=List[PartnerResponse])
+def get_all_partners(request: Request, db: Session = Depends(get_db)):
+    """Get all partners (public endpoint). Served from cache until a partner changes."""
+    def render() -> bytes:
+        partners = PartnerRepository(db).get_all()
+        return _PARTNERS.dump_json(_PARTNERS.validate_python(partners, from_attributes=True))
+
+    return cached_json(db, "partners", ("partners",), render, request)
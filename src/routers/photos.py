@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List
 
 from core.database import get_db
+from core.response_cache import cached_json
 from services.admin_service import AdminService
 from schemas.admin import PhotoAlbumResponse
 
 router = APIRouter(prefix="/api/photo-albums", tags=["Photo Albums"])
 
+_ALBUMS = TypeAdapter(List[PhotoAlbumResponse])
+
 @router.get("/", response_model=List[PhotoAlbumResponse])
-def get_all_albums(db: Session = Depends(get_db)):
-    """Get all photo albums (public endpoint)."""
-    service = AdminService(db)
-    albums = service.get_all_photo_albums()
-    return [PhotoAlbumResponse.model_validate(a) for a in albums]
\ No newline at end of file
+def get_all_albums(request: Request, db: Session = Depends(get_db)):
+    """Get all photo albums (public endpoint). Served from cache until an album changes."""
+    def render() -> bytes:
+        albums = AdminService(db).get_all_photo_albums()
+        return _ALBUMS.dump_json(_ALBUMS.validate_python(albums, from_attributes=True), by_alias=True)
+
+    return cached_json(db, "photo_albums", ("photo_albums",), render, request)
@@ -1,7 +1,17 @@
 """
 Registrations Router
 Handles event registration for both authenticated members and guests.
-Payment via North is required — registration is only saved after a successful charge.
+Payment via North is required. Registration is two-phase: a short transaction
+places a `pending` hold on a seat and commits, the card is charged with no
+database transaction open, then the hold is confirmed (`paid`) or released
+(`failed`). See services/registration_hold_service.
+Requests are idempotent on idempotency_key: a retry of a completed request replays
+the stored response (header Idempotent-Replayed: true) without charging again.
+A waitlist_token holding a live offer claims the seat held for it even when the
+event is otherwise full. A declined card gives the offer back; retry-payment
+claims it again while it's still live.
+Guests pay the guest_event_rate app setting when an admin has set one, else
+the event's guest_price.
 
 Endpoints:
   POST /api/registrations              — authenticated member registers
@@ -14,20 +24,41 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.orm import Session
 
 from core.database import get_db
-from core.dependencies import CurrentUser
+from core.dependencies import CurrentUser, RuntimeSettings
+from core.rate_limit import rate_limit
 from models.event import Event
 from models.event_registration import EventRegistration
+from models.event_waitlist import EventWaitlistEntry
 from models.guest import Guest
+from models.user import UserAccount
+from services.app_settings_service import AppSettings
+from services.idempotency_service import (
+    ensure_same_request,
+    find_by_idempotency_key,
+    lock_idempotency_key,
+)
 from services.north_payment_service import (
+    NorthChargeResult,
     NorthDeclinedError,
     NorthGatewayError,
+    NorthUnavailableError,
     charge_card,
+    void_transaction,
+)
+from services.registration_hold_service import (
+    INACTIVE_STATUSES,
+    confirm_hold,
+    hold_expiry,
+    is_live_hold,
+    lock_event,
+    release_hold,
 )
+from services.waitlist_service import WaitlistService
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/registrations", tags=["Registrations"])
@@ -43,6 +74,7 @@ class MemberRegistrationRequest(BaseModel):
     is_sponsor:      bool            = False
     sponsor_amount:  Optional[float] = None
     company_name:    Optional[str]   = None
+    waitlist_token:  Optional[str]   = None
 
 
 class GuestRegistrationRequest(BaseModel):
@@ -57,6 +89,7 @@ class GuestRegistrationRequest(BaseModel):
     is_sponsor:      bool            = False
     sponsor_amount:  Optional[float] = None
     company_name:    Optional[str]   = None
+    waitlist_token:  Optional[str]   = None
 
 
 class RetryPaymentRequest(BaseModel):
@@ -76,56 +109,208 @@ class RegistrationResponse(BaseModel):
 
 # ── Helpers ─────────────────────────────────────────────────────────────────────
 
-def _get_event_or_404(db: Session, event_id: int) -> Event:
-    event = db.query(Event).filter(Event.id == event_id).first()
+def _lock_event_or_404(db: Session, event_id: int) -> Event:
+    event = lock_event(db, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found.")
     return event
 
 
-def _check_capacity(db: Session, event: Event) -> None:
-    registered = (
-        db.query(EventRegistration)
-        .filter(EventRegistration.event_id == event.id)
-        .count()
-    )
-    if registered >= event.capacity:
+def _check_capacity(
+    db:             Session,
+    event:          Event,
+    waitlist_token: Optional[str] = None,
+) -> Optional[EventWaitlistEntry]:
+    """
+    Paid registrations, live checkout holds and outstanding waitlist offers
+    all count as taken. A request that carries the token of one of those
+    offers gets its held seat and the returned entry, to be marked claimed
+    with the registration.
+    """
+    waitlist = WaitlistService(db)
+    offer    = waitlist.find_offer(event.id, waitlist_token) if waitlist_token else None
+    taken    = waitlist.seats_taken(event, exclude_token=offer.access_token if offer else None)
+    if taken >= event.capacity:
         raise HTTPException(status_code=409, detail="This event is fully booked.")
+    return offer
 
 
-def _check_duplicate_member(db: Session, event_id: int, user_id: int) -> None:
-    exists = (
+def _member_account(db: Session, user_id: int) -> UserAccount:
+    """
+    The login account behind a profile. event_registration.user_id references
+    user_account.id, which isn't the profile's id, and receipts and reminders
+    are addressed through it.
+    """
+    account = db.query(UserAccount).filter(UserAccount.user_id == user_id).first()
+    if not account:
+        raise HTTPException(status_code=404, detail="User account not found")
+    return account
+
+
+def _guest_price(event: Event, app_settings: AppSettings) -> Decimal:
+    rate = app_settings.guest_event_rate
+    # Hand-edited values that don't parse are served raw; ignore them
+    if isinstance(rate, Decimal) and rate > 0:
+        return rate
+    return Decimal(str(event.guest_price))
+
+
+def _check_duplicate_member(db: Session, event_id: int, user_id: int) -> Optional[EventRegistration]:
+    """Reject an active registration; return a failed/expired one to re-hold."""
+    rows = (
         db.query(EventRegistration)
         .filter(
             EventRegistration.event_id == event_id,
             EventRegistration.user_id == user_id,
         )
-        .first()
+        .all()
     )
-    if exists:
+    if any(_occupies_seat(row) for row in rows):
         raise HTTPException(status_code=409, detail="You are already registered for this event.")
+    return rows[0] if rows else None
 
 
-def _check_duplicate_guest(db: Session, event_id: int, email: str) -> None:
-    exists = (
+def _check_duplicate_guest(db: Session, event_id: int, email: str) -> Optional[EventRegistration]:
+    """Reject an active registration; return a failed/expired one to re-hold."""
+    rows = (
         db.query(EventRegistration)
         .filter(
             EventRegistration.event_id == event_id,
             EventRegistration.email == email,
         )
-        .first()
+        .all()
     )
-    if exists:
+    if any(_occupies_seat(row) for row in rows):
         raise HTTPException(
             status_code=409,
             detail="This email is already registered for this event.",
         )
+    return rows[0] if rows else None
+
+
+def _occupies_seat(registration: EventRegistration) -> bool:
+    if registration.payment_status in INACTIVE_STATUSES:
+        return False
+    if registration.payment_status == "pending" and registration.hold_expires_at is not None:
+        return is_live_hold(registration)
+    return True
 
 
 def _confirmation_id(registration_id: int) -> str:
     return f"SAGA-{registration_id:06d}"
 
 
+def _to_response(registration: EventRegistration, message: str = "Registration confirmed") -> RegistrationResponse:
+    return RegistrationResponse(
+        registration_id=registration.id,
+        confirmation_id=_confirmation_id(registration.id),
+        event_id=registration.event_id,
+        amount_charged=float(registration.amount_paid or 0),
+        transaction_id=registration.transaction_id,
+        card_last_four=registration.card_last_four,
+        message=message,
+    )
+
+
+def _checkout_in_progress() -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail="Payment for this registration is still being processed.",
+        headers={"Retry-After": "2"},
+    )
+
+
+def _replay_if_completed(
+    db:       Session,
+    key:      str,
+    response: Response,
+    event_id: int,
+    user_id:  Optional[int] = None,
+    email:    Optional[str] = None,
+) -> Optional[RegistrationResponse]:
+    """
+    Claim the idempotency key, then return the stored response if this request
+    already completed. Must run before any capacity checks or charges.
+    """
+    lock_idempotency_key(db, key)
+    existing = find_by_idempotency_key(db, key)
+    if not existing:
+        return None
+
+    ensure_same_request(existing, event_id, user_id=user_id, email=email)
+    if is_live_hold(existing):
+        raise _checkout_in_progress()
+    if existing.payment_status != "paid":
+        raise HTTPException(
+            status_code=409,
+            detail="This registration is awaiting payment. Use retry-payment to complete it.",
+        )
+
+    logger.info("Idempotent replay: registration_id=%s", existing.id)
+    response.headers["Idempotent-Replayed"] = "true"
+    return _to_response(existing)
+
+
+def _gateway_unavailable(exc: NorthUnavailableError) -> HTTPException:
+    """Fast-fail answer when the North breaker is open or the bulkhead is full."""
+    return HTTPException(
+        status_code=503,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def _charge_and_confirm(
+    db:              Session,
+    registration_id: int,
+    total:           Decimal,
+    payment_token:   str,
+    log_context:     str,
+) -> NorthChargeResult:
+    """
+    Phase two. The hold is already committed, so the session holds no
+    connection while we wait on North. Declines and gateway failures release
+    the seat; the registration_id is returned in a Registration-Id header so
+    the client can call retry-payment.
+    """
+    retry_headers = {"Registration-Id": str(registration_id)}
+    try:
+        charge = await charge_card(payment_token, float(total))
+    except NorthDeclinedError as exc:
+        release_hold(db, registration_id)
+        logger.warning("Payment declined: %s", log_context)
+        raise HTTPException(status_code=402, detail=str(exc), headers=retry_headers)
+    except NorthUnavailableError as exc:
+        release_hold(db, registration_id)
+        raise _gateway_unavailable(exc)
+    except NorthGatewayError as exc:
+        release_hold(db, registration_id)
+        logger.error("North gateway error: %s error=%s", log_context, exc)
+        raise HTTPException(status_code=502, detail=str(exc), headers=retry_headers)
+
+    confirmed = confirm_hold(
+        db,
+        registration_id,
+        amount=total,
+        transaction_id=charge.transaction_id,
+        uniq_id=charge.uniq_id,
+        account_id=charge.account_id,
+        card_last_four=charge.card_last_four,
+    )
+    if not confirmed:
+        # The sweeper reclaimed the seat while the charge was in flight
+        logger.error("Hold lapsed during charge, voiding: %s transaction_id=%s", log_context, charge.transaction_id)
+        try:
+            await void_transaction(charge.account_id, charge.transaction_id, username="system")
+        except NorthGatewayError:
+            logger.exception("Void after lapsed hold failed: transaction_id=%s", charge.transaction_id)
+        raise HTTPException(
+            status_code=409,
+            detail="Your registration hold expired before payment completed. The charge was voided; please register again.",
+        )
+    return charge
+
+
 # ── Member registration ─────────────────────────────────────────────────────────
 
 @router.post(
@@ -135,64 +320,63 @@ def _confirmation_id(registration_id: int) -> str:
 )
 async def register_member(
     data: MemberRegistrationRequest,
+    response: Response,
     current_user=Depends(CurrentUser),
     db: Session = Depends(get_db),
 ) -> RegistrationResponse:
     """
     Register an authenticated member.
-    Charges member_price (+ optional sponsorship amount).
-    Registration row is only inserted after a successful payment.
+    Charges member_price (+ optional sponsorship amount) against a seat hold.
     """
-    event = _get_event_or_404(db, data.event_id)
-    _check_capacity(db, event)
-    _check_duplicate_member(db, data.event_id, current_user.id)
+    account = _member_account(db, current_user.id)
+    replay  = _replay_if_completed(
+        db, data.idempotency_key, response, data.event_id, user_id=account.id
+    )
+    if replay:
+        return replay
+
+    # Phase one: hold a seat
+    event    = _lock_event_or_404(db, data.event_id)
+    offer    = _check_capacity(db, event, data.waitlist_token)
+    previous = _check_duplicate_member(db, data.event_id, account.id)
 
     base    = Decimal(str(event.member_price or event.guest_price))
     sponsor = Decimal(str(data.sponsor_amount or 0)) if data.is_sponsor else Decimal("0")
     total   = base + sponsor
 
-    try:
-        charge = await charge_card(data.payment_token, float(total))
-    except NorthDeclinedError as exc:
-        logger.warning(
-            "Member payment declined: user_id=%s event_id=%s",
-            current_user.id, data.event_id,
-        )
-        raise HTTPException(status_code=402, detail=str(exc))
-    except NorthGatewayError as exc:
-        logger.error("North gateway error (member): %s", exc)
-        raise HTTPException(status_code=502, detail=str(exc))
-
-    registration = EventRegistration(
-        event_id=data.event_id,
-        user_id=current_user.id,
-        email=getattr(current_user, "email", None),
-        phone=getattr(current_user, "phone_number", None),
-        handicap=data.handicap,
-        payment_status="paid",
-        payment_method="card",
-        amount_paid=float(total),
-        transaction_id=charge.transaction_id,
-        north_uniq_id=charge.uniq_id,
-        north_account_id=charge.account_id,
-        card_last_four=charge.card_last_four,
-        idempotency_key=data.idempotency_key,
-        is_sponsor=data.is_sponsor,
-        sponsor_amount=float(data.sponsor_amount) if data.is_sponsor and data.sponsor_amount else None,
-        company_name=data.company_name if data.is_sponsor else None,
-    )
+    registration = previous or EventRegistration(event_id=data.event_id, user_id=account.id)
+    registration.email           = account.email
+    registration.phone           = current_user.phone_number
+    registration.handicap        = data.handicap
+    registration.payment_status  = "pending"
+    registration.payment_method  = "card"
+    registration.amount_paid     = float(total)
+    registration.idempotency_key = data.idempotency_key
+    registration.hold_expires_at = hold_expiry()
+    registration.is_sponsor      = data.is_sponsor
+    registration.sponsor_amount  = float(data.sponsor_amount) if data.is_sponsor and data.sponsor_amount else None
+    registration.company_name    = data.company_name if data.is_sponsor else None
     db.add(registration)
+    db.flush()
+    registration_id = registration.id
+    if offer:
+        WaitlistService(db).mark_claimed(offer, registration_id)
     db.commit()
-    db.refresh(registration)
+
+    # Phase two: charge, then confirm
+    charge = await _charge_and_confirm(
+        db, registration_id, total, data.payment_token,
+        log_context=f"user_id={current_user.id} event_id={data.event_id}",
+    )
 
     logger.info(
         "Member registered: registration_id=%s user_id=%s event_id=%s amount=%s",
-        registration.id, current_user.id, data.event_id, total,
+        registration_id, current_user.id, data.event_id, total,
     )
 
     return RegistrationResponse(
-        registration_id=registration.id,
-        confirmation_id=_confirmation_id(registration.id),
+        registration_id=registration_id,
+        confirmation_id=_confirmation_id(registration_id),
         event_id=data.event_id,
         amount_charged=float(total),
         transaction_id=charge.transaction_id,
@@ -206,35 +390,33 @@ async def register_member(
     "/guest",
     response_model=RegistrationResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[rate_limit("guest_registration", identity_field="email")],
 )
 async def register_guest(
     data: GuestRegistrationRequest,
+    response: Response,
+    app_settings: RuntimeSettings,
     db: Session = Depends(get_db),
 ) -> RegistrationResponse:
     """
     Register an unauthenticated guest.
-    Charges guest_price (+ optional sponsorship amount).
-    Registration row is only inserted after a successful payment.
+    Charges the guest price (+ optional sponsorship amount) against a seat hold.
     """
-    event = _get_event_or_404(db, data.event_id)
-    _check_capacity(db, event)
-    _check_duplicate_guest(db, data.event_id, data.email)
+    replay = _replay_if_completed(
+        db, data.idempotency_key, response, data.event_id, email=data.email
+    )
+    if replay:
+        return replay
+
+    # Phase one: hold a seat
+    event    = _lock_event_or_404(db, data.event_id)
+    offer    = _check_capacity(db, event, data.waitlist_token)
+    previous = _check_duplicate_guest(db, data.event_id, data.email)
 
-    base    = Decimal(str(event.guest_price))
+    base    = _guest_price(event, app_settings)
     sponsor = Decimal(str(data.sponsor_amount or 0)) if data.is_sponsor else Decimal("0")
     total   = base + sponsor
 
-    try:
-        charge = await charge_card(data.payment_token, float(total))
-    except NorthDeclinedError as exc:
-        logger.warning(
-            "Guest payment declined: email=%s event_id=%s", data.email, data.event_id
-        )
-        raise HTTPException(status_code=402, detail=str(exc))
-    except NorthGatewayError as exc:
-        logger.error("North gateway error (guest): %s", exc)
-        raise HTTPException(status_code=502, detail=str(exc))
-
     # Reuse existing Guest record or create one
     guest = db.query(Guest).filter(Guest.email == data.email).first()
     if not guest:
@@ -247,36 +429,39 @@ async def register_guest(
         db.add(guest)
         db.flush()
 
-    registration = EventRegistration(
-        event_id=data.event_id,
-        guest_id=guest.id,
-        email=data.email,
-        phone=data.phone,
-        handicap=data.handicap,
-        payment_status="paid",
-        payment_method="card",
-        amount_paid=float(total),
-        transaction_id=charge.transaction_id,
-        north_uniq_id=charge.uniq_id,
-        north_account_id=charge.account_id,
-        card_last_four=charge.card_last_four,
-        idempotency_key=data.idempotency_key,
-        is_sponsor=data.is_sponsor,
-        sponsor_amount=float(data.sponsor_amount) if data.is_sponsor and data.sponsor_amount else None,
-        company_name=data.company_name if data.is_sponsor else None,
-    )
+    registration = previous or EventRegistration(event_id=data.event_id, email=data.email)
+    registration.guest_id        = guest.id
+    registration.phone           = data.phone
+    registration.handicap        = data.handicap
+    registration.payment_status  = "pending"
+    registration.payment_method  = "card"
+    registration.amount_paid     = float(total)
+    registration.idempotency_key = data.idempotency_key
+    registration.hold_expires_at = hold_expiry()
+    registration.is_sponsor      = data.is_sponsor
+    registration.sponsor_amount  = float(data.sponsor_amount) if data.is_sponsor and data.sponsor_amount else None
+    registration.company_name    = data.company_name if data.is_sponsor else None
     db.add(registration)
+    db.flush()
+    registration_id = registration.id
+    if offer:
+        WaitlistService(db).mark_claimed(offer, registration_id)
     db.commit()
-    db.refresh(registration)
+
+    # Phase two: charge, then confirm
+    charge = await _charge_and_confirm(
+        db, registration_id, total, data.payment_token,
+        log_context=f"email={data.email} event_id={data.event_id}",
+    )
 
     logger.info(
         "Guest registered: registration_id=%s email=%s event_id=%s amount=%s",
-        registration.id, data.email, data.event_id, total,
+        registration_id, data.email, data.event_id, total,
     )
 
     return RegistrationResponse(
-        registration_id=registration.id,
-        confirmation_id=_confirmation_id(registration.id),
+        registration_id=registration_id,
+        confirmation_id=_confirmation_id(registration_id),
         event_id=data.event_id,
         amount_charged=float(total),
         transaction_id=charge.transaction_id,
@@ -294,12 +479,14 @@ async def register_guest(
 async def retry_payment(
     registration_id: int,
     data: RetryPaymentRequest,
+    response: Response,
     db: Session = Depends(get_db),
 ) -> RegistrationResponse:
     """
     Retry payment on a pending or failed registration.
-    The frontend stores the registration_id when a first attempt is created
-    but payment fails, then calls this endpoint with a new card token.
+    The frontend keeps the registration_id (Registration-Id header) when a
+    first attempt fails, then calls this endpoint with a new card token.
+    The seat is re-held first, so it may be gone if the event filled up.
     """
     registration = (
         db.query(EventRegistration)
@@ -309,34 +496,51 @@ async def retry_payment(
     if not registration:
         raise HTTPException(status_code=404, detail="Registration not found.")
 
+    lock_idempotency_key(db, data.idempotency_key)
+    db.refresh(registration)
+
     if registration.payment_status == "paid":
+        if registration.idempotency_key == data.idempotency_key:
+            response.headers["Idempotent-Replayed"] = "true"
+            return _to_response(registration)
         raise HTTPException(status_code=409, detail="This registration is already paid.")
+    if is_live_hold(registration):
+        raise _checkout_in_progress()
 
-    event = _get_event_or_404(db, registration.event_id)
-    total = Decimal(str(registration.amount_paid or event.guest_price))
-
-    try:
-        charge = await charge_card(data.payment_token, float(total))
-    except NorthDeclinedError as exc:
-        raise HTTPException(status_code=402, detail=str(exc))
-    except NorthGatewayError as exc:
-        raise HTTPException(status_code=502, detail=str(exc))
+    other = find_by_idempotency_key(db, data.idempotency_key)
+    if other and other.id != registration.id:
+        raise HTTPException(
+            status_code=422,
+            detail="This idempotency key was already used for a different registration.",
+        )
 
-    registration.payment_status  = "paid"
-    registration.payment_method  = "card"
-    registration.transaction_id  = charge.transaction_id
-    registration.north_uniq_id   = charge.uniq_id
-    registration.north_account_id = charge.account_id
-    registration.card_last_four  = charge.card_last_four
+    # Phase one: re-hold the seat (a pending row without a hold already has one),
+    # reclaiming the waitlist offer a declined first attempt gave back
+    event = _lock_event_or_404(db, registration.event_id)
+    if not _occupies_seat(registration):
+        waitlist = WaitlistService(db)
+        offer    = _check_capacity(db, event, waitlist.released_offer_token(registration.id))
+        if offer:
+            waitlist.mark_claimed(offer, registration.id)
+    total    = Decimal(str(registration.amount_paid or event.guest_price))
+    event_id = event.id
+
+    registration.payment_status  = "pending"
     registration.idempotency_key = data.idempotency_key
+    registration.hold_expires_at = hold_expiry()
     db.commit()
-    db.refresh(registration)
+
+    # Phase two: charge, then confirm
+    charge = await _charge_and_confirm(
+        db, registration_id, total, data.payment_token,
+        log_context=f"registration_id={registration_id}",
+    )
 
     return RegistrationResponse(
-        registration_id=registration.id,
-        confirmation_id=_confirmation_id(registration.id),
-        event_id=registration.event_id,
+        registration_id=registration_id,
+        confirmation_id=_confirmation_id(registration_id),
+        event_id=event_id,
         amount_charged=float(total),
         transaction_id=charge.transaction_id,
         card_last_four=charge.card_last_four,
-    )
\ No newline at end of file
+    )
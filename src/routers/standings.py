@@ -20,8 +20,7 @@ from schemas.standings import (
 
 router = APIRouter(prefix="/api", tags=["Standings"])
 
-UPLOAD_DIR = os.environ.get("UPLOAD_DIR", "uploads/leaderboard")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_DIR = os.environ.get("UPLOAD_DIR", "uploads/leaderboard")  # created by the app lifespan
 
 
 # ===================================================================
@@ -0,0 +1,109 @@
+"""
+Waitlist Router
+Lets people queue for a fully booked event and manage their spot.
+
+Endpoints:
+  POST   /api/waitlist                — join an event's waitlist (member or guest)
+  GET    /api/waitlist/{id}?token=…   — status, position and any outstanding offer
+  DELETE /api/waitlist/{id}?token=…   — leave the waitlist
+
+An offered spot is claimed by registering through /api/registrations with
+waitlist_token set to the entry's token.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from pydantic import BaseModel, EmailStr
+from sqlalchemy.orm import Session
+
+from core.database import get_db
+from core.dependencies import OptionalUser
+from models.event_waitlist import EventWaitlistEntry
+from services.waitlist_service import WaitlistService, promote_in_background
+
+router = APIRouter(prefix="/api/waitlist", tags=["Waitlist"])
+
+
+# ── Schemas ─────────────────────────────────────────────────────────────────────
+
+class JoinWaitlistRequest(BaseModel):
+    event_id:   int
+    first_name: str
+    last_name:  str
+    email:      EmailStr
+    phone:      Optional[str] = None
+
+
+class WaitlistEntryResponse(BaseModel):
+    id:               int
+    event_id:         int
+    status:           str
+    position:         Optional[int]      = None
+    offer_expires_at: Optional[datetime] = None
+    token:            Optional[str]      = None
+
+
+def _to_response(
+    service: WaitlistService,
+    entry:   EventWaitlistEntry,
+    include_token: bool = False,
+) -> WaitlistEntryResponse:
+    return WaitlistEntryResponse(
+        id=entry.id,
+        event_id=entry.event_id,
+        status=entry.status,
+        position=service.position(entry),
+        offer_expires_at=entry.offer_expires_at if entry.status == "offered" else None,
+        token=entry.access_token if include_token else None,
+    )
+
+
+# ── Endpoints ───────────────────────────────────────────────────────────────────
+
+@router.post("", response_model=WaitlistEntryResponse, status_code=status.HTTP_201_CREATED)
+def join_waitlist(
+    data: JoinWaitlistRequest,
+    current_user: OptionalUser = None,
+    db: Session = Depends(get_db),
+) -> WaitlistEntryResponse:
+    """
+    Join the waitlist for a fully booked event.
+    The returned token is the only way to check, leave or claim this spot.
+    """
+    service = WaitlistService(db)
+    entry = service.join(
+        event_id=data.event_id,
+        email=data.email,
+        first_name=data.first_name,
+        last_name=data.last_name,
+        phone=data.phone,
+        user_id=current_user.account.id if current_user and current_user.account else None,
+    )
+    return _to_response(service, entry, include_token=True)
+
+
+@router.get("/{entry_id}", response_model=WaitlistEntryResponse)
+def get_waitlist_entry(
+    entry_id: int,
+    token: str = Query(...),
+    db: Session = Depends(get_db),
+) -> WaitlistEntryResponse:
+    service = WaitlistService(db)
+    return _to_response(service, service.get_by_token(entry_id, token))
+
+
+@router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+def leave_waitlist(
+    entry_id: int,
+    background_tasks: BackgroundTasks,
+    token: str = Query(...),
+    db: Session = Depends(get_db),
+) -> None:
+    service = WaitlistService(db)
+    entry = service.get_by_token(entry_id, token)
+    if service.leave(entry):
+        # They were holding a seat — hand it to the next person
+        background_tasks.add_task(promote_in_background, entry.event_id)
@@ -1,6 +1,6 @@
 from datetime import date as dt_date
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Literal, Optional, List, Dict
 from pydantic import BaseModel, EmailStr, Field, field_serializer
 
 
@@ -191,4 +191,210 @@ class CarouselImagesResponse(BaseModel):
 
 
 class UpdateCarouselImagesRequest(BaseModel):
-    images: List[str]
\ No newline at end of file
+    images: List[str]
+
+# ── Payment reconciliation ────────────────────────────────────────
+class ReconciliationReport(BaseModel):
+    run_date: dt_date
+    gateway_transactions: int
+    issues: Dict[str, int]
+
+
+class ReconciliationIssueItem(BaseModel):
+    id: int
+    run_date: dt_date
+    kind: str
+    transaction_id: Optional[str] = None
+    registration_id: Optional[int] = None
+    payment_id: Optional[int] = None
+    recorded_amount: Optional[float] = None
+    gateway_amount: Optional[float] = None
+    recorded_status: Optional[str] = None
+    gateway_status: Optional[str] = None
+    created_at: datetime
+    resolved_at: Optional[datetime] = None
+    model_config = {"from_attributes": True}
+
+
+class ReconciliationIssueListResponse(BaseModel):
+    issues: List[ReconciliationIssueItem]
+    total: int
+
+
+# ── Bulk refunds ──────────────────────────────────────────────────
+class RefundJobResponse(BaseModel):
+    id: int
+    event_id: int
+    requested_by: str
+    status: str
+    total: int
+    succeeded: int
+    failed: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    model_config = {"from_attributes": True}
+
+
+# ── Broadcasts ────────────────────────────────────────────────────
+class BroadcastRequest(BaseModel):
+    audience: Literal["members", "event_guests", "unrenewed"]
+    subject: str = Field(..., min_length=1, max_length=200)
+    message: str = Field(..., min_length=1, max_length=20000)
+    event_id: Optional[int] = None  # event_guests
+    season_year: Optional[int] = Field(None, ge=2000, le=2100)  # unrenewed; defaults to this year
+
+
+class BroadcastResponse(BaseModel):
+    id: int
+    audience: str
+    event_id: Optional[int] = None
+    season_year: Optional[int] = None
+    subject: str
+    requested_by: str
+    status: str
+    total: int
+    sent: int
+    failed: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    model_config = {"from_attributes": True}
+
+
+# ── Waitlist ──────────────────────────────────────────────────────
+class WaitlistEntryItem(BaseModel):
+    id: int
+    event_id: int
+    user_id: Optional[int] = None
+    email: str
+    first_name: str
+    last_name: str
+    phone: Optional[str] = None
+    status: str
+    offered_at: Optional[datetime] = None
+    offer_expires_at: Optional[datetime] = None
+    registration_id: Optional[int] = None
+    created_at: datetime
+    model_config = {"from_attributes": True}
+
+
+# ── Search ────────────────────────────────────────────────────────
+class SearchResultItem(BaseModel):
+    type: str  # "user" | "guest" | "event" | "registration"
+    id: int
+    title: str
+    subtitle: Optional[str] = None
+    event_id: Optional[int] = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    results: List[SearchResultItem]
+    total: int
+
+
+# ── Statistics ────────────────────────────────────────────────────
+class _StatsTotals(BaseModel):
+    registrations: int
+    members: int
+    guests: int
+    sponsors: int
+    revenue: float
+    sponsor_revenue: float
+    refunds: int
+    refunded_amount: float
+    capacity: int
+    seats_taken: int
+    fill_rate: float
+
+
+class SeasonStatsItem(_StatsTotals):
+    season: int
+    events: int
+
+
+class EventStatsItem(_StatsTotals):
+    event_id: int
+    golf_course: str
+    date: dt_date
+
+
+class AdminStatsResponse(BaseModel):
+    season: int
+    seasons: List[SeasonStatsItem]
+    events: List[EventStatsItem]
+
+
+class RegistrationDayItem(BaseModel):
+    day: dt_date
+    days_before: int
+    registrations: int
+    revenue: float
+    cumulative: int
+
+
+# ── App settings ──────────────────────────────────────────────────
+class AppSettingItem(BaseModel):
+    key: str
+    value: str
+    updated_at: datetime
+    updated_by: Optional[int] = None
+    model_config = {"from_attributes": True}
+
+
+class UpdateAppSettingRequest(BaseModel):
+    value: str = Field(..., max_length=10000)
+
+
+# ── Scheduler ─────────────────────────────────────────────────────
+class WorkerJobStats(BaseModel):
+    runs: int
+    failures: int
+    skipped: int
+    mean_seconds: Optional[float] = None
+    max_seconds: float
+    last_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class ScheduledJobItem(BaseModel):
+    name: str
+    interval_seconds: float
+    exclusive: bool
+    misfire: str
+    # Cluster-wide, from saga.scheduled_job; empty until the job first runs
+    next_run_at: Optional[datetime] = None
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_duration_ms: Optional[int] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    runs: int = 0
+    failures: int = 0
+    # This worker's runs
+    worker: WorkerJobStats
+
+
+# ── Membership renewals ───────────────────────────────────────────
+class MembershipRolloverRequest(BaseModel):
+    season_year: Optional[int] = Field(None, ge=2000, le=2100)
+    send_reminders: bool = True
+
+
+class MembershipRolloverResponse(BaseModel):
+    season_year: int
+    next_season: int
+    eligible: int
+    created: int
+    reminders_queued: bool
+
+
+class MarkMembershipsPaidRequest(BaseModel):
+    membership_ids: List[int] = Field(..., min_length=1, max_length=5000)
+
+
+class MarkMembershipsPaidResponse(BaseModel):
+    updated: List[int]
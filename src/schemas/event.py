@@ -23,3 +23,7 @@ class EventRead(BaseModel):
     @field_serializer('date')
     def serialize_date(self, date_val: dt_date, _info):
         return date_val.strftime("%m/%d/%Y") 
+
+
+class CalendarSubscriptionResponse(BaseModel):
+    url: str
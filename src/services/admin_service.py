@@ -1,11 +1,11 @@
 import json
-import os
 from datetime import datetime, time
 from typing import Optional, List, Tuple, Dict
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from core.events import EventUpdated, UploadDiscarded, publish
 from repositories.admin_repository import AdminRepository
 from schemas.admin import (
     CarouselImageItem,
@@ -153,10 +153,6 @@ class AdminService:
         result = []
 
         for event in events:
-            registered_count = self.repo.db.query(EventRegistration)\
-                .filter(EventRegistration.event_id == event.id)\
-                .count()
-
             result.append(
                 EventResponse(
                     id=event.id,
@@ -169,7 +165,7 @@ class AdminService:
                     guest_price=float(event.guest_price),
                     member_price=float(event.member_price) if event.member_price else float(event.guest_price),
                     capacity=event.capacity,
-                    registered=registered_count,
+                    registered=event.registered_count,
                     image_url=getattr(event, 'image_url', None),
                     description=getattr(event, 'description', None),
                 )
@@ -188,6 +184,7 @@ class AdminService:
                 )
 
             event = self.repo.create_event(event_data)
+            publish(self.repo.db, EventUpdated(event.id))
             self.repo.commit()
             return {
                 "id": event.id,
@@ -225,14 +222,7 @@ class AdminService:
 
             if new_image_url and old_image_url and new_image_url != old_image_url:
                 if old_image_url.startswith('/uploads/'):
-                    file_path = old_image_url.lstrip('/')
-                    full_path = os.path.join(os.getcwd(), file_path)
-                    try:
-                        if os.path.exists(full_path):
-                            os.remove(full_path)
-                            print(f"Deleted old event image: {full_path}")
-                    except Exception as e:
-                        print(f"Failed to delete old file {full_path}: {e}")
+                    publish(self.repo.db, UploadDiscarded(old_image_url))
 
             if "start_time" in event_data and isinstance(event_data["start_time"], str):
                 time_parts = event_data["start_time"].split(":")
@@ -246,6 +236,7 @@ class AdminService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Event not found",
                 )
+            publish(self.repo.db, EventUpdated(event_id))
             self.repo.commit()
             return {
                 "id": event.id,
@@ -282,14 +273,7 @@ class AdminService:
                 )
 
             if hasattr(event, 'image_url') and event.image_url and event.image_url.startswith('/uploads/'):
-                file_path = event.image_url.lstrip('/')
-                full_path = os.path.join(os.getcwd(), file_path)
-                try:
-                    if os.path.exists(full_path):
-                        os.remove(full_path)
-                        print(f"Deleted event image: {full_path}")
-                except Exception as e:
-                    print(f"Failed to delete file {full_path}: {e}")
+                publish(self.repo.db, UploadDiscarded(event.image_url))
 
             deleted = self.repo.delete_event(event_id)
             if not deleted:
@@ -297,6 +281,7 @@ class AdminService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Event not found",
                 )
+            publish(self.repo.db, EventUpdated(event_id))
             self.repo.commit()
         except HTTPException:
             self.repo.rollback()
@@ -366,14 +351,7 @@ class AdminService:
 
         if new_cover_image and old_cover_image and new_cover_image != old_cover_image:
             if old_cover_image.startswith('/uploads/'):
-                file_path = old_cover_image.lstrip('/')
-                full_path = os.path.join(os.getcwd(), file_path)
-                try:
-                    if os.path.exists(full_path):
-                        os.remove(full_path)
-                        print(f"Deleted old album cover: {full_path}")
-                except Exception as e:
-                    print(f"Failed to delete old file {full_path}: {e}")
+                publish(self.repo.db, UploadDiscarded(old_cover_image))
 
         updated_album = self.repo.update_photo_album(album_id, album_data)
         self.repo.db.commit()
@@ -387,13 +365,7 @@ class AdminService:
             raise HTTPException(status_code=404, detail="Album not found")
 
         if album.cover_image and album.cover_image.startswith('/uploads/'):
-            file_path = album.cover_image.lstrip('/')
-            full_path = os.path.join(os.getcwd(), file_path)
-            try:
-                if os.path.exists(full_path):
-                    os.remove(full_path)
-            except Exception as e:
-                print(f"Failed to delete file {full_path}: {e}")
+            publish(self.repo.db, UploadDiscarded(album.cover_image))
 
         self.repo.db.delete(album)
         self.repo.db.commit()
@@ -476,14 +448,7 @@ class AdminService:
 
         if new_logo_url and old_logo_url and new_logo_url != old_logo_url:
             if old_logo_url.startswith('/uploads/'):
-                file_path = old_logo_url.lstrip('/')
-                full_path = os.path.join(os.getcwd(), file_path)
-                try:
-                    if os.path.exists(full_path):
-                        os.remove(full_path)
-                        print(f"Deleted old partner logo: {full_path}")
-                except Exception as e:
-                    print(f"Failed to delete old file {full_path}: {e}")
+                publish(self.repo.db, UploadDiscarded(old_logo_url))
 
         updated_partner = partner_repo.update(partner_id, **kwargs)
         if not updated_partner:
@@ -506,14 +471,7 @@ class AdminService:
             raise HTTPException(status_code=404, detail="Partner not found")
 
         if partner.logo_url and partner.logo_url.startswith('/uploads/'):
-            file_path = partner.logo_url.lstrip('/')
-            full_path = os.path.join(os.getcwd(), file_path)
-            try:
-                if os.path.exists(full_path):
-                    os.remove(full_path)
-                    print(f"Deleted file: {full_path}")
-            except Exception as e:
-                print(f"Failed to delete file {full_path}: {e}")
+            publish(self.repo.db, UploadDiscarded(partner.logo_url))
 
         success = partner_repo.delete(partner_id)
         if not success:
@@ -0,0 +1,158 @@
+"""
+Runtime settings from saga.app_settings (e.g. guest_event_rate).
+
+Every worker keeps one decoded snapshot of the whole table in memory. Readers
+get it through the `RuntimeSettings` dependency (core.dependencies), which
+costs no query while the snapshot is fresh. At most every
+SETTINGS_VERSION_CHECK_SECONDS a reader compares the snapshot's version with
+saga.data_version('app_settings') — a single-row PK read, the same versions
+core.response_cache uses — and reloads only if a setting changed. The version
+is bumped by a trigger on app_settings (migrations/020_app_settings_data_version.sql),
+so edits from other workers or from psql are picked up within one check
+interval, and an admin update through this service is visible on its own
+worker immediately.
+
+Guest registration prices through it (routers/registrations.py).
+
+Values are stored as text and decoded by SETTING_TYPES; unknown keys are
+served as strings.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.response_cache import table_versions
+from models.app_setting import AppSetting
+
+SETTINGS_VERSION_CHECK_SECONDS = float(os.getenv("SETTINGS_VERSION_CHECK_SECONDS", "5"))
+
+
+def _decode_decimal(raw: str) -> Decimal:
+    try:
+        return Decimal(raw.strip())
+    except InvalidOperation:
+        raise ValueError(f"not a number: {raw!r}") from None
+
+
+# Known keys and their decoders. Add a key here to have it validated on save.
+SETTING_TYPES: dict[str, Callable[[str], Any]] = {
+    "guest_event_rate": _decode_decimal,
+}
+
+
+def decode(key: str, raw: str) -> Any:
+    """Decode a stored value for `key`. Raises ValueError if it doesn't parse."""
+    decoder = SETTING_TYPES.get(key, str)
+    try:
+        return decoder(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid value for setting '{key}': {exc}") from None
+
+
+class AppSettings:
+    """An immutable, decoded snapshot of every app setting."""
+
+    def __init__(self, values: dict[str, Any], version: int):
+        self._values = values
+        self.version = version
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def as_dict(self) -> dict[str, Any]:
+        return dict(self._values)
+
+    @property
+    def guest_event_rate(self) -> Optional[Decimal]:
+        """Site-wide guest price per event. 0 (the seeded value) or unset means each event's guest_price."""
+        return self._values.get("guest_event_rate")
+
+
+class _SettingsCache:
+    def __init__(self) -> None:
+        self._lock       = threading.Lock()
+        self._snapshot:  Optional[AppSettings] = None
+        self._checked_at = 0.0
+
+    def _fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._checked_at < SETTINGS_VERSION_CHECK_SECONDS
+        )
+
+    def get(self, db: Session) -> AppSettings:
+        if self._fresh():
+            return self._snapshot
+        with self._lock:
+            if self._fresh():
+                return self._snapshot
+            # Version first, rows second: a write landing in between leaves us
+            # with newer rows under an older version, which the next check fixes.
+            version = table_versions(db, ("app_settings",))[0] or 0
+            if self._snapshot is None or self._snapshot.version != version:
+                rows = db.execute(select(AppSetting.key, AppSetting.value)).all()
+                values = {}
+                for key, raw in rows:
+                    try:
+                        values[key] = decode(key, raw)
+                    except ValueError:
+                        values[key] = raw  # hand-edited garbage shouldn't take the site down
+                self._snapshot = AppSettings(values, version)
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Force a version check on the next read."""
+        self._checked_at = 0.0
+
+
+_cache = _SettingsCache()
+
+
+def cached_settings(db: Session) -> AppSettings:
+    return _cache.get(db)
+
+
+def invalidate_settings_cache() -> None:
+    _cache.invalidate()
+
+
+class AppSettingsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def list_settings(self) -> list[AppSetting]:
+        return list(self.db.execute(select(AppSetting).order_by(AppSetting.key)).scalars().all())
+
+    def update_setting(self, key: str, value: str, user_id: Optional[int] = None) -> AppSetting:
+        try:
+            decode(key, value)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+        now = datetime.now()
+        stmt = pg_insert(AppSetting).values(key=key, value=value, updated_at=now, updated_by=user_id)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AppSetting.key],
+            set_={"value": stmt.excluded.value, "updated_at": now, "updated_by": user_id},
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+        invalidate_settings_cache()
+        return self.db.get(AppSetting, key, populate_existing=True)
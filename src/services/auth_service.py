@@ -1,15 +1,15 @@
 from __future__ import annotations
 import secrets
 from datetime import timezone, datetime, timedelta
+from functools import lru_cache
 
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from core.config import settings
 from models.user import User, UserAccount
 from repositories.auth_repository import AuthRepository
+from services.email_templates import get_templates
 from schemas.auth import (
     ForgotPasswordRequest,
     LoginRequest,
@@ -22,24 +22,34 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# passlib builds its handler registry on import (~12 ms), so it's loaded by the first login or signup
+@lru_cache
+def _pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
+# jose (and the cryptography backends it loads) is imported on first use to keep startup fast
 def create_access_token(user_id: int, token_version: int) -> str:
+    from jose import jwt
+
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {"sub": str(user_id), "exp": expire, "token_version": token_version}
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def decode_access_token(token: str) -> TokenPayload:
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id = payload.get("sub")
@@ -178,27 +188,14 @@ class AuthService:
 
     def _send_reset_email(self, to_email: str, reset_link: str):
         """Send password reset email via SMTP."""
-
+        email = get_templates().render("password_reset", reset_link=reset_link)
 
         msg = MIMEMultipart("alternative")
-        msg["Subject"] = "Password Reset Request"
+        msg["Subject"] = email.subject
         msg["From"] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL}>"
         msg["To"] = to_email
-
-        # Create email body
-        text = f"Click the link to reset your password: {reset_link}\n\nThis link expires in 1 hour."
-        html = f"""
-        <html>
-        <body>
-            <p>Click the link below to reset your password:</p>
-            <p><a href="{reset_link}">Reset Password</a></p>
-            <p>This link expires in 1 hour.</p>
-        </body>
-        </html>
-        """
-
-        msg.attach(MIMEText(text, "plain"))
-        msg.attach(MIMEText(html, "html"))
+        msg.attach(MIMEText(email.text, "plain"))
+        msg.attach(MIMEText(email.html, "html"))
 
         # Send email with proper TLS/SSL handling
         try:
@@ -0,0 +1,277 @@
+"""
+Admin broadcast emails (schedule changes, rain-outs, renewal nudges).
+
+An admin writes a subject and message for one audience:
+
+  members       every member with a login
+  event_guests  guests holding a paid or pending registration for `event_id`
+  unrenewed     members whose `season_year` membership is still pending
+
+Each address gets one email. The send runs in the background:
+
+  - recipients stream from a server-side cursor (stream_results) on a
+    connection of its own, in address order, BROADCAST_BATCH_SIZE at a time;
+  - each batch is rendered with one render_batch call and sent over an
+    SmtpPool of SMTP_POOL_SIZE connections by as many threads;
+  - a Throttle spaces sends BROADCAST_MESSAGES_PER_SECOND apart across the
+    pool, so 5,000 recipients take about eight minutes at the default rate
+    and the relay never sees a burst.
+
+The admin request returns 202 at once. While it runs, a broadcast holds one
+background thread plus its senders, the streaming connection, and a session
+connection for one short progress transaction per batch — nothing a
+concurrent API request waits on.
+
+Progress (sent, failed and cursor_email, the last address of the last
+finished batch) is committed after every batch. As with bulk refund jobs, a
+lease (status + updated_at) keeps two workers off one broadcast, and
+starting an interrupted or crashed broadcast again resumes after
+cursor_email. A crash mid-batch re-sends at most that batch.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models.broadcast import Broadcast
+from models.event import Event
+from services.email_service import SMTP_POOL_SIZE, SmtpPool
+from services.email_templates import get_templates
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_BATCH_SIZE          = int(os.getenv("BROADCAST_BATCH_SIZE", "200"))
+BROADCAST_MESSAGES_PER_SECOND = float(os.getenv("BROADCAST_MESSAGES_PER_SECOND", "10"))
+BROADCAST_LEASE_SECONDS       = int(os.getenv("BROADCAST_LEASE_SECONDS", "300"))
+
+# One row per address: (key, email, first_name), ordered by key = lower(email).
+# `after` is the resume point; '' sorts before every address.
+_AUDIENCES = {
+    "members": """
+        SELECT DISTINCT ON (lower(a.email)) lower(a.email) AS key, a.email, u.first_name
+        FROM saga.user_account a
+        JOIN saga."user" u ON u.id = a.user_id
+        WHERE lower(a.email) > :after
+        ORDER BY lower(a.email), a.id
+    """,
+    "event_guests": """
+        SELECT DISTINCT ON (lower(COALESCE(r.email, g.email)))
+               lower(COALESCE(r.email, g.email)) AS key, COALESCE(r.email, g.email) AS email, g.first_name
+        FROM saga.event_registration r
+        JOIN saga.guest g ON g.id = r.guest_id
+        WHERE r.event_id = :event_id AND r.payment_status IN ('paid', 'pending')
+          AND lower(COALESCE(r.email, g.email)) > :after
+        ORDER BY lower(COALESCE(r.email, g.email)), r.id
+    """,
+    "unrenewed": """
+        SELECT DISTINCT ON (lower(a.email)) lower(a.email) AS key, a.email, u.first_name
+        FROM saga.member_memberships m
+        JOIN saga."user" u ON u.id = m.user_id
+        JOIN saga.user_account a ON a.user_id = u.id
+        WHERE m.season_year = :season_year AND m.status = 'pending'
+          AND lower(a.email) > :after
+        ORDER BY lower(a.email), a.id
+    """,
+}
+
+AUDIENCES = tuple(_AUDIENCES)
+
+
+class Throttle:
+    """Spaces wait() returns 1/per_second apart, across threads. per_second <= 0 disables it."""
+
+    def __init__(
+        self,
+        per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.interval = 1 / per_second if per_second > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = self._clock()
+            # Time spent idle isn't banked: the next send is never earlier than now
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class BroadcastService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Lifecycle ───────────────────────────────────────────────────────────────
+
+    def start(
+        self,
+        audience:     str,
+        subject:      str,
+        message:      str,
+        requested_by: str,
+        event_id:     Optional[int] = None,
+        season_year:  Optional[int] = None,
+    ) -> Broadcast:
+        """Record a broadcast and count its recipients; run() sends it."""
+        if audience not in _AUDIENCES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown audience '{audience}'")
+        if audience == "event_guests":
+            if event_id is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="event_id is required")
+            if not self.db.get(Event, event_id):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+        else:
+            event_id = None
+        if audience == "unrenewed":
+            season_year = season_year or date.today().year
+        else:
+            season_year = None
+
+        broadcast = Broadcast(
+            audience=audience,
+            event_id=event_id,
+            season_year=season_year,
+            subject=subject,
+            message=message,
+            requested_by=requested_by,
+            status="pending",
+        )
+        self.db.add(broadcast)
+        self.db.flush()
+
+        broadcast.total = self.db.execute(
+            text(f"SELECT count(*) FROM ({_AUDIENCES[audience]}) recipients"),
+            self._params(broadcast),
+        ).scalar()
+        if broadcast.total == 0:
+            broadcast.status = "completed"
+            broadcast.finished_at = datetime.now()
+        self.db.commit()
+        self.db.refresh(broadcast)
+        return broadcast
+
+    def get(self, broadcast_id: int) -> Broadcast:
+        broadcast = self.db.get(Broadcast, broadcast_id)
+        if not broadcast:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Broadcast not found")
+        return broadcast
+
+    @staticmethod
+    def _params(broadcast: Broadcast) -> dict:
+        return {
+            "after": broadcast.cursor_email or "",
+            "event_id": broadcast.event_id,
+            "season_year": broadcast.season_year,
+        }
+
+    # ── Sending ─────────────────────────────────────────────────────────────────
+
+    def _claim(self, broadcast_id: int) -> bool:
+        """Take the broadcast's lease unless a live worker holds it."""
+        claimed = self.db.execute(
+            text("""
+                UPDATE saga.broadcast
+                SET status = 'running', updated_at = now()
+                WHERE id = :id
+                  AND status <> 'completed'
+                  AND (status <> 'running' OR updated_at < now() - make_interval(secs => :lease))
+                RETURNING id
+            """),
+            {"id": broadcast_id, "lease": BROADCAST_LEASE_SECONDS},
+        ).scalar()
+        self.db.commit()
+        return claimed is not None
+
+    def _record(self, broadcast_id: int, sent: int, failed: int, cursor_email: str) -> None:
+        self.db.execute(
+            text("""
+                UPDATE saga.broadcast
+                SET sent = sent + :sent, failed = failed + :failed,
+                    cursor_email = :cursor_email, updated_at = now()
+                WHERE id = :id
+            """),
+            {"id": broadcast_id, "sent": sent, "failed": failed, "cursor_email": cursor_email},
+        )
+        self.db.commit()
+
+    def run(
+        self,
+        broadcast_id:        int,
+        messages_per_second: float = BROADCAST_MESSAGES_PER_SECOND,
+        batch_size:          int = BROADCAST_BATCH_SIZE,
+        connections:         int = SMTP_POOL_SIZE,
+    ) -> Broadcast:
+        if not self._claim(broadcast_id):
+            logger.info("Broadcast %s is completed or running elsewhere", broadcast_id)
+            return self.get(broadcast_id)
+
+        broadcast = self.get(broadcast_id)
+        query, params = text(_AUDIENCES[broadcast.audience]), self._params(broadcast)
+        subject, message = broadcast.subject, broadcast.message
+        throttle = Throttle(messages_per_second)
+        templates = get_templates()
+
+        def send(pool: SmtpPool, to_email: str, email) -> bool:
+            throttle.wait()
+            return pool.send(to_email, email.subject, email.text, email.html)
+
+        try:
+            with (
+                self.db.get_bind().connect() as conn,
+                SmtpPool(size=connections) as pool,
+                ThreadPoolExecutor(max_workers=connections, thread_name_prefix="broadcast") as executor,
+            ):
+                recipients = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query, params)
+                for rows in recipients.partitions(batch_size):
+                    emails = templates.render_batch(
+                        "broadcast",
+                        ({"first_name": row.first_name} for row in rows),
+                        subject=subject,
+                        message=message,
+                    )
+                    results = list(executor.map(send, [pool] * len(rows), [row.email for row in rows], emails))
+                    sent = sum(results)
+                    self._record(broadcast_id, sent, len(rows) - sent, rows[-1].key)
+
+            broadcast = self.get(broadcast_id)
+            broadcast.status = "completed"
+            broadcast.finished_at = datetime.now()
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            broadcast = self.get(broadcast_id)
+            broadcast.status = "interrupted"
+            broadcast.last_error = str(exc)
+            self.db.commit()
+            logger.exception("Broadcast %s interrupted; start it again to resume", broadcast_id)
+
+        self.db.refresh(broadcast)
+        logger.info(
+            "Broadcast %s: status=%s sent=%s failed=%s total=%s",
+            broadcast.id, broadcast.status, broadcast.sent, broadcast.failed, broadcast.total,
+        )
+        return broadcast
+
+
+def run_in_background(broadcast_id: int) -> None:
+    """BackgroundTasks entry point — owns its own session, off the request's."""
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        BroadcastService(db).run(broadcast_id)
@@ -0,0 +1,181 @@
+"""
+iCalendar (RFC 5545) feeds for calendar subscriptions.
+
+  GET /api/events/calendar.ics          — every event
+  GET /api/events/calendar/{token}.ics  — the events one member is registered for
+
+Feeds are rendered once and served from core.response_cache with an ETag, so
+a calendar client polling every few minutes gets a 304 after a couple of
+primary-key and index reads. The public feed is keyed by
+saga.data_version('event'), bumped only when a calendar-visible column of
+saga.event changes (migrations/014_event_calendar_version.sql). A member's
+feed is keyed by that version plus the ids of the events they hold a seat
+for, so a new registration re-renders only that member's feed.
+
+Calendar apps can't send a bearer token, so a member's feed URL carries a
+signed token (user id + HMAC with SECRET_KEY) from
+GET /api/events/calendar/subscription.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+
+from fastapi import Request, Response
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.response_cache import cached_response, table_versions
+from models.event import Event
+
+CALENDAR_TIMEZONE        = os.getenv("CALENDAR_TIMEZONE", "America/New_York")
+CALENDAR_EVENT_HOURS     = float(os.getenv("CALENDAR_EVENT_HOURS", "5"))
+CALENDAR_REFRESH_MINUTES = int(os.getenv("CALENDAR_REFRESH_MINUTES", "60"))
+CALENDAR_MAX_AGE         = int(os.getenv("CALENDAR_MAX_AGE", "300"))
+
+ICS_MEDIA_TYPE = "text/calendar"
+
+
+# ── Rendering ───────────────────────────────────────────────────────────────────
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> bytes:
+    """Encode a content line, folded at 75 octets without splitting a UTF-8 character."""
+    data = line.encode()
+    parts, start, limit = [], 0, 75
+    while len(data) - start > limit:
+        end = start + limit
+        while data[end] & 0xC0 == 0x80:  # continuation byte
+            end -= 1
+        parts.append(data[start:end])
+        start, limit = end, 74  # continuation lines start with a space
+    parts.append(data[start:])
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _utc(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _vevent(event: Event, stamp: str, uid_host: str) -> list[str]:
+    start = datetime.combine(event.date, event.start_time, tzinfo=ZoneInfo(CALENDAR_TIMEZONE))
+    end = start + timedelta(hours=CALENDAR_EVENT_HOURS)
+    location = f"{event.golf_course}, {event.township}, {event.state} {event.zipcode}"
+    description = (
+        f"Members ${event.member_price:.2f} · Guests ${event.guest_price:.2f}\n"
+        f"{settings.FRONTEND_URL}/events/{event.id}/register"
+    )
+    return [
+        "BEGIN:VEVENT",
+        f"UID:event-{event.id}@{uid_host}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{_utc(start)}",
+        f"DTEND:{_utc(end)}",
+        f"SUMMARY:{escape_text(f'SAGA Golf — {event.golf_course}')}",
+        f"LOCATION:{escape_text(location)}",
+        f"DESCRIPTION:{escape_text(description)}",
+        f"URL:{settings.FRONTEND_URL}/events/{event.id}/register",
+        "END:VEVENT",
+    ]
+
+
+def render_calendar(name: str, events: Iterable[Event]) -> bytes:
+    stamp = _utc(datetime.now(timezone.utc))
+    uid_host = urlsplit(settings.FRONTEND_URL).hostname or "saga-golf"
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Saga Golf//Events//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:PT{CALENDAR_REFRESH_MINUTES}M",
+        f"X-PUBLISHED-TTL:PT{CALENDAR_REFRESH_MINUTES}M",
+    ]
+    for event in events:
+        lines.extend(_vevent(event, stamp, uid_host))
+    lines.append("END:VCALENDAR")
+    return b"".join(fold_line(line) for line in lines)
+
+
+# ── Feed tokens ─────────────────────────────────────────────────────────────────
+
+def _signature(user_id: int) -> str:
+    digest = hmac.new(settings.SECRET_KEY.encode(), f"calendar:{user_id}".encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:18]).decode()
+
+
+def feed_token(user_id: int) -> str:
+    return f"{user_id}-{_signature(user_id)}"
+
+
+def user_id_from_token(token: str) -> Optional[int]:
+    user_id, _, signature = token.partition("-")
+    if not user_id.isdigit() or not hmac.compare_digest(signature, _signature(int(user_id))):
+        return None
+    return int(user_id)
+
+
+# ── Feeds ───────────────────────────────────────────────────────────────────────
+
+class CalendarService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _events(self, event_ids: Optional[list[int]] = None) -> list[Event]:
+        stmt = select(Event).order_by(Event.date, Event.start_time, Event.id)
+        if event_ids is not None:
+            stmt = stmt.where(Event.id.in_(event_ids))
+        return list(self.db.execute(stmt).scalars().all())
+
+    def _registered_event_ids(self, user_id: int) -> list[int]:
+        return list(
+            self.db.execute(
+                text("""
+                    SELECT DISTINCT r.event_id
+                    FROM saga.event_registration r
+                    JOIN saga.user_account a ON a.id = r.user_id
+                    WHERE a.user_id = :user_id AND r.payment_status IN ('paid', 'pending')
+                    ORDER BY r.event_id
+                """),
+                {"user_id": user_id},
+            ).scalars().all()
+        )
+
+    def events_feed(self, request: Request) -> Response:
+        return cached_response(
+            "calendar:events",
+            table_versions(self.db, ("event",)),
+            lambda: render_calendar("SAGA Golf Events", self._events()),
+            request,
+            media_type=ICS_MEDIA_TYPE,
+            cache_control=f"public, max-age={CALENDAR_MAX_AGE}",
+        )
+
+    def user_feed(self, user_id: int, request: Request) -> Response:
+        version = table_versions(self.db, ("event",))
+        event_ids = self._registered_event_ids(user_id)
+        return cached_response(
+            f"calendar:user:{user_id}",
+            (*version, *event_ids),
+            lambda: render_calendar("My SAGA Golf Events", self._events(event_ids)),
+            request,
+            media_type=ICS_MEDIA_TYPE,
+            cache_control=f"private, max-age={CALENDAR_MAX_AGE}",
+        )
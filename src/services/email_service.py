@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import logging
+import os
+import queue
 import smtplib
+import threading
 from decimal import Decimal
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
+from services.email_templates import get_templates
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+
 
 class EmailService:
     """Service for sending transactional emails.
@@ -32,8 +38,7 @@ class EmailService:
             )
     """
 
-    def _send_email(self, to_email: str, subject: str, text_body: str, html_body: str) -> bool:
-        """Send an email via SMTP. Returns True on success, False on failure."""
+    def _build_message(self, to_email: str, subject: str, text_body: str, html_body: str) -> MIMEMultipart:
         msg = MIMEMultipart("alternative")
         msg["Subject"] = subject
         msg["From"] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL}>"
@@ -41,18 +46,28 @@ class EmailService:
 
         msg.attach(MIMEText(text_body, "plain"))
         msg.attach(MIMEText(html_body, "html"))
-
-        try:
-            if settings.SMTP_SSL:
-                server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
-            else:
-                server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
+        return msg
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate an SMTP connection."""
+        if settings.SMTP_SSL:
+            server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
+        else:
+            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
+            server.ehlo()
+            if settings.SMTP_TLS:
+                server.starttls()
                 server.ehlo()
-                if settings.SMTP_TLS:
-                    server.starttls()
-                    server.ehlo()
 
-            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        return server
+
+    def _send_email(self, to_email: str, subject: str, text_body: str, html_body: str) -> bool:
+        """Send an email via SMTP. Returns True on success, False on failure."""
+        msg = self._build_message(to_email, subject, text_body, html_body)
+
+        try:
+            server = self._connect()
             server.send_message(msg)
             server.quit()
             logger.info("Email sent successfully to %s: %s", to_email, subject)
@@ -61,6 +76,37 @@ class EmailService:
             logger.exception("Failed to send email to %s: %s", to_email, subject)
             return False
 
+    def send_batch(self, messages: list[tuple[str, str, str, str]]) -> list[bool]:
+        """
+        Send (to_email, subject, text_body, html_body) messages over a single
+        SMTP connection. Returns one success flag per message; a failed
+        recipient doesn't stop the rest of the batch.
+        """
+        results = [False] * len(messages)
+        if not messages:
+            return results
+
+        try:
+            server = self._connect()
+        except Exception:
+            logger.exception("Failed to connect to SMTP for a batch of %d email(s)", len(messages))
+            return results
+
+        try:
+            for index, (to_email, subject, text_body, html_body) in enumerate(messages):
+                try:
+                    server.send_message(self._build_message(to_email, subject, text_body, html_body))
+                    results[index] = True
+                except Exception:
+                    logger.exception("Failed to send email to %s: %s", to_email, subject)
+        finally:
+            try:
+                server.quit()
+            except Exception:
+                pass
+        logger.info("Email batch sent: %d/%d delivered", sum(results), len(messages))
+        return results
+
     def send_event_registration_receipt(
         self,
         to_email: str,
@@ -71,43 +117,15 @@ class EmailService:
         registration_id: int,
     ) -> bool:
         """Send event registration confirmation receipt."""
-        subject = f"SAGA Golf — Registration Confirmation for {event_name}"
-
-        text_body = (
-            f"Registration Confirmation\n\n"
-            f"Event: {event_name}\n"
-            f"Date: {event_date}\n"
-            f"Amount Charged: ${amount:.2f}\n"
-            f"Card: ****{card_last_four}\n"
-            f"Registration ID: {registration_id}\n\n"
-            f"Thank you for registering with SAGA Golf!"
+        email = get_templates().render(
+            "registration_receipt",
+            event_name=event_name,
+            event_date=event_date,
+            amount=amount,
+            card_last_four=card_last_four,
+            registration_id=registration_id,
         )
-
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <div style="background-color: #2d5016; color: white; padding: 20px; text-align: center;">
-                <h1 style="margin: 0;">SAGA Golf</h1>
-            </div>
-            <div style="padding: 20px; background-color: #f9f9f9;">
-                <h2>Registration Confirmation</h2>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr><td style="padding: 8px; font-weight: bold;">Event</td><td style="padding: 8px;">{event_name}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Date</td><td style="padding: 8px;">{event_date}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Amount Charged</td><td style="padding: 8px;">${amount:.2f}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Card</td><td style="padding: 8px;">****{card_last_four}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Registration ID</td><td style="padding: 8px;">{registration_id}</td></tr>
-                </table>
-                <p style="margin-top: 20px;">Thank you for registering with SAGA Golf!</p>
-            </div>
-            <div style="padding: 10px; text-align: center; color: #666; font-size: 12px;">
-                <p>SAGA Golf — A Non-Profit Golf Organization</p>
-            </div>
-        </body>
-        </html>
-        """
-
-        return self._send_email(to_email, subject, text_body, html_body)
+        return self._send_email(to_email, email.subject, email.text, email.html)
 
     def send_membership_receipt(
         self,
@@ -118,38 +136,106 @@ class EmailService:
         card_last_four: str,
     ) -> bool:
         """Send membership payment confirmation receipt."""
-        subject = "SAGA Golf — Membership Payment Confirmation"
-
-        text_body = (
-            f"Membership Payment Confirmation\n\n"
-            f"Tier: {tier_name}\n"
-            f"Season: {season_year}\n"
-            f"Amount Charged: ${amount:.2f}\n"
-            f"Card: ****{card_last_four}\n\n"
-            f"Thank you for your membership with SAGA Golf!"
+        email = get_templates().render(
+            "membership_receipt",
+            tier_name=tier_name,
+            season_year=season_year,
+            amount=amount,
+            card_last_four=card_last_four,
         )
+        return self._send_email(to_email, email.subject, email.text, email.html)
+
+    def send_waitlist_offer(
+        self,
+        to_email: str,
+        first_name: str,
+        event_name: str,
+        event_date: str,
+        expires_at: str,
+        claim_url: str,
+    ) -> bool:
+        """Tell the next person on the waitlist a seat is being held for them."""
+        email = get_templates().render(
+            "waitlist_offer",
+            first_name=first_name,
+            event_name=event_name,
+            event_date=event_date,
+            expires_at=expires_at,
+            claim_url=claim_url,
+        )
+        return self._send_email(to_email, email.subject, email.text, email.html)
+
+    @staticmethod
+    def render_membership_renewal(
+        first_name: str,
+        tier_name: str,
+        season_year: int,
+        amount: Decimal,
+        renew_url: str,
+    ) -> tuple[str, str, str]:
+        """Subject, text and HTML for a season renewal reminder (sent in batches)."""
+        email = get_templates().render(
+            "membership_renewal",
+            first_name=first_name,
+            tier_name=tier_name,
+            season_year=season_year,
+            amount=amount,
+            renew_url=renew_url,
+        )
+        return email.subject, email.text, email.html
+
+
+class SmtpPool:
+    """
+    Up to `size` authenticated SMTP connections, opened on demand and shared
+    by any number of sending threads. A connection that fails a send is
+    dropped; the next send opens a fresh one.
+
+        with SmtpPool() as pool:
+            ok = pool.send(to_email, subject, text_body, html_body)
+    """
+
+    def __init__(self, email_service: EmailService | None = None, size: int = SMTP_POOL_SIZE):
+        self._email = email_service or EmailService()
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+
+    def send(self, to_email: str, subject: str, text_body: str, html_body: str) -> bool:
+        """Send one message on a pooled connection. Returns False on failure, never raises."""
+        msg = self._email._build_message(to_email, subject, text_body, html_body)
+        with self._slots:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                server = None
+            try:
+                if server is None:
+                    server = self._email._connect()
+                server.send_message(msg)
+            except Exception:
+                logger.exception("Failed to send email to %s: %s", to_email, subject)
+                if server is not None:
+                    _close(server)
+                return False
+            self._idle.put(server)
+            return True
+
+    def close(self) -> None:
+        while True:
+            try:
+                _close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def __enter__(self) -> SmtpPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <div style="background-color: #2d5016; color: white; padding: 20px; text-align: center;">
-                <h1 style="margin: 0;">SAGA Golf</h1>
-            </div>
-            <div style="padding: 20px; background-color: #f9f9f9;">
-                <h2>Membership Payment Confirmation</h2>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr><td style="padding: 8px; font-weight: bold;">Membership Tier</td><td style="padding: 8px;">{tier_name}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Season Year</td><td style="padding: 8px;">{season_year}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Amount Charged</td><td style="padding: 8px;">${amount:.2f}</td></tr>
-                    <tr><td style="padding: 8px; font-weight: bold;">Card</td><td style="padding: 8px;">****{card_last_four}</td></tr>
-                </table>
-                <p style="margin-top: 20px;">Thank you for your membership with SAGA Golf!</p>
-            </div>
-            <div style="padding: 10px; text-align: center; color: #666; font-size: 12px;">
-                <p>SAGA Golf — A Non-Profit Golf Organization</p>
-            </div>
-        </body>
-        </html>
-        """
 
-        return self._send_email(to_email, subject, text_body, html_body)
+def _close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        pass
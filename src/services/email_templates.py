@@ -0,0 +1,105 @@
+"""
+Email templates (src/templates/email), compiled once per worker.
+
+Each email is a directory holding `subject.txt`, `body.txt` and `body.html`.
+HTML bodies extend `layout.html` and are autoescaped, so names, subjects and
+messages typed by users can't inject markup. Text parts are not escaped.
+Missing variables raise instead of rendering blanks.
+
+    templates = get_templates()
+    email = templates.render("registration_receipt", event_name=..., amount=...)
+    emails = templates.render_batch("membership_renewal", rows, season_year=2027, renew_url=url)
+
+The app lifespan calls get_templates() so every template is compiled before
+the first request. jinja2 (shipped with fastapi[all]) is imported only then,
+so importing the app stays cheap. `python -m benchmarks.email_templates`
+times 5,000 renders.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+_PARTS = ("subject.txt", "body.txt", "body.html")
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    text:    str
+    html:    str
+
+
+def _money(amount: Any) -> str:
+    return f"${amount:.2f}"
+
+
+class EmailTemplates:
+    """Every email under `directory`, compiled up front."""
+
+    def __init__(self, directory: Path = TEMPLATES_DIR):
+        from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+
+        env = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(["html"]),
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+        )
+        env.filters["money"] = _money
+
+        self._emails = {}
+        for email_dir in sorted(p for p in directory.iterdir() if p.is_dir()):
+            self._emails[email_dir.name] = tuple(
+                env.get_template(f"{email_dir.name}/{part}") for part in _PARTS
+            )
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._emails)
+
+    def _parts(self, email: str):
+        try:
+            return self._emails[email]
+        except KeyError:
+            raise KeyError(f"No email template named '{email}'") from None
+
+    def render(self, email: str, /, **context: Any) -> RenderedEmail:
+        return self.render_batch(email, [context])[0]
+
+    def render_batch(
+        self, email: str, contexts: Iterable[Mapping[str, Any]], /, **shared: Any
+    ) -> list[RenderedEmail]:
+        """Render one `email` per context; `shared` values apply to every message."""
+        subject, text, html = self._parts(email)
+        rendered = []
+        for context in contexts:
+            values = {**shared, **context}
+            rendered.append(RenderedEmail(
+                # One line, whatever the template or the data: it becomes a header
+                subject=" ".join(subject.render(values).split()),
+                text=text.render(values),
+                html=html.render(values),
+            ))
+        return rendered
+
+
+_templates: Optional[EmailTemplates] = None
+_lock = threading.Lock()
+
+
+def get_templates() -> EmailTemplates:
+    """The process-wide compiled templates, built on first call."""
+    global _templates
+    if _templates is None:
+        with _lock:
+            if _templates is None:
+                _templates = EmailTemplates()
+    return _templates
@@ -0,0 +1,70 @@
+"""
+Side effects of committed changes, subscribed to core.events.
+
+  RegistrationPaid   email the registrant their receipt
+  EventUpdated       re-render this worker's public caches (calendar feed,
+                     lists) now rather than on the next warm_public_cache run
+  UploadDiscarded    delete the replaced or orphaned file from uploads/
+
+Imported by main.py, which registers them. Each runs in the core.events
+thread pool after the commit, with its own session where it needs one.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from core.events import EventUpdated, RegistrationPaid, UploadDiscarded, subscribe
+
+logger = logging.getLogger(__name__)
+
+_RECEIPT = text("""
+    SELECT r.id, r.amount_paid, r.card_last_four, e.golf_course, e.date,
+           COALESCE(a.email, r.email, g.email) AS email
+    FROM saga.event_registration r
+    JOIN saga.event e ON e.id = r.event_id
+    LEFT JOIN saga.user_account a ON a.id = r.user_id
+    LEFT JOIN saga.guest g ON g.id = r.guest_id
+    WHERE r.id = :id AND r.payment_status = 'paid'
+""")
+
+
+@subscribe(RegistrationPaid)
+def send_registration_receipt(event: RegistrationPaid) -> None:
+    from core.database import SessionLocal
+    from services.email_service import EmailService
+
+    with SessionLocal() as db:
+        row = db.execute(_RECEIPT, {"id": event.registration_id}).one_or_none()
+    if row is None or not row.email:
+        logger.warning("No receipt sent for registration_id=%s: not paid or no address", event.registration_id)
+        return
+    EmailService().send_event_registration_receipt(
+        to_email=row.email,
+        event_name=row.golf_course,
+        event_date=row.date.strftime("%A, %B %-d, %Y"),
+        amount=Decimal(str(row.amount_paid or 0)),
+        card_last_four=row.card_last_four or "",
+        registration_id=row.id,
+    )
+
+
+@subscribe(EventUpdated)
+def refresh_public_cache(event: EventUpdated) -> None:
+    from services.scheduled_jobs import warm_public_cache
+
+    warm_public_cache()
+
+
+@subscribe(UploadDiscarded)
+def remove_upload(event: UploadDiscarded) -> None:
+    full_path = os.path.join(os.getcwd(), event.url.lstrip("/"))
+    try:
+        if os.path.exists(full_path):
+            os.remove(full_path)
+            logger.info("Deleted upload: %s", full_path)
+    except OSError:
+        logger.exception("Failed to delete upload %s", full_path)
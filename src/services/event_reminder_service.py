@@ -0,0 +1,184 @@
+"""
+Reminder emails before each event (by default 7 days and 1 day ahead).
+
+For each reminder window one query finds every paid registration whose event
+starts inside it, across all events, so a weekend with several events is one
+pass. The query range-scans idx_event_starts_at and skips registrations
+already reminded via the saga.event_reminder_sent primary key
+(migrations/017_event_reminders.sql).
+
+Windows don't overlap: with the defaults the 7-day reminder covers events
+starting in (1 day, 7 days] and the 1-day reminder (now, 1 day], so a run
+that was missed catches up on the next one. A registration made after a
+window opened skips that reminder; its receipt is more recent.
+
+Due rows go out in batches, like renewal reminders: claim the batch by
+inserting its markers (ON CONFLICT DO NOTHING, so overlapping runs can't
+double-send), render it with one render_batch call, send it over one SMTP
+connection, and delete the markers of failed sends so the next run retries
+them.
+
+Runs every 15 minutes from the scheduler (services/scheduled_jobs.py), or:
+    python -m services.event_reminder_service
+"""
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from services.calendar_service import CALENDAR_TIMEZONE
+from services.email_service import EmailService
+from services.email_templates import get_templates
+
+logger = logging.getLogger(__name__)
+
+EVENT_REMINDER_DAYS       = sorted({int(d) for d in os.getenv("EVENT_REMINDER_DAYS", "7,1").split(",")}, reverse=True)
+EVENT_REMINDER_BATCH_SIZE = int(os.getenv("EVENT_REMINDER_BATCH_SIZE", "100"))
+
+# event_registration.user_id is the user_account id; the profile hangs off the account
+_DUE = text("""
+    SELECT r.id, e.id AS event_id, e.golf_course, e.township, e.state, e.zipcode,
+           e.date, e.start_time, e.date + e.start_time AS starts_at,
+           COALESCE(a.email, r.email, g.email) AS email,
+           COALESCE(u.first_name, g.first_name) AS first_name
+    FROM saga.event e
+    JOIN saga.event_registration r ON r.event_id = e.id
+    LEFT JOIN saga.user_account a ON a.id = r.user_id
+    LEFT JOIN saga."user" u ON u.id = a.user_id
+    LEFT JOIN saga.guest g ON g.id = r.guest_id
+    WHERE e.date + e.start_time > :after
+      AND e.date + e.start_time <= :until
+      AND r.payment_status = 'paid'
+      AND r.created_at < e.date + e.start_time - make_interval(days => :days)
+      AND NOT EXISTS (
+          SELECT 1 FROM saga.event_reminder_sent s
+          WHERE s.registration_id = r.id AND s.reminder = :reminder
+      )
+    ORDER BY e.date, e.start_time, r.id
+""")
+
+
+def reminder_windows(now: datetime, days: list[int] = EVENT_REMINDER_DAYS) -> list[tuple[str, int, datetime, datetime]]:
+    """(reminder, days, after, until) per window, longest lead first; each ends where the next begins."""
+    windows = []
+    for lead, shorter in zip(days, [*days[1:], 0], strict=True):
+        windows.append((f"{lead}d", lead, now + timedelta(days=shorter), now + timedelta(days=lead)))
+    return windows
+
+
+def _when(starts_at: datetime, now: datetime) -> str:
+    days = (starts_at.date() - now.date()).days
+    if days <= 0:
+        return "today"
+    if days == 1:
+        return "tomorrow"
+    return f"in {days} days"
+
+
+class EventReminderService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _claim(self, reminder: str, registration_ids: list[int]) -> set[int]:
+        """Mark the batch as reminded; returns the ids this run claimed. Commits."""
+        claimed = self.db.execute(
+            text("""
+                INSERT INTO saga.event_reminder_sent (registration_id, reminder)
+                SELECT unnest(CAST(:ids AS int[])), :reminder
+                ON CONFLICT DO NOTHING
+                RETURNING registration_id
+            """),
+            {"ids": registration_ids, "reminder": reminder},
+        ).scalars().all()
+        self.db.commit()
+        return set(claimed)
+
+    def _unclaim(self, reminder: str, registration_ids: list[int]) -> None:
+        self.db.execute(
+            text("""
+                DELETE FROM saga.event_reminder_sent
+                WHERE reminder = :reminder AND registration_id = ANY(CAST(:ids AS int[]))
+            """),
+            {"ids": registration_ids, "reminder": reminder},
+        )
+        self.db.commit()
+
+    def send_due(
+        self,
+        now: datetime | None = None,
+        batch_size: int = EVENT_REMINDER_BATCH_SIZE,
+    ) -> dict[str, tuple[int, int]]:
+        """Send every due reminder. Returns {reminder: (sent, failed)}."""
+        # Event dates and tee times are local wall-clock times
+        now = now or datetime.now(ZoneInfo(CALENDAR_TIMEZONE)).replace(tzinfo=None)
+        email_service = EmailService()
+        templates = get_templates()
+        events_url = f"{settings.FRONTEND_URL}/events"
+        results = {}
+
+        for reminder, days, after, until in reminder_windows(now):
+            due = self.db.execute(
+                _DUE, {"after": after, "until": until, "days": days, "reminder": reminder}
+            ).all()
+            self.db.commit()
+            sent = failed = 0
+
+            for start in range(0, len(due), batch_size):
+                claimed = self._claim(reminder, [row.id for row in due[start:start + batch_size]])
+                # Registrations without an address stay marked; there's no one to remind
+                batch = [row for row in due[start:start + batch_size] if row.id in claimed and row.email]
+                emails = templates.render_batch(
+                    "event_reminder",
+                    (
+                        {
+                            "first_name": row.first_name or "golfer",
+                            "golf_course": row.golf_course,
+                            "location": f"{row.golf_course}, {row.township}, {row.state} {row.zipcode}",
+                            "event_date": row.date.strftime("%A, %B %-d, %Y"),
+                            "start_time": row.start_time.strftime("%-I:%M %p"),
+                            "when": _when(row.starts_at, now),
+                        }
+                        for row in batch
+                    ),
+                    events_url=events_url,
+                )
+                delivered = email_service.send_batch(
+                    [(row.email, email.subject, email.text, email.html) for row, email in zip(batch, emails, strict=True)]
+                )
+                batch_failed = [row.id for row, ok in zip(batch, delivered, strict=True) if not ok]
+                if batch_failed:
+                    self._unclaim(reminder, batch_failed)
+                sent += len(batch) - len(batch_failed)
+                failed += len(batch_failed)
+
+            results[reminder] = (sent, failed)
+            logger.info("Event reminders %s: due=%s sent=%s failed=%s", reminder, len(due), sent, failed)
+        return results
+
+
+def send_due_reminders() -> None:
+    """Scheduler entry point — owns its own session."""
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        EventReminderService(db).send_due()
+
+
+def main() -> None:
+    from core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        results = EventReminderService(db).send_due()
+    for reminder, (sent, failed) in results.items():
+        print(f"{reminder} reminders: {sent} sent, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,18 @@
+import logging
+
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from repositories.event_repository import get_events
-from models.event_registration import EventRegistration
+
+logger = logging.getLogger(__name__)
+
 
 def list_events(db: Session):
     events = get_events(db)
-    
-    
+
     result = []
     for event in events:
-        registered_count = db.query(EventRegistration)\
-            .filter(EventRegistration.event_id == event.id)\
-            .count()
-        
         # Create a dict with event data plus registered count
         event_dict = {
             'id': event.id,
@@ -25,9 +25,51 @@ def list_events(db: Session):
             'member_price': float(event.member_price),
             'guest_price': float(event.guest_price),
             'capacity': event.capacity,
-            'registered': registered_count,
+            'registered': event.registered_count,
             'image_url': event.image_url if hasattr(event, 'image_url') else None,
         }
         result.append(event_dict)
-    
-    return result
\ No newline at end of file
+
+    return result
+
+
+def repair_registered_counts(db: Session) -> list[tuple[int, int, int]]:
+    """
+    Recompute Event.registered_count from event_registration and fix any
+    drift (e.g. rows changed while the trigger was disabled).
+    Returns (event_id, stored, actual) for every event that was corrected.
+    """
+    rows = db.execute(
+        text("""
+            WITH actual AS (
+                SELECT e.id, e.registered_count AS stored, count(r.id) AS actual
+                FROM saga.event e
+                LEFT JOIN saga.event_registration r
+                       ON r.event_id = e.id AND r.payment_status IN ('paid', 'pending')
+                GROUP BY e.id
+            )
+            UPDATE saga.event e
+            SET registered_count = a.actual
+            FROM actual a
+            WHERE e.id = a.id AND e.registered_count <> a.actual
+            RETURNING e.id, a.stored, a.actual
+        """)
+    ).all()
+    db.commit()
+
+    for event_id, stored, actual in rows:
+        logger.warning("registered_count drift: event_id=%s stored=%s actual=%s", event_id, stored, actual)
+    return [tuple(row) for row in rows]
+
+
+def main() -> None:
+    from core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        fixed = repair_registered_counts(db)
+    print(f"Repaired registered_count on {len(fixed)} event(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Idempotency for payment-taking endpoints.
+
+Every registration request carries a client-generated idempotency_key, and
+EventRegistration.idempotency_key is unique. Before doing any work a handler:
+
+  1. takes a transaction-scoped Postgres advisory lock on the key, so a
+     concurrent duplicate (double-click) that arrives while the first request
+     is still creating its hold gets 409 immediately instead of a second hold;
+  2. looks the key up and, if a paid registration already exists, replays
+     its response instead of re-running capacity checks and the charge.
+
+The lock only covers phase one: it is released when the hold is committed,
+before the charge goes to North. From then on the stored row answers
+duplicates. While its hold is live (the charge is still in flight) a retry
+gets 409 with Retry-After, once it is paid the retry is replayed, and a
+pending row without a hold is sent to retry-payment.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models.event_registration import EventRegistration
+
+# First key of the two-int advisory lock, so idempotency locks never collide
+# with other advisory locks taken by the app.
+IDEMPOTENCY_LOCK_NAMESPACE = 1001
+
+
+def lock_idempotency_key(db: Session, key: str) -> None:
+    """Claim the key for this transaction or fail fast if another request holds it."""
+    acquired = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:ns, hashtext(:key))"),
+        {"ns": IDEMPOTENCY_LOCK_NAMESPACE, "key": key},
+    ).scalar()
+    if not acquired:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this idempotency key is already in progress.",
+            headers={"Retry-After": "2"},
+        )
+
+
+def find_by_idempotency_key(db: Session, key: str) -> Optional[EventRegistration]:
+    return (
+        db.query(EventRegistration)
+        .filter(EventRegistration.idempotency_key == key)
+        .first()
+    )
+
+
+def ensure_same_request(
+    registration: EventRegistration,
+    event_id:     int,
+    user_id:      Optional[int] = None,
+    email:        Optional[str] = None,
+) -> None:
+    """Reject a key that is being reused for a different registration."""
+    same_owner = (
+        registration.user_id == user_id
+        if user_id is not None
+        else (registration.email or "").lower() == (email or "").lower()
+    )
+    if registration.event_id != event_id or not same_owner:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="This idempotency key was already used for a different registration.",
+        )
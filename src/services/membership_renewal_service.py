@@ -0,0 +1,207 @@
+"""
+Membership season rollover.
+
+  1. roll_over(season)   — one INSERT ... SELECT creates a `pending` membership
+                           for season + 1 for every member paid up in `season`
+                           whose tier is still offered. ON CONFLICT (user_id,
+                           season_year) DO NOTHING makes it safe to re-run.
+  2. send_reminders()    — claims un-notified pending rows in batches, renders a
+                           personalized reminder for each and sends the batch
+                           over one SMTP connection. renewal_notified_at marks
+                           what went out, so a re-run only mails the rest.
+  3. mark_paid(ids)      — one UPDATE for an admin's list of renewals paid
+                           offline (cheque, Zelle).
+
+Run the whole rollover from the command line:
+    python -m services.membership_renewal_service 2026
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from services.email_service import EmailService
+from services.email_templates import get_templates
+
+logger = logging.getLogger(__name__)
+
+RENEWAL_EMAIL_BATCH_SIZE = int(os.getenv("RENEWAL_EMAIL_BATCH_SIZE", "100"))
+
+# A membership that was paid for, online or marked paid by an admin
+PAID_STATUS = "paid"
+
+
+@dataclass
+class RolloverResult:
+    season_year: int
+    next_season: int
+    eligible:    int
+    created:     int
+
+
+class MembershipRenewalService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def roll_over(self, season_year: int) -> RolloverResult:
+        next_season = season_year + 1
+        eligible = self.db.execute(
+            text("""
+                SELECT count(*)
+                FROM saga.member_memberships m
+                JOIN saga.membership_tiers t ON t.id = m.tier_id AND t.is_active
+                WHERE m.season_year = :season AND m.status = :paid
+            """),
+            {"season": season_year, "paid": PAID_STATUS},
+        ).scalar()
+        created = self.db.execute(
+            text("""
+                INSERT INTO saga.member_memberships
+                    (user_id, tier_id, season_year, status, marked_paid_by_admin, created_at, updated_at)
+                SELECT m.user_id, m.tier_id, :next_season, 'pending', false, now(), now()
+                FROM saga.member_memberships m
+                JOIN saga.membership_tiers t ON t.id = m.tier_id AND t.is_active
+                WHERE m.season_year = :season AND m.status = :paid
+                ON CONFLICT (user_id, season_year) DO NOTHING
+            """),
+            {"season": season_year, "next_season": next_season, "paid": PAID_STATUS},
+        ).rowcount
+        self.db.commit()
+
+        logger.info(
+            "Membership rollover %s → %s: eligible=%s created=%s",
+            season_year, next_season, eligible, created,
+        )
+        return RolloverResult(season_year, next_season, eligible, created)
+
+    def _claim_batch(self, season_year: int, batch_size: int, skip: list[int]) -> list:
+        """Stamp the next batch as notified and return who to mail. Commits."""
+        rows = self.db.execute(
+            text("""
+                WITH claimed AS (
+                    UPDATE saga.member_memberships
+                    SET renewal_notified_at = now()
+                    WHERE id IN (
+                        SELECT id FROM saga.member_memberships
+                        WHERE season_year = :season AND status = 'pending'
+                          AND renewal_notified_at IS NULL AND id <> ALL(CAST(:skip AS int[]))
+                        ORDER BY id
+                        LIMIT :batch
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, user_id, tier_id
+                )
+                SELECT c.id, a.email, u.first_name, t.name AS tier_name, t.amount
+                FROM claimed c
+                JOIN saga.membership_tiers t ON t.id = c.tier_id
+                JOIN saga."user" u ON u.id = c.user_id
+                LEFT JOIN saga.user_account a ON a.user_id = u.id
+                ORDER BY c.id
+            """),
+            {"season": season_year, "batch": batch_size, "skip": skip},
+        ).all()
+        self.db.commit()
+        return rows
+
+    def send_reminders(self, season_year: int, batch_size: int = RENEWAL_EMAIL_BATCH_SIZE) -> tuple[int, int]:
+        """
+        Mail every pending, un-notified renewal for `season_year`.
+        Returns (sent, failed). Failed rows are un-stamped so the next run retries them.
+        """
+        email_service = EmailService()
+        renew_url = f"{settings.FRONTEND_URL}/membership"
+        sent, failed = 0, []
+
+        while True:
+            batch = self._claim_batch(season_year, batch_size, failed)
+            if not batch:
+                break
+
+            # Members without a login account have no address; they stay stamped
+            batch = [row for row in batch if row.email]
+            emails = get_templates().render_batch(
+                "membership_renewal",
+                (
+                    {"first_name": row.first_name, "tier_name": row.tier_name, "amount": row.amount}
+                    for row in batch
+                ),
+                season_year=season_year,
+                renew_url=renew_url,
+            )
+            messages = [
+                (row.email, email.subject, email.text, email.html)
+                for row, email in zip(batch, emails, strict=True)
+            ]
+            results = email_service.send_batch(messages)
+
+            batch_failed = [row.id for row, ok in zip(batch, results, strict=True) if not ok]
+            if batch_failed:
+                self.db.execute(
+                    text("""
+                        UPDATE saga.member_memberships SET renewal_notified_at = NULL
+                        WHERE id IN :ids
+                    """).bindparams(bindparam("ids", expanding=True)),
+                    {"ids": batch_failed},
+                )
+                self.db.commit()
+            sent += len(batch) - len(batch_failed)
+            failed.extend(batch_failed)
+
+        logger.info("Renewal reminders for %s: sent=%s failed=%s", season_year, sent, len(failed))
+        return sent, len(failed)
+
+    def mark_paid(self, membership_ids: list[int]) -> list[int]:
+        """Mark pending memberships paid by an admin. Returns the ids that changed."""
+        if not membership_ids:
+            return []
+        updated = self.db.execute(
+            text("""
+                UPDATE saga.member_memberships
+                SET status = :paid, marked_paid_by_admin = true, updated_at = now()
+                WHERE id IN :ids AND status = 'pending'
+                RETURNING id
+            """).bindparams(bindparam("ids", expanding=True)),
+            {"ids": list(set(membership_ids)), "paid": PAID_STATUS},
+        ).scalars().all()
+        self.db.commit()
+        return sorted(updated)
+
+
+def send_reminders_in_background(season_year: int) -> None:
+    """BackgroundTasks entry point — runs after the response with its own session."""
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        try:
+            MembershipRenewalService(db).send_reminders(season_year)
+        except Exception:
+            logger.exception("Renewal reminders failed: season_year=%s", season_year)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from core.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Roll paid memberships over to the next season.")
+    parser.add_argument("season", nargs="?", type=int, default=date.today().year, help="season to renew from")
+    parser.add_argument("--no-email", action="store_true", help="create the renewals without mailing them")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        service = MembershipRenewalService(db)
+        result = service.roll_over(args.season)
+        print(f"Created {result.created} pending {result.next_season} membership(s) from {result.eligible} eligible")
+        if not args.no_email:
+            sent, failed = service.send_reminders(result.next_season)
+            print(f"Sent {sent} renewal reminder(s), {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
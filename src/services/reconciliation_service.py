@@ -0,0 +1,252 @@
+"""
+Payment Reconciliation
+Compares a day's North transactions with our EventRegistration / Payment rows
+and records every discrepancy as a ReconciliationIssue:
+
+  orphan_charge      — North captured money we have no record of
+  orphan_record      — we recorded a paid charge North does not know about
+  amount_mismatch    — both sides know the charge but disagree on the amount
+  unrecorded_void    — North voided it, we still show it as paid
+  unrecorded_refund  — North refunded it, we still show it as paid
+
+Gateway pages are streamed into a temporary, primary-keyed staging table and
+all comparisons are set differences / joins inside Postgres, so memory stays
+bounded by one page no matter how many transactions a season has.
+
+Run nightly (defaults to yesterday):
+    python -m services.reconciliation_service
+    python -m services.reconciliation_service --from 2026-04-01 --to 2026-10-31
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models.reconciliation_issue import ReconciliationIssue
+from schemas.admin import ReconciliationReport
+from services.north_payment_service import NorthTransaction, iter_transactions
+
+logger = logging.getLogger(__name__)
+
+ISSUE_KINDS = (
+    "orphan_charge",
+    "orphan_record",
+    "amount_mismatch",
+    "unrecorded_void",
+    "unrecorded_refund",
+)
+
+
+# Recorded charges of the day: registrations and standalone payments, keyed by
+# the gateway transaction id. A registration belongs to the day its card was
+# charged (paid_at), which after a retry-payment isn't the day it was created.
+_RECORDED_CTE = """
+    WITH recorded AS (
+        SELECT r.transaction_id, r.id AS registration_id, NULL::int AS payment_id,
+               r.amount_paid AS amount, r.payment_status AS status
+        FROM saga.event_registration r
+        WHERE r.transaction_id IS NOT NULL
+          AND r.paid_at >= :day_start AND r.paid_at < :day_end
+        UNION ALL
+        SELECT p.external_reference, p.registration_id, p.id,
+               p.amount, p.status
+        FROM saga.payment p
+        WHERE p.external_reference IS NOT NULL
+          AND p.registration_id IS NULL
+          AND p.created_at >= :day_start AND p.created_at < :day_end
+    )
+"""
+
+_ISSUE_QUERIES = {
+    "orphan_charge": """
+        SELECT g.transaction_id, NULL::int, NULL::int, NULL::numeric, g.amount, NULL, g.status
+        FROM reconcile_gateway_txn g
+        WHERE g.status IN ('approved', 'refunded')
+          AND NOT EXISTS (
+              SELECT 1 FROM saga.event_registration r WHERE r.transaction_id = g.transaction_id
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM saga.payment p WHERE p.external_reference = g.transaction_id
+          )
+    """,
+    "orphan_record": _RECORDED_CTE + """
+        SELECT rec.transaction_id, rec.registration_id, rec.payment_id,
+               rec.amount, NULL::numeric, rec.status, NULL
+        FROM recorded rec
+        WHERE rec.status = 'paid'
+          AND NOT EXISTS (
+              SELECT 1 FROM reconcile_gateway_txn g WHERE g.transaction_id = rec.transaction_id
+          )
+    """,
+    "amount_mismatch": _RECORDED_CTE + """
+        SELECT rec.transaction_id, rec.registration_id, rec.payment_id,
+               rec.amount, g.amount, rec.status, g.status
+        FROM recorded rec
+        JOIN reconcile_gateway_txn g ON g.transaction_id = rec.transaction_id
+        WHERE g.status = 'approved' AND rec.amount IS DISTINCT FROM g.amount
+    """,
+    "unrecorded_void": _RECORDED_CTE + """
+        SELECT rec.transaction_id, rec.registration_id, rec.payment_id,
+               rec.amount, g.amount, rec.status, g.status
+        FROM recorded rec
+        JOIN reconcile_gateway_txn g ON g.transaction_id = rec.transaction_id
+        WHERE g.status = 'voided' AND rec.status NOT IN ('voided', 'failed')
+    """,
+    "unrecorded_refund": _RECORDED_CTE + """
+        SELECT rec.transaction_id, rec.registration_id, rec.payment_id,
+               rec.amount, g.amount, rec.status, g.status
+        FROM recorded rec
+        JOIN reconcile_gateway_txn g ON g.transaction_id = rec.transaction_id
+        WHERE (g.status = 'refunded' OR g.refunded_amount > 0)
+          AND rec.status <> 'refunded'
+    """,
+}
+
+
+class ReconciliationService:
+    """Reconciles one day at a time inside a single transaction."""
+
+    def __init__(self, db: Session, page_size: int = 500):
+        self.db = db
+        self.page_size = page_size
+
+    def _create_staging_table(self) -> None:
+        self.db.execute(text("""
+            CREATE TEMP TABLE IF NOT EXISTS reconcile_gateway_txn (
+                transaction_id  VARCHAR(64) PRIMARY KEY,
+                amount          NUMERIC(10,2) NOT NULL,
+                refunded_amount NUMERIC(10,2) NOT NULL DEFAULT 0,
+                status          VARCHAR(20) NOT NULL
+            ) ON COMMIT DROP
+        """))
+
+    def _stage(self, page: list[NorthTransaction]) -> None:
+        rows = [
+            {
+                "transaction_id":  t.transaction_id,
+                "amount":          t.amount,
+                "refunded_amount": t.refunded_amount,
+                "status":          t.status,
+            }
+            for t in page
+            if t.transaction_id
+        ]
+        # A page with nothing to stage would be an executemany of no rows, which
+        # SQLAlchemy rejects ("A value is required for bind parameter")
+        if not rows:
+            return
+        self.db.execute(
+            text("""
+                INSERT INTO reconcile_gateway_txn (transaction_id, amount, refunded_amount, status)
+                VALUES (:transaction_id, :amount, :refunded_amount, :status)
+                ON CONFLICT (transaction_id) DO UPDATE
+                    SET amount = EXCLUDED.amount,
+                        refunded_amount = EXCLUDED.refunded_amount,
+                        status = EXCLUDED.status
+            """),
+            rows,
+        )
+
+    def _record_issues(self, day: date) -> dict[str, int]:
+        bounds = {
+            "day": day,
+            "day_start": datetime.combine(day, datetime.min.time()),
+            "day_end": datetime.combine(day + timedelta(days=1), datetime.min.time()),
+        }
+        # Re-running a day replaces its open issues; resolved ones are kept for audit
+        self.db.execute(
+            text("DELETE FROM saga.reconciliation_issue WHERE run_date = :day AND resolved_at IS NULL"),
+            bounds,
+        )
+
+        counts = {}
+        for kind in ISSUE_KINDS:
+            result = self.db.execute(
+                text(f"""
+                    INSERT INTO saga.reconciliation_issue
+                        (run_date, kind, transaction_id, registration_id, payment_id,
+                         recorded_amount, gateway_amount, recorded_status, gateway_status, created_at)
+                    SELECT :day, :kind, q.*, now()
+                    FROM ({_ISSUE_QUERIES[kind]}) AS q
+                """),
+                {**bounds, "kind": kind},
+            )
+            counts[kind] = result.rowcount
+        return counts
+
+    async def reconcile_day(self, day: date) -> ReconciliationReport:
+        try:
+            self._create_staging_table()
+            staged = 0
+            async for page in iter_transactions(day, self.page_size):
+                self._stage(page)
+                staged += len(page)
+
+            counts = self._record_issues(day)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.info("Reconciled %s: gateway_transactions=%s issues=%s", day, staged, counts)
+        return ReconciliationReport(run_date=day, gateway_transactions=staged, issues=counts)
+
+    def list_issues(
+        self,
+        run_date: date | None = None,
+        kind: str | None = None,
+        include_resolved: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ReconciliationIssue], int]:
+        query = self.db.query(ReconciliationIssue)
+        if run_date:
+            query = query.filter(ReconciliationIssue.run_date == run_date)
+        if kind:
+            query = query.filter(ReconciliationIssue.kind == kind)
+        if not include_resolved:
+            query = query.filter(ReconciliationIssue.resolved_at.is_(None))
+        total = query.count()
+        issues = (
+            query.order_by(ReconciliationIssue.run_date.desc(), ReconciliationIssue.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return issues, total
+
+    async def reconcile_range(self, start: date, end: date) -> list[ReconciliationReport]:
+        """Reconcile [start, end] day by day; each day commits on its own."""
+        reports = []
+        day = start
+        while day <= end:
+            reports.append(await self.reconcile_day(day))
+            day += timedelta(days=1)
+        return reports
+
+
+def main(argv: list[str] | None = None) -> None:
+    from core.database import SessionLocal
+
+    yesterday = date.today() - timedelta(days=1)
+    parser = argparse.ArgumentParser(description="Reconcile payments against North.")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, default=yesterday)
+    parser.add_argument("--to", dest="end", type=date.fromisoformat)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        reports = asyncio.run(
+            ReconciliationService(db).reconcile_range(args.start, args.end or args.start)
+        )
+    for report in reports:
+        print(report.model_dump_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Bulk refunds for cancelled events.
+
+An admin starts a RefundJob for an event; every paid card registration gets a
+RefundJobItem. The job then works through pending items in batches:
+
+  - void or refund is chosen per transaction from its settlement time —
+    North settles the day's batch at NORTH_SETTLEMENT_CUTOFF_HOUR, before
+    which a charge can only be voided and after which it can only be
+    refunded. If North answers a void with "already settled" we refund.
+  - each batch fans out with REFUND_JOB_CONCURRENCY calls over a single
+    NorthSession (one pooled client, one cached token);
+  - results are written back per batch: item rows with one executemany,
+    registration / payment statuses with one UPDATE … = ANY(:ids) per status.
+
+Progress is committed after every batch. If the breaker opens the job is left
+"interrupted"; if the process dies it stays "running" until its lease goes
+stale. Either way, starting it again resumes from the remaining pending
+items. The lease (status + updated_at, bumped every batch) keeps two workers
+from running the same job without pinning a connection across commits.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.event import Event
+from models.refund_job import RefundJob
+from services.north_payment_service import (
+    NorthGatewayError,
+    NorthRequestError,
+    NorthSession,
+    NorthUnavailableError,
+)
+
+logger = logging.getLogger(__name__)
+
+REFUND_JOB_CONCURRENCY       = int(os.getenv("REFUND_JOB_CONCURRENCY", "5"))
+REFUND_JOB_BATCH_SIZE        = int(os.getenv("REFUND_JOB_BATCH_SIZE", "50"))
+NORTH_SETTLEMENT_CUTOFF_HOUR = int(os.getenv("NORTH_SETTLEMENT_CUTOFF_HOUR", "0"))
+
+REFUND_JOB_LEASE_SECONDS     = int(os.getenv("REFUND_JOB_LEASE_SECONDS", "300"))
+
+_REVERSED = {"void": "voided", "refund": "refunded"}
+
+
+@dataclass
+class _Charge:
+    item_id:         int
+    registration_id: int
+    transaction_id:  str
+    account_id:      str
+    amount:          Decimal
+    charged_at:      datetime
+
+
+@dataclass
+class _Outcome:
+    item_id:         int
+    registration_id: int
+    action:          str
+    status:          str             # "voided" | "refunded" | "failed"
+    error:           str | None = None
+
+
+def settles_at(charged_at: datetime, cutoff_hour: int = NORTH_SETTLEMENT_CUTOFF_HOUR) -> datetime:
+    """The first batch close after the charge."""
+    cutoff = charged_at.replace(hour=cutoff_hour, minute=0, second=0, microsecond=0)
+    if charged_at >= cutoff:
+        cutoff += timedelta(days=1)
+    return cutoff
+
+
+def choose_action(charged_at: datetime, now: datetime) -> str:
+    return "refund" if now >= settles_at(charged_at) else "void"
+
+
+class RefundJobService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Job lifecycle ───────────────────────────────────────────────────────────
+
+    def _open_job(self, event_id: int) -> RefundJob | None:
+        return (
+            self.db.query(RefundJob)
+            .filter(RefundJob.event_id == event_id, RefundJob.status != "completed")
+            .first()
+        )
+
+    def start(self, event_id: int, requested_by: str) -> RefundJob:
+        """Create the job for an event, or return its unfinished one to resume."""
+        if not self.db.get(Event, event_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+
+        job = self._open_job(event_id)
+        if job:
+            return job
+
+        job = RefundJob(event_id=event_id, requested_by=requested_by, status="pending")
+        self.db.add(job)
+        try:
+            self.db.flush()
+        except IntegrityError:
+            # Another admin started it at the same moment
+            self.db.rollback()
+            return self._open_job(event_id)
+
+        job.total = self.db.execute(
+            text("""
+                INSERT INTO saga.refund_job_item (job_id, registration_id)
+                SELECT :job_id, r.id
+                FROM saga.event_registration r
+                WHERE r.event_id = :event_id
+                  AND r.payment_status = 'paid'
+                  AND r.transaction_id IS NOT NULL
+                ON CONFLICT (job_id, registration_id) DO NOTHING
+            """),
+            {"job_id": job.id, "event_id": event_id},
+        ).rowcount
+        if job.total == 0:
+            job.status = "completed"
+            job.finished_at = datetime.now()
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def get(self, job_id: int) -> RefundJob:
+        job = self.db.get(RefundJob, job_id)
+        if not job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Refund job not found")
+        return job
+
+    # ── Execution ───────────────────────────────────────────────────────────────
+
+    def _claim(self, job_id: int) -> bool:
+        """Take the job's lease unless a live worker holds it."""
+        claimed = self.db.execute(
+            text("""
+                UPDATE saga.refund_job
+                SET status = 'running', updated_at = now()
+                WHERE id = :job_id
+                  AND status <> 'completed'
+                  AND (status <> 'running' OR updated_at < now() - make_interval(secs => :lease))
+                RETURNING id
+            """),
+            {"job_id": job_id, "lease": REFUND_JOB_LEASE_SECONDS},
+        ).scalar()
+        self.db.commit()
+        return claimed is not None
+
+    def _next_batch(self, job_id: int, size: int) -> list[_Charge]:
+        rows = self.db.execute(
+            text("""
+                SELECT i.id, r.id, r.transaction_id, r.north_account_id,
+                       COALESCE(r.amount_paid, 0), r.paid_at
+                FROM saga.refund_job_item i
+                JOIN saga.event_registration r ON r.id = i.registration_id
+                WHERE i.job_id = :job_id AND i.status = 'pending'
+                ORDER BY i.id
+                LIMIT :size
+            """),
+            {"job_id": job_id, "size": size},
+        ).all()
+        return [_Charge(*row) for row in rows]
+
+    async def _reverse(self, north: NorthSession, charge: _Charge, username: str, now: datetime) -> _Outcome:
+        action = choose_action(charge.charged_at, now)
+        try:
+            if action == "void":
+                try:
+                    await north.void_transaction(charge.account_id, charge.transaction_id, username)
+                except NorthRequestError:
+                    # Settled earlier than our cutoff assumed — refund instead
+                    action = "refund"
+            if action == "refund":
+                await north.refund_transaction(
+                    charge.account_id, charge.transaction_id, charge.amount, username
+                )
+        except NorthUnavailableError:
+            raise
+        except NorthGatewayError as exc:
+            return _Outcome(charge.item_id, charge.registration_id, action, "failed", str(exc))
+        return _Outcome(charge.item_id, charge.registration_id, action, _REVERSED[action])
+
+    def _apply(self, job_id: int, outcomes: list[_Outcome]) -> None:
+        now = datetime.now()
+        self.db.execute(
+            text("""
+                UPDATE saga.refund_job_item
+                SET action = :action, status = :status, error = :error, processed_at = :now
+                WHERE id = :item_id
+            """),
+            [
+                {"item_id": o.item_id, "action": o.action, "status": o.status, "error": o.error, "now": now}
+                for o in outcomes
+            ],
+        )
+        for new_status in ("voided", "refunded"):
+            ids = [o.registration_id for o in outcomes if o.status == new_status]
+            if not ids:
+                continue
+            params = {"status": new_status, "ids": ids, "now": now}
+            self.db.execute(
+                text("""
+                    UPDATE saga.event_registration
+                    SET payment_status = :status, updated_at = :now
+                    WHERE id IN :ids
+                """).bindparams(bindparam("ids", expanding=True)),
+                params,
+            )
+            self.db.execute(
+                text("""
+                    UPDATE saga.payment
+                    SET status = :status, refunded_at = :now, updated_at = :now
+                    WHERE registration_id IN :ids
+                """).bindparams(bindparam("ids", expanding=True)),
+                params,
+            )
+
+        succeeded = sum(o.status != "failed" for o in outcomes)
+        self.db.execute(
+            text("""
+                UPDATE saga.refund_job
+                SET succeeded = succeeded + :ok, failed = failed + :failed, updated_at = now()
+                WHERE id = :job_id
+            """),
+            {"ok": succeeded, "failed": len(outcomes) - succeeded, "now": now, "job_id": job_id},
+        )
+
+    async def run(
+        self,
+        job_id:      int,
+        username:    str,
+        concurrency: int = REFUND_JOB_CONCURRENCY,
+        batch_size:  int = REFUND_JOB_BATCH_SIZE,
+    ) -> RefundJob:
+        if not self._claim(job_id):
+            logger.info("Refund job %s is completed or running elsewhere", job_id)
+            return self.get(job_id)
+
+        job = self.get(job_id)
+        try:
+            semaphore = asyncio.Semaphore(concurrency)
+            now = datetime.now()
+
+            async def reverse(north: NorthSession, charge: _Charge) -> _Outcome:
+                async with semaphore:
+                    return await self._reverse(north, charge, username, now)
+
+            async with NorthSession(max_connections=concurrency) as north:
+                while batch := self._next_batch(job_id, batch_size):
+                    # End the read transaction so no connection idles in it while North works
+                    self.db.commit()
+                    outcomes = await asyncio.gather(
+                        *(reverse(north, charge) for charge in batch),
+                        return_exceptions=True,
+                    )
+                    done = [o for o in outcomes if isinstance(o, _Outcome)]
+                    if done:
+                        self._apply(job_id, done)
+                        self.db.commit()
+                    aborted = next((o for o in outcomes if isinstance(o, BaseException)), None)
+                    if aborted:
+                        raise aborted
+
+            job.status = "completed"
+            job.finished_at = datetime.now()
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            job = self.get(job_id)
+            job.status = "interrupted"
+            job.last_error = str(exc)
+            self.db.commit()
+            logger.exception("Refund job %s interrupted; start it again to resume", job_id)
+
+        self.db.refresh(job)
+        logger.info(
+            "Refund job %s: status=%s succeeded=%s failed=%s total=%s",
+            job.id, job.status, job.succeeded, job.failed, job.total,
+        )
+        return job
+
+
+def run_in_background(job_id: int, username: str) -> None:
+    """BackgroundTasks entry point — owns its own session, off the request's."""
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        asyncio.run(RefundJobService(db).run(job_id, username))
@@ -0,0 +1,193 @@
+"""
+Two-phase registration.
+
+Phase one places a hold: a `pending` EventRegistration with hold_expires_at,
+created inside a short transaction that locks the event row for the capacity
+check and commits before the card is charged. Phase two confirms the hold
+once North approves (`pending` → `paid`) or releases it on a decline
+(`pending` → `failed`, kept so retry-payment can re-hold it).
+
+No database transaction or pooled connection is open while the gateway call
+is in flight, and a seat held by a checkout in progress is already counted,
+so two people can't both pay for the last spot. Seats are read from
+Event.registered_count, which the database keeps in step with every status
+change (migrations/008_event_registered_count.sql).
+
+Holds whose checkout never came back (client gone, worker killed) are
+reclaimed by the sweeper in batches:
+    python -m services.registration_hold_service
+"""
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.events import RegistrationPaid, publish
+from models.event import Event
+from models.event_registration import EventRegistration
+
+logger = logging.getLogger(__name__)
+
+REGISTRATION_HOLD_MINUTES = int(os.getenv("REGISTRATION_HOLD_MINUTES", "10"))
+HOLD_SWEEP_BATCH_SIZE     = int(os.getenv("HOLD_SWEEP_BATCH_SIZE", "500"))
+
+# Statuses that no longer occupy a seat
+INACTIVE_STATUSES = ("failed", "refunded", "voided")
+
+
+def lock_event(db: Session, event_id: int) -> Event | None:
+    """
+    Lock the event row for a capacity decision, first reclaiming this event's
+    lapsed holds so Event.registered_count is exact while we hold the lock.
+    """
+    db.execute(
+        text("""
+            UPDATE saga.event_registration
+            SET payment_status = 'failed', hold_expires_at = NULL, updated_at = now()
+            WHERE event_id = :event_id AND payment_status = 'pending' AND hold_expires_at < now()
+        """),
+        {"event_id": event_id},
+    )
+    return (
+        db.query(Event)
+        .filter(Event.id == event_id)
+        .with_for_update()
+        .populate_existing()
+        .first()
+    )
+
+
+def hold_expiry() -> datetime:
+    return datetime.now() + timedelta(minutes=REGISTRATION_HOLD_MINUTES)
+
+
+def is_live_hold(registration: EventRegistration) -> bool:
+    return (
+        registration.payment_status == "pending"
+        and registration.hold_expires_at is not None
+        and registration.hold_expires_at > datetime.now()
+    )
+
+
+def confirm_hold(
+    db:              Session,
+    registration_id: int,
+    amount:          Decimal,
+    transaction_id:  str | None,
+    uniq_id:         str | None,
+    account_id:      str | None,
+    card_last_four:  str | None,
+) -> bool:
+    """
+    Phase two: pending → paid. Returns False if the hold is gone (reclaimed by
+    the sweeper), in which case the caller must give the money back. A
+    confirmed hold publishes RegistrationPaid, which sends the receipt once
+    this commits.
+    """
+    confirmed = db.execute(
+        text("""
+            UPDATE saga.event_registration
+            SET payment_status   = 'paid',
+                payment_method   = 'card',
+                amount_paid      = :amount,
+                transaction_id   = :transaction_id,
+                north_uniq_id    = :uniq_id,
+                north_account_id = :account_id,
+                card_last_four   = :card_last_four,
+                hold_expires_at  = NULL,
+                paid_at          = now(),
+                updated_at       = now()
+            WHERE id = :id AND payment_status = 'pending'
+        """),
+        {
+            "id":             registration_id,
+            "amount":         amount,
+            "transaction_id": transaction_id,
+            "uniq_id":        uniq_id,
+            "account_id":     account_id,
+            "card_last_four": card_last_four,
+        },
+    ).rowcount
+    if confirmed == 1:
+        publish(db, RegistrationPaid(registration_id))
+    db.commit()
+    return confirmed == 1
+
+
+def release_hold(db: Session, registration_id: int) -> None:
+    """
+    Phase two on a decline or gateway failure: give the seat back. A waitlist
+    offer the hold claimed goes back to `offered` until its original expiry,
+    still linked to the registration, so retry-payment can claim it again.
+    Once it lapses the sweeper offers the seat to the next in line.
+    """
+    db.execute(
+        text("""
+            WITH released AS (
+                UPDATE saga.event_registration
+                SET payment_status = 'failed', hold_expires_at = NULL, updated_at = now()
+                WHERE id = :id AND payment_status = 'pending'
+                RETURNING id
+            )
+            UPDATE saga.event_waitlist w
+            SET status = 'offered', updated_at = now()
+            FROM released
+            WHERE w.registration_id = released.id AND w.status = 'claimed'
+        """),
+        {"id": registration_id},
+    )
+    db.commit()
+
+
+def reclaim_expired_holds(db: Session, batch_size: int = HOLD_SWEEP_BATCH_SIZE) -> set[int]:
+    """
+    Mark lapsed holds failed, one batch per transaction so the sweep never
+    holds many row locks at once. Returns the ids of events that got seats back.
+    """
+    event_ids: set[int] = set()
+    while True:
+        rows = db.execute(
+            text("""
+                UPDATE saga.event_registration
+                SET payment_status = 'failed', hold_expires_at = NULL, updated_at = now()
+                WHERE id IN (
+                    SELECT id FROM saga.event_registration
+                    WHERE payment_status = 'pending' AND hold_expires_at < now()
+                    ORDER BY hold_expires_at
+                    LIMIT :batch
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING event_id
+            """),
+            {"batch": batch_size},
+        ).scalars().all()
+        db.commit()
+        event_ids.update(rows)
+        if len(rows) < batch_size:
+            break
+
+    if event_ids:
+        logger.info("Reclaimed expired registration holds: events=%s", sorted(event_ids))
+    return event_ids
+
+
+def main() -> None:
+    from core.database import SessionLocal
+    from services.waitlist_service import WaitlistService
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        event_ids = reclaim_expired_holds(db)
+        waitlist = WaitlistService(db)
+        for event_id in event_ids:
+            waitlist.promote(event_id)
+    print(f"Reclaimed holds on {len(event_ids)} event(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+The app's recurring jobs, run by core.scheduler from the app lifespan.
+
+  reclaim_expired_holds  every minute   lapsed checkout holds → failed, seats re-offered
+  waitlist_sweep         every 5 min    offer free seats / expire stale offers
+  purge_reset_tokens     hourly         clear password-reset tokens past their expiry
+  reconcile_payments     daily          yesterday's North transactions vs our records
+  event_reminders        every 15 min   reminder emails 7 days and 1 day before each event
+  warm_public_cache      every minute   re-render public lists whose data changed,
+                                        in every worker (the cache is per process)
+
+Each job opens its own session, like the *_in_background helpers. The
+command-line entry points (python -m services.registration_hold_service,
+…) still work for one-off runs.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from core.scheduler import Job
+
+logger = logging.getLogger(__name__)
+
+
+def reclaim_holds() -> None:
+    from core.database import SessionLocal
+    from services.registration_hold_service import reclaim_expired_holds
+    from services.waitlist_service import WaitlistService
+
+    with SessionLocal() as db:
+        waitlist = WaitlistService(db)
+        for event_id in reclaim_expired_holds(db):
+            waitlist.promote(event_id)
+
+
+def sweep_waitlist() -> None:
+    from core.database import SessionLocal
+    from services.waitlist_service import WaitlistService
+
+    with SessionLocal() as db:
+        WaitlistService(db).sweep()
+
+
+def purge_reset_tokens() -> None:
+    from core.database import SessionLocal
+    from repositories.auth_repository import AuthRepository
+
+    with SessionLocal() as db:
+        purged = AuthRepository(db).purge_expired_reset_tokens(datetime.now(timezone.utc))
+        db.commit()
+    if purged:
+        logger.info("Purged %s expired password reset token(s)", purged)
+
+
+def reconcile_payments() -> None:
+    from core.database import SessionLocal
+    from services.reconciliation_service import ReconciliationService
+
+    with SessionLocal() as db:
+        asyncio.run(ReconciliationService(db).reconcile_day(date.today() - timedelta(days=1)))
+
+
+def send_event_reminders() -> None:
+    from services.event_reminder_service import send_due_reminders
+
+    send_due_reminders()
+
+
+def warm_public_cache() -> None:
+    from core.database import SessionLocal
+    from routers.banner_messages import get_banner_messages
+    from routers.carousel import get_carousel_images
+    from routers.partners import get_all_partners
+    from routers.photos import get_all_albums
+    from services.calendar_service import CalendarService
+
+    # Each call reads the data versions and renders only what changed since the last one
+    with SessionLocal() as db:
+        for endpoint in (get_all_albums, get_all_partners, get_carousel_images, get_banner_messages):
+            endpoint(request=None, db=db)
+        CalendarService(db).events_feed(request=None)
+        db.commit()
+
+
+JOBS = [
+    Job("reclaim_expired_holds", reclaim_holds, timedelta(minutes=1), jitter=5),
+    Job("waitlist_sweep", sweep_waitlist, timedelta(minutes=5), jitter=15),
+    Job("purge_reset_tokens", purge_reset_tokens, timedelta(hours=1), jitter=60),
+    Job("reconcile_payments", reconcile_payments, timedelta(days=1), jitter=300),
+    Job("event_reminders", send_event_reminders, timedelta(minutes=15), jitter=60),
+    Job("warm_public_cache", warm_public_cache, timedelta(minutes=1), jitter=10, exclusive=False),
+]
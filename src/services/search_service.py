@@ -0,0 +1,123 @@
+"""
+Admin search across members, guests, events and sponsor registrations.
+
+Each searchable table carries generated `search_text` / `search_vector`
+columns (migrations/009_admin_search.sql). A query matches a row when either
+
+  - every word of the query is a prefix of a word in search_vector
+    ("jo smi" → John Smith), or
+  - search_text is trigram-similar to the query (typos: "jhon smtih").
+
+Both predicates are served by GIN indexes, so each branch is a bitmap index
+scan rather than a table scan. Rank is the better of ts_rank and trigram
+similarity; results from all entity types are merged, ranked and paginated
+in a single round trip.
+"""
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from schemas.admin import SearchResultItem
+
+SEARCH_TYPES = ("user", "guest", "event", "registration")
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+_BRANCHES = {
+    # Members match on name or login email; collapse both hits to one row
+    "user": """
+        SELECT 'user' AS type, id, title, subtitle, NULL::int AS event_id, max(rank) AS rank
+        FROM (
+            SELECT u.id, concat_ws(' ', u.first_name, u.last_name) AS title, a.email AS subtitle,
+                   greatest(ts_rank(u.search_vector, q.tsq), similarity(u.search_text, :q)) AS rank
+            FROM saga."user" u
+            CROSS JOIN q
+            LEFT JOIN saga.user_account a ON a.user_id = u.id
+            WHERE u.search_vector @@ q.tsq OR u.search_text % :q
+            UNION ALL
+            SELECT u.id, concat_ws(' ', u.first_name, u.last_name), a.email,
+                   greatest(ts_rank(a.search_vector, q.tsq), similarity(a.search_text, :q))
+            FROM saga.user_account a
+            CROSS JOIN q
+            JOIN saga."user" u ON u.id = a.user_id
+            WHERE a.search_vector @@ q.tsq OR a.search_text % :q
+        ) hits
+        GROUP BY id, title, subtitle
+    """,
+    "guest": """
+        SELECT 'guest', g.id, concat_ws(' ', g.first_name, g.last_name), g.email, NULL::int,
+               greatest(ts_rank(g.search_vector, q.tsq), similarity(g.search_text, :q))
+        FROM saga.guest g
+        CROSS JOIN q
+        WHERE g.search_vector @@ q.tsq OR g.search_text % :q
+    """,
+    "event": """
+        SELECT 'event', e.id, e.golf_course, concat_ws(' · ', e.township, e.date::text), e.id,
+               greatest(ts_rank(e.search_vector, q.tsq), similarity(e.search_text, :q))
+        FROM saga.event e
+        CROSS JOIN q
+        WHERE e.search_vector @@ q.tsq OR e.search_text % :q
+    """,
+    "registration": """
+        SELECT 'registration', r.id, r.company_name, concat_ws(' · ', e.golf_course, e.date::text), r.event_id,
+               greatest(ts_rank(r.search_vector, q.tsq), similarity(r.search_text, :q))
+        FROM saga.event_registration r
+        CROSS JOIN q
+        JOIN saga.event e ON e.id = r.event_id
+        WHERE r.company_name IS NOT NULL
+          AND (r.search_vector @@ q.tsq OR r.search_text % :q)
+    """,
+}
+
+
+def prefix_tsquery(query: str) -> str | None:
+    """'Jo  Smi' → 'jo:* & smi:*'. Only word characters reach to_tsquery."""
+    words = _WORD.findall(query.lower())
+    return " & ".join(f"{word}:*" for word in words) if words else None
+
+
+class SearchService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        query: str,
+        types: list[str] | None = None,
+        skip:  int = 0,
+        limit: int = 20,
+    ) -> tuple[list[SearchResultItem], int]:
+        tsq = prefix_tsquery(query)
+        if not tsq:
+            return [], 0
+
+        selected = [t for t in SEARCH_TYPES if not types or t in types]
+        union = "\nUNION ALL\n".join(f"({_BRANCHES[t]})" for t in selected)
+
+        rows = self.db.execute(
+            text(f"""
+                WITH q AS (SELECT to_tsquery('simple', :tsq) AS tsq)
+                SELECT type, id, title, subtitle, event_id, rank, count(*) OVER () AS total
+                FROM ({union}) AS matches (type, id, title, subtitle, event_id, rank)
+                ORDER BY rank DESC, type, id
+                LIMIT :limit OFFSET :skip
+            """),
+            {"q": query.strip().lower(), "tsq": tsq, "limit": limit, "skip": skip},
+        ).mappings().all()
+
+        total = rows[0]["total"] if rows else 0
+        items = [
+            SearchResultItem(
+                type=row["type"],
+                id=row["id"],
+                title=row["title"] or "",
+                subtitle=row["subtitle"],
+                event_id=row["event_id"],
+                rank=round(float(row["rank"]), 4),
+            )
+            for row in rows
+        ]
+        return items, total
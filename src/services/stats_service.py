@@ -0,0 +1,125 @@
+"""
+Admin dashboard statistics.
+
+Reads the registration rollups kept by the database
+(migrations/010_registration_stats_rollups.sql): saga.event_stats holds one
+row per event and saga.event_registration_daily one row per event per signup
+day. Every figure on the dashboard is a primary-key read or a small GROUP BY
+over those tables joined to saga.event — event_registration and payment are
+never scanned.
+
+If the rollups drift (rows changed while the trigger was disabled), rebuild:
+    python -m services.stats_service
+"""
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models.event import Event
+from schemas.admin import AdminStatsResponse, EventStatsItem, RegistrationDayItem, SeasonStatsItem
+
+logger = logging.getLogger(__name__)
+
+# Columns shared by the event and season views. Fill rate counts seats taken
+# (paid + held), the same figure registration capacity checks use.
+_TOTALS = """
+    COALESCE(sum(s.registrations), 0)   AS registrations,
+    COALESCE(sum(s.members), 0)         AS members,
+    COALESCE(sum(s.guests), 0)          AS guests,
+    COALESCE(sum(s.sponsors), 0)        AS sponsors,
+    COALESCE(sum(s.revenue), 0)         AS revenue,
+    COALESCE(sum(s.sponsor_revenue), 0) AS sponsor_revenue,
+    COALESCE(sum(s.refunds), 0)         AS refunds,
+    COALESCE(sum(s.refunded_amount), 0) AS refunded_amount,
+    sum(e.capacity)                     AS capacity,
+    sum(e.registered_count)             AS seats_taken
+"""
+
+
+def _fill_rate(seats_taken: int, capacity: int) -> float:
+    return round(seats_taken / capacity, 4) if capacity else 0.0
+
+
+class StatsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def seasons(self) -> list[SeasonStatsItem]:
+        rows = self.db.execute(
+            text(f"""
+                SELECT extract(year FROM e.date)::int AS season, count(e.id) AS events, {_TOTALS}
+                FROM saga.event e
+                LEFT JOIN saga.event_stats s ON s.event_id = e.id
+                GROUP BY 1
+                ORDER BY 1 DESC
+            """)
+        ).mappings().all()
+        return [
+            SeasonStatsItem(**row, fill_rate=_fill_rate(row["seats_taken"], row["capacity"]))
+            for row in rows
+        ]
+
+    def events(self, season: int) -> list[EventStatsItem]:
+        rows = self.db.execute(
+            text(f"""
+                SELECT e.id AS event_id, e.golf_course, e.date, {_TOTALS}
+                FROM saga.event e
+                LEFT JOIN saga.event_stats s ON s.event_id = e.id
+                WHERE e.date >= make_date(:season, 1, 1) AND e.date < make_date(:season + 1, 1, 1)
+                GROUP BY e.id
+                ORDER BY e.date, e.id
+            """),
+            {"season": season},
+        ).mappings().all()
+        return [
+            EventStatsItem(**row, fill_rate=_fill_rate(row["seats_taken"], row["capacity"]))
+            for row in rows
+        ]
+
+    def overview(self, season: Optional[int] = None) -> AdminStatsResponse:
+        season = season or date.today().year
+        return AdminStatsResponse(season=season, seasons=self.seasons(), events=self.events(season))
+
+    def daily(self, event_id: int) -> list[RegistrationDayItem]:
+        """Paid registrations per signup day, counted down to the event, with a running total."""
+        event = self.db.get(Event, event_id)
+        if not event:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+
+        rows = self.db.execute(
+            text("""
+                SELECT day,
+                       :event_date - day AS days_before,
+                       registrations,
+                       revenue,
+                       sum(registrations) OVER (ORDER BY day) AS cumulative
+                FROM saga.event_registration_daily
+                WHERE event_id = :event_id
+                ORDER BY day
+            """),
+            {"event_id": event_id, "event_date": event.date},
+        ).mappings().all()
+        return [RegistrationDayItem(**row) for row in rows]
+
+    def rebuild(self) -> None:
+        self.db.execute(text("SELECT saga.rebuild_registration_stats()"))
+        self.db.commit()
+
+
+def main() -> None:
+    from core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        StatsService(db).rebuild()
+    print("Rebuilt registration stats")
+
+
+if __name__ == "__main__":
+    main()
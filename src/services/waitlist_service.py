@@ -0,0 +1,292 @@
+"""
+Event waitlist.
+
+When an event is full, people join its waitlist instead of leaving. Whenever a
+seat frees up (a registration is deleted, an offer lapses) the promotion
+worker offers it to the next waiting entry as a time-boxed hold:
+
+  waiting → offered (held for WAITLIST_HOLD_MINUTES) → claimed
+                                                    ↘ expired → next in line
+
+An outstanding offer counts against capacity, so nobody else can take the
+seat while the offered person is paying. They claim it by registering with
+their waitlist token, which skips the "fully booked" check for that seat.
+
+Order is the entry id. "Next in line" is a range scan on the partial index
+(event_id, id) WHERE status = 'waiting', so promotion stays O(log n) however
+long the list gets. "My position" counts the waiting entries ahead on the same
+index, so it costs O(position).
+
+A claimed offer whose checkout is declined goes back to `offered`
+(registration_hold_service.release_hold), so the seat isn't lost to everyone.
+
+Offers also lapse without a cancellation, so run the sweeper periodically:
+    python -m services.waitlist_service
+"""
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.event import Event
+from models.event_waitlist import EventWaitlistEntry
+from services.email_service import EmailService
+from services.registration_hold_service import lock_event
+
+logger = logging.getLogger(__name__)
+
+WAITLIST_HOLD_MINUTES = int(os.getenv("WAITLIST_HOLD_MINUTES", "30"))
+
+
+class WaitlistService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Capacity ────────────────────────────────────────────────────────────────
+
+    def active_offers(self, event_id: int, exclude_token: Optional[str] = None) -> int:
+        query = self.db.query(func.count(EventWaitlistEntry.id)).filter(
+            EventWaitlistEntry.event_id == event_id,
+            EventWaitlistEntry.status == "offered",
+            EventWaitlistEntry.offer_expires_at > datetime.now(),
+        )
+        if exclude_token:
+            query = query.filter(EventWaitlistEntry.access_token != exclude_token)
+        return query.scalar() or 0
+
+    def seats_taken(self, event: Event, exclude_token: Optional[str] = None) -> int:
+        return event.registered_count + self.active_offers(event.id, exclude_token)
+
+    def find_offer(self, event_id: int, token: str) -> Optional[EventWaitlistEntry]:
+        """The caller's live offer for this event, if the token holds one."""
+        return (
+            self.db.query(EventWaitlistEntry)
+            .filter(
+                EventWaitlistEntry.event_id == event_id,
+                EventWaitlistEntry.access_token == token,
+                EventWaitlistEntry.status == "offered",
+                EventWaitlistEntry.offer_expires_at > datetime.now(),
+            )
+            .first()
+        )
+
+    def mark_claimed(self, entry: EventWaitlistEntry, registration_id: int) -> None:
+        entry.status = "claimed"
+        entry.registration_id = registration_id
+
+    def released_offer_token(self, registration_id: int) -> Optional[str]:
+        """Token of the offer a declined registration had claimed, if it's back on offer."""
+        return (
+            self.db.query(EventWaitlistEntry.access_token)
+            .filter(
+                EventWaitlistEntry.registration_id == registration_id,
+                EventWaitlistEntry.status == "offered",
+            )
+            .scalar()
+        )
+
+    # ── Joining & leaving ───────────────────────────────────────────────────────
+
+    def join(
+        self,
+        event_id:   int,
+        email:      str,
+        first_name: str,
+        last_name:  str,
+        phone:      Optional[str] = None,
+        user_id:    Optional[int] = None,
+    ) -> EventWaitlistEntry:
+        event = self.db.get(Event, event_id)
+        if not event:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found.")
+        if event.date < date.today():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This event has already taken place.")
+        if self.seats_taken(event) < event.capacity:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="This event still has open spots. Please register directly.",
+            )
+
+        entry = EventWaitlistEntry(
+            event_id=event_id,
+            user_id=user_id,
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            phone=phone,
+            access_token=secrets.token_urlsafe(32),
+            status="waiting",
+        )
+        self.db.add(entry)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="This email is already on the waitlist for this event.",
+            )
+        self.db.refresh(entry)
+        return entry
+
+    def get_by_token(self, entry_id: int, token: str) -> EventWaitlistEntry:
+        entry = self.db.get(EventWaitlistEntry, entry_id)
+        if not entry or not secrets.compare_digest(entry.access_token, token):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Waitlist entry not found.")
+        return entry
+
+    def position(self, entry: EventWaitlistEntry) -> Optional[int]:
+        """
+        1-based place in line, or None once the entry has left the queue.
+        Counts the waiting entries ahead of this one: O(position), not O(log n).
+        """
+        if entry.status != "waiting":
+            return None
+        ahead = (
+            self.db.query(func.count(EventWaitlistEntry.id))
+            .filter(
+                EventWaitlistEntry.event_id == entry.event_id,
+                EventWaitlistEntry.status == "waiting",
+                EventWaitlistEntry.id < entry.id,
+            )
+            .scalar()
+        )
+        return ahead + 1
+
+    def leave(self, entry: EventWaitlistEntry) -> bool:
+        """Cancel an entry. Returns True if it was holding an offer (a seat freed up)."""
+        held_offer = entry.status == "offered"
+        if entry.status in ("waiting", "offered"):
+            entry.status = "cancelled"
+            self.db.commit()
+        return held_offer
+
+    def list_for_event(self, event_id: int) -> list[EventWaitlistEntry]:
+        return (
+            self.db.query(EventWaitlistEntry)
+            .filter(EventWaitlistEntry.event_id == event_id)
+            .order_by(EventWaitlistEntry.id)
+            .all()
+        )
+
+    # ── Promotion ───────────────────────────────────────────────────────────────
+
+    def promote(self, event_id: int) -> list[EventWaitlistEntry]:
+        """
+        Expire lapsed offers, then offer every free seat to the next waiting
+        entries. Serialized per event by locking the event row, so concurrent
+        cancellations can't hand the same seat out twice.
+        """
+        event = lock_event(self.db, event_id)
+        if not event:
+            return []
+
+        now = datetime.now()
+        self.db.execute(
+            text("""
+                UPDATE saga.event_waitlist
+                SET status = 'expired', updated_at = :now
+                WHERE event_id = :event_id AND status = 'offered' AND offer_expires_at <= :now
+            """),
+            {"event_id": event_id, "now": now},
+        )
+
+        free = event.capacity - self.seats_taken(event)
+        if free <= 0 or event.date < date.today():
+            self.db.commit()
+            return []
+
+        offered_ids = self.db.execute(
+            text("""
+                UPDATE saga.event_waitlist
+                SET status = 'offered', offered_at = :now, offer_expires_at = :expires, updated_at = :now
+                WHERE id IN (
+                    SELECT id FROM saga.event_waitlist
+                    WHERE event_id = :event_id AND status = 'waiting'
+                    ORDER BY id
+                    LIMIT :free
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id
+            """),
+            {
+                "event_id": event_id,
+                "now":      now,
+                "expires":  now + timedelta(minutes=WAITLIST_HOLD_MINUTES),
+                "free":     free,
+            },
+        ).scalars().all()
+        self.db.commit()
+
+        if not offered_ids:
+            return []
+        offered = (
+            self.db.query(EventWaitlistEntry)
+            .filter(EventWaitlistEntry.id.in_(offered_ids))
+            .order_by(EventWaitlistEntry.id)
+            .all()
+        )
+        logger.info("Waitlist promoted: event_id=%s entries=%s", event_id, offered_ids)
+        self._notify(event, offered)
+        return offered
+
+    def _notify(self, event: Event, offered: list[EventWaitlistEntry]) -> None:
+        email_service = EmailService()
+        for entry in offered:
+            email_service.send_waitlist_offer(
+                to_email=entry.email,
+                first_name=entry.first_name,
+                event_name=event.golf_course,
+                event_date=str(event.date),
+                expires_at=entry.offer_expires_at.strftime("%b %d, %Y %I:%M %p"),
+                claim_url=(
+                    f"{settings.FRONTEND_URL}/events/{event.id}/register"
+                    f"?waitlist_token={entry.access_token}"
+                ),
+            )
+
+    def sweep(self) -> int:
+        """Promote on every upcoming event with someone waiting or an offer outstanding."""
+        event_ids = self.db.execute(
+            text("""
+                SELECT DISTINCT w.event_id
+                FROM saga.event_waitlist w
+                JOIN saga.event e ON e.id = w.event_id
+                WHERE w.status IN ('waiting', 'offered') AND e.date >= CURRENT_DATE
+            """)
+        ).scalars().all()
+        self.db.commit()
+        return sum(len(self.promote(event_id)) for event_id in event_ids)
+
+
+def promote_in_background(event_id: int) -> None:
+    """BackgroundTasks entry point — runs after the response with its own session."""
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        try:
+            WaitlistService(db).promote(event_id)
+        except Exception:
+            logger.exception("Waitlist promotion failed: event_id=%s", event_id)
+
+
+def main() -> None:
+    from core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        promoted = WaitlistService(db).sweep()
+    print(f"Offered {promoted} waitlist spot(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """A throwaway PostgreSQL per test module; skips when Postgres isn't installed."""
+    from sqlalchemy import create_engine
+
+    from benchmarks.postgres import disposable_postgres
+
+    try:
+        context = disposable_postgres()
+        url = context.__enter__()
+    except (RuntimeError, OSError) as exc:
+        pytest.skip(f"PostgreSQL not available: {exc}")
+
+    engine = create_engine(url)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        context.__exit__(None, None, None)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from repositories.admin_repository import AdminRepository
+from repositories.banner_repository import get_banners, update_banner_messages
+from repositories.carousel_repository import CarouselRepository
+
+
+@pytest.fixture
+def db(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.site_content (
+                id SERIAL PRIMARY KEY, key VARCHAR(100) UNIQUE NOT NULL, value TEXT NULL,
+                description VARCHAR(500) NULL, updated_at TIMESTAMP NOT NULL
+            )
+        """)
+        conn.exec_driver_sql("CREATE TABLE saga.banner_messages (id SERIAL PRIMARY KEY, message VARCHAR NOT NULL)")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.carousel_images (
+                id SERIAL PRIMARY KEY, image_url VARCHAR(500) NOT NULL, display_order INT NOT NULL DEFAULT 0
+            )
+        """)
+    with Session(engine) as session:
+        yield session
+
+
+def _rows(db, sql: str) -> list[tuple]:
+    return [tuple(row) for row in db.execute(text(sql))]
+
+
+class TestUpdateContent:
+    def test_inserts_new_keys_and_updates_existing(self, db):
+        repo = AdminRepository(db)
+        repo.update_content({"hero_title": "Welcome", "footer": "SAGA"})
+        repo.commit()
+        first_ids = dict(_rows(db, "SELECT key, id FROM saga.site_content"))
+
+        repo.update_content({"hero_title": "Welcome back", "about": "Golf"})
+        repo.commit()
+
+        assert dict(_rows(db, "SELECT key, value FROM saga.site_content")) == {
+            "hero_title": "Welcome back", "footer": "SAGA", "about": "Golf",
+        }
+        assert dict(_rows(db, "SELECT key, id FROM saga.site_content WHERE key <> 'about'")) == first_ids
+
+    def test_empty_update_is_a_no_op(self, db):
+        AdminRepository(db).update_content({})
+        assert _rows(db, "SELECT count(*) FROM saga.site_content") == [(0,)]
+
+
+class TestBannerMessages:
+    def test_diff_keeps_ids_of_unchanged_slots(self, db):
+        first = update_banner_messages(db, [{"message": m} for m in ("a", "b", "c")])
+        ids = [b.id for b in first]
+
+        AdminRepository(db).update_banner_messages(["a", "B"])
+        db.commit()
+        assert [(b.id, b.message) for b in get_banners(db)] == [(ids[0], "a"), (ids[1], "B")]
+
+        updated = update_banner_messages(db, [{"message": m} for m in ("a", "B", "d", "e")])
+        assert [b.message for b in updated] == ["a", "B", "d", "e"]
+        assert [b.id for b in updated][:2] == ids[:2]
+
+    def test_empty_list_clears_banners(self, db):
+        update_banner_messages(db, [{"message": "a"}])
+        assert update_banner_messages(db, []) == []
+
+
+class TestCarouselImages:
+    def test_reorder_keeps_rows_and_drops_removed_urls(self, db):
+        repo = CarouselRepository(db)
+        repo.update_images(["/1.jpg", "/2.jpg", "/3.jpg"])
+        ids = dict(_rows(db, "SELECT image_url, id FROM saga.carousel_images"))
+
+        repo.update_images(["/3.jpg", "/1.jpg", "/4.jpg", "/1.jpg"])
+
+        assert repo.get_all_images() == ["/3.jpg", "/1.jpg", "/4.jpg"]
+        after = dict(_rows(db, "SELECT image_url, id FROM saga.carousel_images"))
+        assert after["/3.jpg"] == ids["/3.jpg"] and after["/1.jpg"] == ids["/1.jpg"]
+        assert "/2.jpg" not in after
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import shutil
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import services.app_settings_service as app_settings
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from core.response_cache import table_versions
+from services.app_settings_service import AppSettingsService, cached_settings, decode
+
+
+class TestDecode:
+    def test_known_keys_are_typed(self):
+        assert decode("guest_event_rate", " 85.50 ") == Decimal("85.50")
+
+    def test_unknown_keys_stay_strings(self):
+        assert decode("welcome_banner", "Hello") == "Hello"
+
+    def test_bad_value_names_the_key(self):
+        with pytest.raises(ValueError, match="guest_event_rate"):
+            decode("guest_event_rate", "eighty")
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def db(engine, tmp_path, monkeypatch):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql('CREATE TABLE saga."user" (id SERIAL PRIMARY KEY)')
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.app_settings (
+                key VARCHAR(100) PRIMARY KEY, value TEXT NOT NULL,
+                updated_at TIMESTAMP NOT NULL, updated_by INT NULL REFERENCES saga."user"(id)
+            )
+        """)
+        conn.exec_driver_sql("INSERT INTO saga.app_settings VALUES ('guest_event_rate', '75', now(), NULL)")
+    for name in ("011_app_settings_version.sql", "013_data_versions.sql", "020_app_settings_data_version.sql"):
+        shutil.copy(MIGRATIONS_DIR / name, tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+
+    monkeypatch.setattr(app_settings, "_cache", app_settings._SettingsCache())
+    with Session(engine) as session:
+        yield session
+
+
+class TestSettingsCache:
+    def test_serves_snapshot_without_querying_until_stale(self, db, engine, monkeypatch):
+        monkeypatch.setattr(app_settings, "SETTINGS_VERSION_CHECK_SECONDS", 3600)
+        first = cached_settings(db)
+        assert first.guest_event_rate == Decimal("75")
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.app_settings SET value = '80'")
+        assert cached_settings(db) is first  # still inside the check interval
+
+        monkeypatch.setattr(app_settings, "SETTINGS_VERSION_CHECK_SECONDS", 0)
+        assert cached_settings(db).guest_event_rate == Decimal("80")
+
+    def test_versioned_in_data_version_only(self, db):
+        assert db.execute(text("SELECT to_regclass('saga.app_settings_version')")).scalar() is None
+        before = table_versions(db, ("app_settings",))
+        db.execute(text("UPDATE saga.app_settings SET value = '80'"))
+        db.commit()
+        assert table_versions(db, ("app_settings",)) == (before[0] + 1,)
+
+    def test_unchanged_version_keeps_snapshot(self, db, monkeypatch):
+        monkeypatch.setattr(app_settings, "SETTINGS_VERSION_CHECK_SECONDS", 0)
+        assert cached_settings(db) is cached_settings(db)
+
+    def test_update_validates_and_invalidates(self, db, monkeypatch):
+        monkeypatch.setattr(app_settings, "SETTINGS_VERSION_CHECK_SECONDS", 3600)
+        service = AppSettingsService(db)
+        assert cached_settings(db).guest_event_rate == Decimal("75")
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.update_setting("guest_event_rate", "free")
+        assert exc_info.value.status_code == 422
+
+        service.update_setting("guest_event_rate", "90.00")
+        service.update_setting("season_open", "yes")
+        settings = cached_settings(db)
+        assert settings.guest_event_rate == Decimal("90.00")
+        assert settings["season_open"] == "yes"
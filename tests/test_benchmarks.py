@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.north_simulator import NorthSimulator, SimulatorConfig
+from benchmarks.scenarios import Scenario, run_scenario
+from benchmarks.seed import SeedInfo
+from benchmarks.stats import ScenarioResult, compare_to_baseline, percentile
+from core.migrations import discover
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+# ---------- Percentiles ----------
+
+
+class TestPercentile:
+    def test_empty_sample_is_zero(self):
+        assert percentile([], 95) == 0.0
+
+    def test_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+
+    def test_unsorted_input(self):
+        assert percentile([5.0, 1.0, 3.0], 50) == 3.0
+
+
+# ---------- Scenario result ----------
+
+
+class TestScenarioResult:
+    def test_errors_count_5xx_and_transport_failures(self):
+        result = ScenarioResult(name="x", status_counts=Counter({200: 5, 409: 2, 502: 1}))
+        result.transport_errors = 2
+        assert result.errors == 3
+
+    def test_summary_throughput(self):
+        result = ScenarioResult(name="x", duration_s=2.0)
+        for _ in range(10):
+            result.record(200, 10.0)
+        summary = result.summary()
+        assert summary["requests"] == 10
+        assert summary["throughput_rps"] == 5.0
+        assert summary["p95_ms"] == 10.0
+        assert summary["status_counts"] == {"200": 10}
+
+
+# ---------- Baseline comparison ----------
+
+
+def _summary(p95=100.0, rps=50.0, errors=0) -> dict:
+    return {"p50_ms": 50.0, "p95_ms": p95, "p99_ms": p95, "throughput_rps": rps, "errors": errors}
+
+
+class TestCompareToBaseline:
+    def test_missing_baseline_is_reported(self):
+        assert compare_to_baseline("s", _summary(), None) == ["s: no baseline recorded (run with --save-baseline)"]
+
+    def test_within_tolerance(self):
+        assert compare_to_baseline("s", _summary(p95=115.0, rps=45.0), _summary()) == []
+
+    def test_latency_regression(self):
+        lines = compare_to_baseline("s", _summary(p95=150.0), _summary())
+        assert any("p95_ms" in line for line in lines)
+
+    def test_throughput_regression(self):
+        lines = compare_to_baseline("s", _summary(rps=20.0), _summary())
+        assert lines == ["s: throughput_rps 50.0 → 20.0"]
+
+    def test_new_errors_regress(self):
+        lines = compare_to_baseline("s", _summary(errors=3), _summary())
+        assert lines == ["s: errors 0 → 3"]
+
+    def test_run_without_a_baselines_file_stops_before_benchmarking(self, tmp_path, capsys):
+        from benchmarks.run import main
+
+        assert main(["--baselines", str(tmp_path / "baselines.json")]) == 2
+        assert "--save-baseline" in capsys.readouterr().err
+
+
+# ---------- Driver ----------
+
+
+class TestRunScenario:
+    @pytest.mark.asyncio
+    async def test_runs_requested_number_of_steps(self):
+        north = NorthSimulator(SimulatorConfig(auth_latency_ms=0))
+
+        async def step(rec, seed, ctx, i):
+            await rec.request("POST", "/auth", json={})
+
+        result = await run_scenario(
+            "http://north",
+            Scenario(name="auth", description="", step=step),
+            SeedInfo(),
+            requests=40,
+            concurrency=4,
+            transport=httpx.ASGITransport(app=north.app),
+        )
+
+        assert result.requests == 40
+        assert result.status_counts == Counter({401: 40})
+        assert result.errors == 0
+        assert north.calls["auth"] == 40
+
+
+# ---------- Serialization ----------
+
+
+class TestSerializationPaths:
+    def test_every_path_renders_the_same_json(self):
+        from benchmarks.serialization import make_rows, paths
+
+        bodies = {name: json.loads(render()) for name, render in paths(make_rows(25)).items()}
+        expected = bodies.pop("model_validate")
+        assert expected[0] == {
+            "id": 1,
+            "title": "Outing 1 at Pine Valley",
+            "date": "2026-01-02",
+            "cover_image": "/uploads/albums/1.jpg",
+            "google_drive_link": "https://drive.google.com/drive/folders/00000001",
+        }
+        assert all(body == expected for body in bodies.values())
+
+    def test_cache_rerenders_only_when_version_moves(self):
+        from core.response_cache import SerializedCache
+
+        cache, calls = SerializedCache(), []
+
+        def render() -> bytes:
+            calls.append(1)
+            return b"[%d]" % len(calls)
+
+        assert cache.get("albums", (1,), render) == b"[1]"
+        assert cache.get("albums", (1,), render) == b"[1]"
+        assert cache.get("albums", (2,), render) == b"[2]"
+        assert len(calls) == 2
+
+
+# ---------- Import time ----------
+
+
+class TestImportTime:
+    def test_parse_importtime(self):
+        from benchmarks.import_time import parse_importtime
+
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      2028 |    1171945 | main\n"
+            "Loading something unrelated\n"
+        )
+        assert parse_importtime(stderr) == {"_io": 120, "main": 1171945}
+
+    def test_heavy_modules_are_deferred(self):
+        from benchmarks.import_time import sample
+
+        result = sample()
+        assert result.total_us > 0
+        assert result.deferred == []
+
+
+# ---------- Email templates ----------
+
+
+class TestEmailTemplates:
+    def test_template_paths_match_the_fstring_baseline(self):
+        from benchmarks.email_templates import make_members, paths
+        from services.email_templates import EmailTemplates
+
+        rendered = {name: render() for name, render in paths(make_members(3), EmailTemplates()).items()}
+        baseline = rendered.pop("fstring")
+        for emails in rendered.values():
+            for (subject, text, _), email in zip(baseline, emails, strict=True):
+                assert email.subject == subject
+                assert email.text == text
+            assert "Member 0 &lt;&amp;&gt;" in emails[0].html
+
+
+# ---------- Seeding (against a real Postgres) ----------
+
+
+class TestSeed:
+    def test_seeds_an_empty_database_and_applies_every_migration(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+
+        # Settings are read at import time, so seed in a process pointed at this database
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "from benchmarks.seed import seed_database; "
+                "print(seed_database(users=5, events=3, rush_capacity=5, export_registrants=5).export_event_id)",
+            ],
+            cwd=ROOT,
+            env={**os.environ, "DATABASE_URL": engine.url.render_as_string(hide_password=False), "SECRET_KEY": "x"},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+
+        with engine.connect() as conn:
+            applied = conn.exec_driver_sql("SELECT max(version) FROM saga.schema_migrations").scalar()
+            registered = conn.exec_driver_sql(
+                "SELECT registered_count FROM saga.event WHERE id = %s", (int(result.stdout),)
+            ).scalar()
+        assert applied == discover()[-1].version
+        assert registered == 5  # counted by the 008 trigger, so the later migrations ran
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import shutil
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from services.broadcast_service import BroadcastService, Throttle
+from services.email_service import SmtpPool
+
+
+# ---------- Throttle ----------
+
+
+class TestThrottle:
+    def test_spaces_calls_evenly(self):
+        sleeps = []
+        throttle = Throttle(10, clock=lambda: 100.0, sleep=sleeps.append)
+        for _ in range(4):
+            throttle.wait()
+        assert sleeps == pytest.approx([0.1, 0.2, 0.3])
+
+    def test_idle_time_is_not_banked(self):
+        now, sleeps = [100.0], []
+        throttle = Throttle(10, clock=lambda: now[0], sleep=sleeps.append)
+        throttle.wait()
+        now[0] = 160.0
+        throttle.wait()
+        throttle.wait()
+        assert sleeps == pytest.approx([0.1])
+
+    def test_zero_disables_it(self):
+        throttle = Throttle(0, sleep=lambda seconds: pytest.fail("slept"))
+        throttle.wait()
+
+    def test_rate_holds_across_threads(self):
+        throttle = Throttle(200)
+        started = time.monotonic()
+        threads = [threading.Thread(target=lambda: [throttle.wait() for _ in range(5)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - started >= 19 / 200
+
+
+# ---------- Audience validation ----------
+
+
+class TestStart:
+    @pytest.mark.parametrize("audience", ["everyone", "event_guests"])  # the latter without an event_id
+    def test_rejects_bad_audiences(self, audience):
+        with pytest.raises(HTTPException) as exc:
+            BroadcastService(db=None).start(audience, "Hi", "Hello", "admin@example.com")
+        assert exc.value.status_code == 400
+
+
+# ---------- SMTP pool ----------
+
+
+class TestSmtpPool:
+    @patch("services.email_service.smtplib")
+    def test_reuses_connections(self, mock_smtplib):
+        with SmtpPool(size=2) as pool:
+            assert all(pool.send(f"m{i}@example.com", "Hi", "text", "<p>html</p>") for i in range(5))
+        assert mock_smtplib.SMTP.call_count == 1
+        assert mock_smtplib.SMTP.return_value.send_message.call_count == 5
+        mock_smtplib.SMTP.return_value.quit.assert_called_once()
+
+    @patch("services.email_service.smtplib")
+    def test_failed_connection_is_replaced(self, mock_smtplib):
+        broken, healthy = MagicMock(), MagicMock()
+        broken.send_message.side_effect = OSError("connection reset")
+        mock_smtplib.SMTP.side_effect = [broken, healthy]
+
+        with SmtpPool(size=1) as pool:
+            assert pool.send("a@example.com", "Hi", "text", "html") is False
+            assert pool.send("b@example.com", "Hi", "text", "html") is True
+        broken.quit.assert_called_once()
+        healthy.send_message.assert_called_once()
+
+    @patch("services.email_service.smtplib")
+    def test_never_opens_more_than_size(self, mock_smtplib):
+        mock_smtplib.SMTP.side_effect = lambda *args: MagicMock(send_message=lambda msg: time.sleep(0.01))
+        with SmtpPool(size=3) as pool:
+            threads = [
+                threading.Thread(target=pool.send, args=(f"m{i}@example.com", "Hi", "text", "html"))
+                for i in range(12)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert mock_smtplib.SMTP.call_count <= 3
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def db(engine, tmp_path):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("CREATE TABLE saga.event (id SERIAL PRIMARY KEY)")
+        conn.exec_driver_sql('CREATE TABLE saga."user" (id SERIAL PRIMARY KEY, first_name VARCHAR NOT NULL)')
+        conn.exec_driver_sql("CREATE TABLE saga.user_account (id SERIAL PRIMARY KEY, user_id INT, email VARCHAR NOT NULL)")
+        conn.exec_driver_sql("""
+            INSERT INTO saga."user" (first_name) SELECT 'Member' || g FROM generate_series(1, 450) g;
+            INSERT INTO saga.user_account (user_id, email) SELECT g, 'member' || g || '@example.com' FROM generate_series(1, 450) g;
+            -- Same address, different case: mailed once
+            INSERT INTO saga.user_account (user_id, email) VALUES (1, 'MEMBER1@example.com');
+        """)
+    shutil.copy(MIGRATIONS_DIR / "015_broadcasts.sql", tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+    with Session(engine) as session:
+        yield session
+
+
+class TestRun:
+    @patch("services.broadcast_service.SmtpPool.send", return_value=True)
+    def test_interrupted_broadcast_resumes_after_its_cursor(self, send, db):
+        service = BroadcastService(db)
+        broadcast = service.start("members", "Tee times moved", "Shotgun start at 9.", "admin@example.com")
+        assert broadcast.total == 450
+
+        record, calls = service._record, []
+
+        def crash_on_third_batch(*args):
+            calls.append(args)
+            if len(calls) == 3:
+                raise RuntimeError("worker killed")
+            record(*args)
+
+        with patch.object(service, "_record", side_effect=crash_on_third_batch):
+            broadcast = service.run(broadcast.id, messages_per_second=0, batch_size=100)
+        assert (broadcast.status, broadcast.sent) == ("interrupted", 200)
+
+        broadcast = service.run(broadcast.id, messages_per_second=0, batch_size=100)
+        assert (broadcast.status, broadcast.sent, broadcast.failed) == ("completed", 450, 0)
+
+        recipients = [call.args[0].lower() for call in send.call_args_list]
+        assert len(set(recipients)) == 450
+        # Only the batch in flight when it crashed went out twice
+        assert len(recipients) == 550
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from datetime import date, time
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import core.response_cache as response_cache_module
+from core.response_cache import SerializedCache, cached_response
+from services.calendar_service import (
+    CalendarService,
+    escape_text,
+    feed_token,
+    fold_line,
+    render_calendar,
+    user_id_from_token,
+)
+
+
+def _event(**overrides) -> SimpleNamespace:
+    fields = dict(
+        id=7,
+        township="Montclair",
+        state="NJ",
+        zipcode="07042",
+        golf_course="Pine Valley",
+        date=date(2026, 6, 1),
+        start_time=time(8, 0),
+        member_price=Decimal("120.00"),
+        guest_price=Decimal("150.00"),
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _unfold(body: bytes) -> list[str]:
+    return body.decode().replace("\r\n ", "").split("\r\n")
+
+
+class TestRendering:
+    def test_escape_text(self):
+        assert escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+    def test_fold_line_keeps_lines_short_and_characters_whole(self):
+        line = "DESCRIPTION:" + "é" * 100
+        folded = fold_line(line)
+        assert all(len(part) <= 75 for part in folded.rstrip(b"\r\n").split(b"\r\n"))
+        assert folded.decode().replace("\r\n ", "").rstrip("\r\n") == line
+
+    def test_short_lines_are_not_folded(self):
+        assert fold_line("VERSION:2.0") == b"VERSION:2.0\r\n"
+
+    def test_event_times_are_utc(self):
+        lines = _unfold(render_calendar("SAGA Golf Events", [_event()]))
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert "DTSTART:20260601T120000Z" in lines  # 08:00 EDT
+        assert "DTEND:20260601T170000Z" in lines
+        assert "LOCATION:Pine Valley\\, Montclair\\, NJ 07042" in lines
+        assert any(line.startswith("UID:event-7@") for line in lines)
+        assert lines[-2:] == ["END:VCALENDAR", ""]
+
+
+class TestFeedToken:
+    def test_round_trip(self):
+        assert user_id_from_token(feed_token(42)) == 42
+
+    @pytest.mark.parametrize("token", ["42", "42-", "abc-def", "43-" + feed_token(42).partition("-")[2]])
+    def test_rejects_tampered_tokens(self, token):
+        assert user_id_from_token(token) is None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(response_cache_module, "response_cache", SerializedCache())
+    state = {"version": (1,), "events": 50, "renders": 0}
+
+    def render() -> bytes:
+        state["renders"] += 1
+        return render_calendar("SAGA Golf Events", [_event(id=i) for i in range(state["events"])])
+
+    app = FastAPI()
+
+    @app.get("/calendar.ics")
+    def calendar(request: Request):
+        return cached_response(
+            "calendar", state["version"], render, request,
+            media_type="text/calendar", cache_control="public, max-age=300",
+        )
+
+    return TestClient(app), state
+
+
+class TestConditionalRequests:
+    def test_etag_and_304(self, client):
+        client, state = client
+        first = client.get("/calendar.ics", headers={"Accept-Encoding": "identity"})
+        assert first.status_code == 200
+        assert first.headers["content-type"].startswith("text/calendar")
+        assert first.headers["cache-control"] == "public, max-age=300"
+        etag = first.headers["etag"]
+
+        again = client.get("/calendar.ics", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert state["renders"] == 1
+
+    def test_compressed_variant_etag_also_matches(self, client):
+        client, _ = client
+        gzipped = client.get("/calendar.ics", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.headers["etag"].endswith('-gzip"')
+        again = client.get("/calendar.ics", headers={"If-None-Match": gzipped.headers["etag"]})
+        assert again.status_code == 304
+
+    def test_new_version_gets_a_new_etag(self, client):
+        client, state = client
+        etag = client.get("/calendar.ics").headers["etag"]
+        state["version"], state["events"] = (2,), 51
+        response = client.get("/calendar.ics", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert state["renders"] == 2
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def feed(engine, monkeypatch):
+    """The public events feed over the full schema, with one event."""
+    from benchmarks.seed import MODELS_COVER_MIGRATION, _import_models
+    from core.database import Base
+    from core.migrations import MigrationRunner
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+    _import_models()
+    Base.metadata.create_all(engine)
+    runner = MigrationRunner(engine)
+    runner.baseline(MODELS_COVER_MIGRATION)
+    runner.migrate()
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO saga.event (township, state, zipcode, golf_course, date, start_time, member_price, guest_price, capacity)
+            VALUES ('Pine Valley', 'NJ', '08021', 'Pine Valley', '2026-06-04', '08:00', 75, 95, 144)
+        """))
+    monkeypatch.setattr(response_cache_module, "response_cache", SerializedCache())
+
+    app = FastAPI()
+
+    @app.get("/calendar.ics")
+    def calendar(request: Request):
+        with Session(engine) as db:
+            return CalendarService(db).events_feed(request)
+
+    return TestClient(app), engine
+
+
+class TestFeedVersion:
+    def test_price_edit_gets_a_new_etag(self, feed):
+        client, engine = feed
+        etag = client.get("/calendar.ics").headers["etag"]
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event SET registered_count = registered_count + 1")
+        assert client.get("/calendar.ics", headers={"If-None-Match": etag}).status_code == 304
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event SET member_price = 80")
+        response = client.get("/calendar.ics", headers={"If-None-Match": etag, "Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert "Members $80.00" in "".join(_unfold(response.content))
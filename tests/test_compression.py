@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+import core.response_cache as response_cache_module
+from core.compression import CompressionMiddleware, brotli, negotiate
+from core.response_cache import SerializedCache, cached_json
+
+LARGE = [{"id": i, "title": f"Outing {i} at Pine Valley"} for i in range(200)]
+
+
+class TestNegotiate:
+    def test_prefers_the_highest_q_value(self):
+        assert negotiate("gzip;q=0.5, br;q=0.9", ("br", "gzip")) == "br"
+        assert negotiate("gzip, br;q=0.1", ("br", "gzip")) == "gzip"
+
+    def test_ties_go_to_server_preference(self):
+        assert negotiate("gzip, deflate, br", ("br", "gzip")) == "br"
+
+    def test_only_offers_what_is_available(self):
+        assert negotiate("br", ("gzip",)) is None
+        assert negotiate("gzip, br", ("gzip",)) == "gzip"
+
+    def test_wildcard_and_refusals(self):
+        assert negotiate("*", ("br", "gzip")) == "br"
+        assert negotiate("*, br;q=0", ("br", "gzip")) == "gzip"
+        assert negotiate("gzip;q=0", ("gzip",)) is None
+        assert negotiate("", ("gzip",)) is None
+        assert negotiate("identity", ("gzip",)) is None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(response_cache_module, "response_cache", SerializedCache())
+    monkeypatch.setattr(response_cache_module, "table_versions", lambda db, tables: (1,))
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((f"line {i}\n" for i in range(1000)), media_type="text/plain")
+
+    @app.get("/image")
+    def image():
+        return PlainTextResponse("x" * 5000, media_type="image/png")
+
+    @app.get("/cached")
+    def cached(request: Request):
+        return cached_json(None, "large", ("photo_albums",), lambda: json.dumps(LARGE).encode(), request)
+
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    def test_large_json_is_gzipped(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(json.dumps(LARGE))
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == LARGE
+
+    def test_small_bodies_go_out_as_is(self, client):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_identity_when_client_does_not_ask(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == LARGE
+
+    def test_streaming_responses_are_compressed_per_chunk(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "".join(f"line {i}\n" for i in range(1000))
+
+    def test_binary_types_are_left_alone(self, client):
+        response = client.get("/image", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.skipif(brotli is None, reason="brotli not installed")
+    def test_brotli_when_available(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["content-encoding"] == "br"
+        assert response.json() == LARGE
+
+
+class TestPrecompressedCache:
+    def test_compressed_once_per_version(self, client, monkeypatch):
+        calls = []
+        original = response_cache_module.compress
+
+        def counting(body, encoding):
+            calls.append(encoding)
+            return original(body, encoding)
+
+        monkeypatch.setattr(response_cache_module, "compress", counting)
+
+        for _ in range(3):
+            response = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.json() == LARGE
+        assert calls == ["gzip"]
+
+        monkeypatch.setattr(response_cache_module, "table_versions", lambda db, tables: (2,))
+        client.get("/cached", headers={"Accept-Encoding": "gzip"})
+        assert calls == ["gzip", "gzip"]
+
+    def test_uncompressed_body_for_clients_without_gzip(self, client):
+        response = client.get("/cached", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == LARGE
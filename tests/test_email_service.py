@@ -249,6 +249,147 @@ class TestSendMembershipReceipt:
         assert "Failed to send email" in caplog.text
 
 
+# ---------------------------------------------------------------------------
+# Waitlist offer tests
+# ---------------------------------------------------------------------------
+
+
+class TestSendWaitlistOffer:
+    """Tests for EmailService.send_waitlist_offer."""
+
+    @patch("src.services.email_service.smtplib")
+    def test_email_content_contains_all_fields(self, mock_smtplib, email_service: EmailService):
+        mock_server = MagicMock()
+        mock_smtplib.SMTP.return_value = mock_server
+
+        with _patch_settings():
+            result = email_service.send_waitlist_offer(
+                to_email="guest@example.com",
+                first_name="Sam",
+                event_name="Pine Valley",
+                event_date="2026-06-15",
+                expires_at="Jun 10, 2026 02:30 PM",
+                claim_url="https://saga.example/events/7/register?waitlist_token=abc",
+            )
+
+        assert result is True
+        sent_msg = mock_server.send_message.call_args[0][0]
+        assert sent_msg["To"] == "guest@example.com"
+        assert "Pine Valley" in sent_msg["Subject"]
+
+        payloads = sent_msg.get_payload()
+        for part in payloads:
+            body = part.get_payload(decode=True).decode()
+            assert "Sam" in body
+            assert "2026-06-15" in body
+            assert "Jun 10, 2026 02:30 PM" in body
+            assert "waitlist_token=abc" in body
+
+
+class TestEmailTemplates:
+    """Tests for the compiled templates behind every email."""
+
+    def test_html_is_escaped_and_text_is_not(self):
+        from services.email_templates import get_templates
+
+        email = get_templates().render(
+            "contact_form", name="<b>Eve</b>", email="eve@example.com", subject="Hi", message="a & b"
+        )
+        assert "&lt;b&gt;Eve&lt;/b&gt;" in email.html
+        assert "a &amp; b" in email.html
+        assert "<b>Eve</b>" in email.text
+
+    def test_subject_is_one_line(self):
+        from services.email_templates import get_templates
+
+        email = get_templates().render(
+            "contact_form", name="Eve", email="eve@example.com", subject="Hi\r\nBcc: x@example.com", message="m"
+        )
+        assert "\n" not in email.subject and "\r" not in email.subject
+
+    def test_missing_variable_raises(self):
+        from jinja2 import UndefinedError
+        from services.email_templates import get_templates
+
+        with pytest.raises(UndefinedError):
+            get_templates().render("password_reset")
+
+    def test_render_batch_applies_shared_values(self):
+        from services.email_templates import get_templates
+
+        emails = get_templates().render_batch(
+            "membership_renewal",
+            [
+                {"first_name": "Ann", "tier_name": "Individual", "amount": Decimal("150")},
+                {"first_name": "Bob", "tier_name": "Family", "amount": Decimal("250")},
+            ],
+            season_year=2027,
+            renew_url="https://saga.example/membership",
+        )
+        assert [("Ann" in e.text, "$250.00" in e.text) for e in emails] == [(True, False), (False, True)]
+        assert all("2027" in e.subject and "https://saga.example/membership" in e.html for e in emails)
+
+
+class TestSendBatch:
+    """Tests for EmailService.send_batch and the renewal reminder it carries."""
+
+    @staticmethod
+    def _renewals(email_service: EmailService, count: int) -> list:
+        return [
+            (f"member{i}@example.com", *email_service.render_membership_renewal(
+                first_name=f"Member{i}",
+                tier_name="Individual",
+                season_year=2027,
+                amount=Decimal("75"),
+                renew_url="https://saga.example/membership",
+            ))
+            for i in range(count)
+        ]
+
+    @patch("src.services.email_service.smtplib")
+    def test_one_connection_for_the_whole_batch(self, mock_smtplib, email_service: EmailService):
+        mock_server = MagicMock()
+        mock_smtplib.SMTP.return_value = mock_server
+
+        with _patch_settings():
+            results = email_service.send_batch(self._renewals(email_service, 3))
+
+        assert results == [True, True, True]
+        mock_smtplib.SMTP.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 3
+        mock_server.quit.assert_called_once()
+
+        first = mock_server.send_message.call_args_list[0][0][0]
+        assert first["To"] == "member0@example.com"
+        assert "2027" in first["Subject"]
+        for part in first.get_payload():
+            body = part.get_payload(decode=True).decode()
+            assert "Member0" in body
+            assert "$75.00" in body
+            assert "https://saga.example/membership" in body
+
+    @patch("src.services.email_service.smtplib")
+    def test_failed_recipient_does_not_stop_batch(self, mock_smtplib, email_service: EmailService):
+        mock_server = MagicMock()
+        mock_smtplib.SMTP.return_value = mock_server
+        mock_server.send_message.side_effect = [None, smtplib.SMTPException("Mailbox full"), None]
+
+        with _patch_settings():
+            results = email_service.send_batch(self._renewals(email_service, 3))
+
+        assert results == [True, False, True]
+
+    @patch("src.services.email_service.smtplib")
+    def test_connection_failure_fails_every_message(self, mock_smtplib, email_service: EmailService):
+        mock_smtplib.SMTP.side_effect = ConnectionRefusedError("down")
+
+        with _patch_settings():
+            results = email_service.send_batch(self._renewals(email_service, 2))
+
+        assert results == [False, False]
+
+
 # ---------------------------------------------------------------------------
 # SMTP SSL / TLS mode tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import shutil
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from services.event_reminder_service import EventReminderService, _when, reminder_windows
+
+NOW = datetime(2026, 6, 1, 9, 0)
+
+
+class TestWindows:
+    def test_windows_meet_without_overlapping(self):
+        assert reminder_windows(NOW, [7, 1]) == [
+            ("7d", 7, NOW + timedelta(days=1), NOW + timedelta(days=7)),
+            ("1d", 1, NOW, NOW + timedelta(days=1)),
+        ]
+
+    @pytest.mark.parametrize("starts_at, expected", [
+        (datetime(2026, 6, 1, 15, 0), "today"),
+        (datetime(2026, 6, 2, 7, 30), "tomorrow"),
+        (datetime(2026, 6, 7, 8, 0), "in 6 days"),
+    ])
+    def test_when(self, starts_at, expected):
+        assert _when(starts_at, NOW) == expected
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def db(engine, tmp_path):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event (
+                id SERIAL PRIMARY KEY, golf_course VARCHAR NOT NULL, township VARCHAR NOT NULL,
+                state VARCHAR NOT NULL, zipcode VARCHAR NOT NULL, date DATE NOT NULL, start_time TIME NOT NULL
+            )
+        """)
+        conn.exec_driver_sql('CREATE TABLE saga."user" (id SERIAL PRIMARY KEY, first_name VARCHAR NOT NULL)')
+        conn.exec_driver_sql("CREATE TABLE saga.user_account (id SERIAL PRIMARY KEY, user_id INT, email VARCHAR NOT NULL)")
+        conn.exec_driver_sql("CREATE TABLE saga.guest (id SERIAL PRIMARY KEY, first_name VARCHAR NOT NULL, email VARCHAR NOT NULL)")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event_registration (
+                id SERIAL PRIMARY KEY, event_id INT NOT NULL, user_id INT NULL, guest_id INT NULL,
+                email VARCHAR NULL, payment_status VARCHAR NOT NULL, created_at TIMESTAMP NOT NULL
+            )
+        """)
+        # Two events three and four days out, one tomorrow, one out of range
+        conn.exec_driver_sql("""
+            INSERT INTO saga.event (golf_course, township, state, zipcode, date, start_time) VALUES
+                ('Pine Valley', 'Pine Valley', 'NJ', '08021', '2026-06-04', '08:00'),
+                ('Baltusrol', 'Springfield', 'NJ', '07081', '2026-06-05', '08:00'),
+                ('Ridgewood', 'Paramus', 'NJ', '07652', '2026-06-02', '07:30'),
+                ('Plainfield', 'Edison', 'NJ', '08820', '2026-06-20', '08:00');
+            INSERT INTO saga."user" (first_name) SELECT 'Member' || g FROM generate_series(1, 40) g;
+            INSERT INTO saga.user_account (user_id, email) SELECT g, 'member' || g || '@example.com' FROM generate_series(1, 40) g;
+            INSERT INTO saga.guest (first_name, email) VALUES ('Guest', 'guest@example.com');
+            -- Ten paid members per event, plus a pending hold and a guest on the first
+            INSERT INTO saga.event_registration (event_id, user_id, payment_status, created_at)
+            SELECT (g - 1) / 10 + 1, g, 'paid', '2026-05-01' FROM generate_series(1, 40) g;
+            INSERT INTO saga.event_registration (event_id, user_id, payment_status, created_at) VALUES (1, 1, 'pending', '2026-05-01');
+            INSERT INTO saga.event_registration (event_id, guest_id, payment_status, created_at) VALUES (1, 1, 'paid', '2026-05-01');
+            -- Registered after the 7-day window opened: that reminder is skipped
+            INSERT INTO saga.event_registration (event_id, user_id, payment_status, created_at) VALUES (2, 2, 'paid', '2026-05-31');
+        """)
+    shutil.copy(MIGRATIONS_DIR / "017_event_reminders.sql", tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+    with Session(engine) as session:
+        yield session
+
+
+class TestSendDue:
+    @patch("services.event_reminder_service.EmailService.send_batch")
+    def test_one_pass_covers_every_event_and_never_repeats(self, send_batch, db):
+        send_batch.side_effect = lambda messages: [to != "member15@example.com" for to, *_ in messages]
+        service = EventReminderService(db)
+
+        assert service.send_due(NOW, batch_size=8) == {"7d": (20, 1), "1d": (10, 0)}
+        assert all(len(call.args[0]) <= 8 for call in send_batch.call_args_list)
+        subjects = {subject for call in send_batch.call_args_list for _, subject, *_ in call.args[0]}
+        assert "SAGA Golf — Reminder: Ridgewood tomorrow" in subjects
+        assert "SAGA Golf — Reminder: Pine Valley in 3 days" in subjects
+
+        # Only the failed send is retried
+        send_batch.reset_mock(side_effect=True)
+        send_batch.side_effect = lambda messages: [True] * len(messages)
+        assert service.send_due(NOW) == {"7d": (1, 0), "1d": (0, 0)}
+        assert service.send_due(NOW) == {"7d": (0, 0), "1d": (0, 0)}
+
+    @patch("services.event_reminder_service.EmailService.send_batch", side_effect=lambda m: [True] * len(m))
+    def test_day_before_reminder_follows_the_week_before(self, send_batch, db):
+        service = EventReminderService(db)
+        service.send_due(NOW)
+        # Pine Valley's ten members and its guest; Baltusrol isn't a day out yet
+        assert service.send_due(NOW + timedelta(days=2, hours=12))["1d"] == (11, 0)
+
+    @patch("services.event_reminder_service.EmailService.send_batch", side_effect=lambda m: [True] * len(m))
+    def test_members_are_reached_through_the_account_the_registration_references(self, send_batch, db):
+        # Account ids that don't match their profiles' ids: registrations reference the account
+        db.execute(text("""
+            INSERT INTO saga."user" (id, first_name) VALUES (41, 'Nia'), (42, 'Zed');
+            INSERT INTO saga.user_account (id, user_id, email) VALUES (41, 42, 'zed@example.com'), (42, 41, 'nia@example.com');
+            INSERT INTO saga.event_registration (event_id, user_id, payment_status, created_at) VALUES (3, 41, 'paid', '2026-05-01');
+        """))
+        db.commit()
+
+        EventReminderService(db).send_due(NOW)
+        messages = {to: body for call in send_batch.call_args_list for to, _, body, _ in call.args[0]}
+        assert "Zed" in messages["zed@example.com"]
+        assert "nia@example.com" not in messages
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from core import events
+from core.events import EventUpdated, RegistrationPaid, UploadDiscarded, drain, publish, subscribe
+from services.event_handlers import remove_upload
+
+
+@pytest.fixture
+def handled(monkeypatch):
+    """Subscribe a recorder to every event type, on a clean registry."""
+    monkeypatch.setattr(events, "_handlers", defaultdict(list))
+    seen = []
+    for event_type in (RegistrationPaid, EventUpdated, UploadDiscarded):
+        subscribe(event_type)(lambda event: seen.append((event, threading.current_thread())))
+    return seen
+
+
+@pytest.fixture
+def db():
+    with Session(create_engine("sqlite://")) as session:
+        yield session
+
+
+def _handled_events(seen) -> list:
+    assert drain(timeout=5)
+    return [event for event, _ in seen]
+
+
+# ---------- Without a database server ----------
+
+
+class TestDispatch:
+    def test_events_wait_for_the_commit_and_run_off_the_caller_thread(self, handled, db):
+        db.execute(text("SELECT 1"))
+        publish(db, RegistrationPaid(7))
+        publish(db, UploadDiscarded("/uploads/old.png"))
+        assert _handled_events(handled) == []
+
+        db.commit()
+        assert _handled_events(handled) == [RegistrationPaid(7), UploadDiscarded("/uploads/old.png")]
+        assert threading.current_thread() not in {thread for _, thread in handled}
+
+        # Delivered once; a later commit doesn't repeat them
+        db.execute(text("SELECT 1"))
+        db.commit()
+        assert len(_handled_events(handled)) == 2
+
+    @pytest.mark.parametrize("end", [Session.rollback, Session.close])
+    def test_rollback_or_close_drops_them(self, handled, db, end):
+        db.execute(text("SELECT 1"))
+        publish(db, EventUpdated(3))
+        end(db)
+        db.execute(text("SELECT 1"))
+        db.commit()
+        assert _handled_events(handled) == []
+
+    def test_savepoint_release_waits_for_the_outer_commit(self, handled, db):
+        db.execute(text("SELECT 1"))
+        with db.begin_nested():
+            publish(db, EventUpdated(3))
+        assert _handled_events(handled) == []
+        db.commit()
+        assert _handled_events(handled) == [EventUpdated(3)]
+
+    def test_failing_handler_doesnt_stop_the_rest(self, handled, db):
+        subscribe(EventUpdated)(lambda event: 1 / 0)
+        events._handlers[EventUpdated].reverse()
+        db.execute(text("SELECT 1"))
+        publish(db, EventUpdated(3))
+        publish(db, EventUpdated(4))
+        db.commit()
+        assert _handled_events(handled) == [EventUpdated(3), EventUpdated(4)]
+
+
+class TestRemoveUpload:
+    def test_deletes_the_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "uploads").mkdir()
+        (tmp_path / "uploads" / "old.png").write_bytes(b"png")
+        remove_upload(UploadDiscarded("/uploads/old.png"))
+        assert not (tmp_path / "uploads" / "old.png").exists()
+        remove_upload(UploadDiscarded("/uploads/old.png"))  # already gone: no error
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def pg(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("CREATE TABLE saga.event (id SERIAL PRIMARY KEY, golf_course VARCHAR NOT NULL, date DATE NOT NULL)")
+        conn.exec_driver_sql("CREATE TABLE saga.user_account (id SERIAL PRIMARY KEY, email VARCHAR NOT NULL)")
+        conn.exec_driver_sql("CREATE TABLE saga.guest (id SERIAL PRIMARY KEY, email VARCHAR NOT NULL)")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event_registration (
+                id SERIAL PRIMARY KEY, event_id INT NOT NULL, user_id INT NULL, guest_id INT NULL,
+                email VARCHAR NULL, payment_status VARCHAR NOT NULL, payment_method VARCHAR NULL,
+                amount_paid NUMERIC(10, 2) NULL, transaction_id VARCHAR NULL, north_uniq_id VARCHAR NULL,
+                north_account_id VARCHAR NULL, card_last_four VARCHAR NULL,
+                hold_expires_at TIMESTAMP NULL, paid_at TIMESTAMP NULL, updated_at TIMESTAMP NULL
+            )
+        """)
+        conn.exec_driver_sql("""
+            INSERT INTO saga.event (golf_course, date) VALUES ('Pine Valley', '2026-06-04');
+            INSERT INTO saga.guest (email) VALUES ('guest@example.com');
+            INSERT INTO saga.event_registration (event_id, guest_id, payment_status) VALUES (1, 1, 'pending');
+        """)
+    with patch("core.database.SessionLocal", lambda: Session(engine)), Session(engine) as session:
+        yield session
+
+
+class TestRegistrationReceipt:
+    @patch("services.email_service.EmailService.send_event_registration_receipt")
+    def test_confirmed_hold_sends_the_receipt_after_commit(self, send_receipt, pg):
+        from services.registration_hold_service import confirm_hold
+
+        assert confirm_hold(pg, 1, Decimal("125.00"), "txn-1", "u-1", "a-1", "4242")
+        assert drain(timeout=5)
+        send_receipt.assert_called_once_with(
+            to_email="guest@example.com",
+            event_name="Pine Valley",
+            event_date="Thursday, June 4, 2026",
+            amount=Decimal("125.00"),
+            card_last_four="4242",
+            registration_id=1,
+        )
+
+        # A lapsed hold confirms nothing and sends nothing
+        assert not confirm_hold(pg, 1, Decimal("125.00"), "txn-2", "u-2", "a-2", "4242")
+        assert drain(timeout=5)
+        send_receipt.assert_called_once()
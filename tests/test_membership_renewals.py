@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from services.membership_renewal_service import MembershipRenewalService
+
+
+@pytest.fixture
+def db(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql('CREATE TABLE saga."user" (id SERIAL PRIMARY KEY, first_name VARCHAR NOT NULL)')
+        conn.exec_driver_sql("CREATE TABLE saga.user_account (id SERIAL PRIMARY KEY, user_id INT, email VARCHAR NOT NULL)")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.membership_tiers (
+                id SERIAL PRIMARY KEY, name VARCHAR NOT NULL, amount NUMERIC NOT NULL, is_active BOOLEAN NOT NULL
+            )
+        """)
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.member_memberships (
+                id SERIAL PRIMARY KEY, user_id INT NOT NULL, tier_id INT NOT NULL, payment_id INT NULL,
+                season_year INT NOT NULL, status VARCHAR(30) NOT NULL, marked_paid_by_admin BOOLEAN NOT NULL,
+                renewal_notified_at TIMESTAMP NULL, created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL,
+                UNIQUE (user_id, season_year)
+            )
+        """)
+        conn.exec_driver_sql("INSERT INTO saga.membership_tiers (name, amount, is_active) VALUES ('Individual', 75, true), ('Retired', 50, false)")
+        # 2,000 members: every third one unpaid, every tenth on a retired tier (text() escapes the %)
+        conn.execute(text("""
+            INSERT INTO saga."user" (first_name) SELECT 'Member' || g FROM generate_series(1, 2000) g;
+            INSERT INTO saga.user_account (user_id, email) SELECT g, 'member' || g || '@example.com' FROM generate_series(1, 2000) g;
+            INSERT INTO saga.member_memberships
+                (user_id, tier_id, season_year, status, marked_paid_by_admin, created_at, updated_at)
+            SELECT g, CASE WHEN g % 10 = 0 THEN 2 ELSE 1 END, 2026,
+                   CASE WHEN g % 3 = 0 THEN 'pending' ELSE 'paid' END, false, now(), now()
+            FROM generate_series(1, 2000) g;
+        """))
+    with Session(engine) as session:
+        yield session
+
+
+def _expected_eligible() -> int:
+    return sum(1 for g in range(1, 2001) if g % 3 != 0 and g % 10 != 0)
+
+
+class TestRollOver:
+    def test_creates_pending_rows_once(self, db):
+        service = MembershipRenewalService(db)
+
+        first = service.roll_over(2026)
+        again = service.roll_over(2026)
+
+        assert first.created == first.eligible == _expected_eligible()
+        assert again.created == 0
+        assert db.execute(text(
+            "SELECT count(*) FROM saga.member_memberships WHERE season_year = 2027 AND status = 'pending'"
+        )).scalar() == _expected_eligible()
+
+
+class TestSendReminders:
+    @patch("services.membership_renewal_service.EmailService.send_batch")
+    def test_mails_each_member_once_and_retries_failures(self, send_batch, db):
+        service = MembershipRenewalService(db)
+        service.roll_over(2026)
+
+        send_batch.side_effect = lambda messages: [not to.startswith("member1@") for to, *_ in messages]
+        sent, failed = service.send_reminders(2027, batch_size=250)
+        assert (sent, failed) == (_expected_eligible() - 1, 1)
+        assert all(len(call.args[0]) <= 250 for call in send_batch.call_args_list)
+
+        send_batch.reset_mock(side_effect=True)
+        send_batch.side_effect = lambda messages: [True] * len(messages)
+        assert service.send_reminders(2027) == (1, 0)
+        assert service.send_reminders(2027) == (0, 0)
+
+
+class TestMarkPaid:
+    def test_only_pending_rows_change(self, db):
+        service = MembershipRenewalService(db)
+        pending = db.execute(text(
+            "SELECT id FROM saga.member_memberships WHERE status = 'pending' ORDER BY id LIMIT 3"
+        )).scalars().all()
+        paid = db.execute(text("SELECT id FROM saga.member_memberships WHERE status = 'paid' LIMIT 1")).scalar()
+
+        assert service.mark_paid([*pending, paid, pending[0], 999999]) == sorted(pending)
+        assert service.mark_paid(pending) == []
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import shutil
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from core.migrations import MIGRATIONS_DIR, MigrationRunner, discover, split_statements
+
+
+# ---------- Discovery & splitting ----------
+
+
+class TestDiscover:
+    def test_repo_migrations_are_ordered_and_unique(self):
+        versions = [m.version for m in discover()]
+        assert versions == sorted(set(versions))
+        assert versions[0] == 1
+
+    def test_ignores_non_migration_files(self, tmp_path):
+        (tmp_path / "002_b.sql").write_text("SELECT 2;")
+        (tmp_path / "001_a.sql").write_text("SELECT 1;")
+        (tmp_path / "README.md").write_text("docs")
+        (tmp_path / "notes.sql").write_text("SELECT 0;")
+
+        assert [(m.version, m.name) for m in discover(tmp_path)] == [(1, "a"), (2, "b")]
+
+
+class TestSplitStatements:
+    def test_splits_on_top_level_semicolons(self):
+        sql = "BEGIN;\nCREATE TABLE t (id int);\n-- trailing comment\nCOMMIT;\n"
+        assert split_statements(sql) == ["BEGIN", "CREATE TABLE t (id int)", "-- trailing comment\nCOMMIT"]
+
+    def test_ignores_semicolons_in_strings_comments_and_dollar_quotes(self):
+        sql = (
+            "COMMENT ON TABLE t IS 'a;b''c';\n"
+            "/* x; y */ SELECT 1;\n"
+            "CREATE FUNCTION f() RETURNS int AS $$ BEGIN RETURN 1; END; $$ LANGUAGE plpgsql;\n"
+            "CREATE FUNCTION g() RETURNS int AS $body$ SELECT 1; $body$ LANGUAGE sql;"
+        )
+        statements = split_statements(sql)
+
+        assert len(statements) == 4
+        assert statements[0] == "COMMENT ON TABLE t IS 'a;b''c'"
+        assert "RETURN 1; END;" in statements[2]
+
+    def test_drops_comment_only_chunks(self):
+        assert split_statements("-- header only\n-- more;\n") == []
+
+    def test_concurrent_index_migration_has_no_transaction(self):
+        migration = next(m for m in discover() if m.name == "registration_lookup_indexes")
+        statements = split_statements(migration.sql)
+
+        assert statements and all("CONCURRENTLY" in s for s in statements)
+        assert not any(s.upper().endswith(("BEGIN", "COMMIT")) for s in statements)
+
+
+# ---------- Against a real Postgres ----------
+
+
+def _create_hot_tables(engine) -> None:
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event_registration (
+                id SERIAL PRIMARY KEY, event_id INT NOT NULL, user_id INT NULL,
+                email VARCHAR NULL, payment_status VARCHAR NOT NULL DEFAULT 'paid'
+            )
+        """)
+        conn.exec_driver_sql("CREATE TABLE saga.guest (id SERIAL PRIMARY KEY, email VARCHAR NOT NULL)")
+        # 200 events × 100 registrations, half members, half guests (text() escapes the %)
+        conn.execute(text("""
+            INSERT INTO saga.event_registration (event_id, user_id, email)
+            SELECT g % 200, CASE WHEN g % 2 = 0 THEN g END, 'player' || g || '@example.com'
+            FROM generate_series(1, 20000) AS g
+        """))
+        conn.exec_driver_sql("""
+            INSERT INTO saga.guest (email)
+            SELECT 'guest' || g || '@example.com' FROM generate_series(1, 20000) AS g
+        """)
+
+
+def _plan(engine, sql: str) -> str:
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN {sql}", execution_options={"no_parameters": True})
+        return "\n".join(row[0] for row in rows)
+
+
+class TestMigrationRunner:
+    def test_applies_once_and_records_versions(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        (tmp_path / "001_widgets.sql").write_text(
+            "BEGIN;\nCREATE TABLE saga.widget (id int);\nCOMMIT;\n"
+        )
+        shutil.copy(MIGRATIONS_DIR / "007_registration_lookup_indexes.sql", tmp_path)
+        runner = MigrationRunner(engine, tmp_path)
+
+        assert [m.version for m in runner.migrate()] == [1, 7]
+        assert runner.migrate() == []
+        assert all(applied for _, applied in runner.status())
+
+    def test_failed_migration_is_not_recorded(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        (tmp_path / "001_broken.sql").write_text("BEGIN;\nCREATE TABLE saga.x (id int);\nSELECT nope;\nCOMMIT;\n")
+        runner = MigrationRunner(engine, tmp_path)
+
+        with pytest.raises(ProgrammingError, match="nope"):
+            runner.migrate()
+        assert runner.pending()[0].version == 1
+
+    def test_percent_signs_reach_postgres_as_written(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        (tmp_path / "001_percent.sql").write_text(
+            "BEGIN;\n"
+            "CREATE TABLE saga.pct AS SELECT format('%s%%', 50) AS label, 7 % 4 AS rest, 'a%' AS pattern;\n"
+            "COMMIT;\n"
+        )
+        MigrationRunner(engine, tmp_path).migrate()
+
+        with engine.connect() as conn:
+            assert tuple(conn.execute(text("SELECT * FROM saga.pct")).one()) == ("50%", 3, "a%")
+
+
+class TestHotQueriesUseIndexes:
+    @pytest.fixture(autouse=True)
+    def indexed(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        for name in (
+            "006_registration_holds.sql",
+            "007_registration_lookup_indexes.sql",
+            "021_drop_registration_event_index.sql",
+        ):
+            shutil.copy(MIGRATIONS_DIR / name, tmp_path)
+        MigrationRunner(engine, tmp_path).migrate()
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("ANALYZE saga.event_registration")
+            conn.exec_driver_sql("ANALYZE saga.guest")
+
+    def test_duplicate_guest_check(self, engine):
+        plan = _plan(engine, """
+            SELECT id FROM saga.event_registration
+            WHERE event_id = 7 AND email = 'player207@example.com'
+        """)
+        assert "idx_event_registration_event_email" in plan
+
+    def test_duplicate_member_check(self, engine):
+        plan = _plan(engine, "SELECT id FROM saga.event_registration WHERE event_id = 8 AND user_id = 208")
+        assert "idx_event_registration_event_user" in plan
+
+    def test_event_count(self, engine):
+        plan = _plan(engine, "SELECT count(*) FROM saga.event_registration WHERE event_id = 9")
+        assert "idx_event_registration_event" in plan
+        assert "Seq Scan" not in plan
+
+    def test_no_single_column_event_index(self, engine):
+        # 006's (event_id, payment_status) already leads with event_id
+        with engine.connect() as conn:
+            indexes = set(conn.execute(text(
+                "SELECT indexname FROM pg_indexes WHERE schemaname = 'saga' AND tablename = 'event_registration'"
+            )).scalars())
+        assert "idx_event_registration_event_status" in indexes
+        assert "idx_event_registration_event_id" not in indexes
+
+    def test_guest_by_email(self, engine):
+        plan = _plan(engine, "SELECT id FROM saga.guest WHERE email = 'guest42@example.com'")
+        assert "idx_guest_email" in plan
+
+
+class TestRegisteredCountTrigger:
+    @pytest.fixture(autouse=True)
+    def counted(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("TRUNCATE saga.event_registration")
+            conn.exec_driver_sql("CREATE TABLE saga.event (id INT PRIMARY KEY)")
+            conn.exec_driver_sql("INSERT INTO saga.event (id) VALUES (1), (2)")
+            conn.exec_driver_sql(
+                "INSERT INTO saga.event_registration (event_id, payment_status) "
+                "VALUES (1, 'paid'), (1, 'failed'), (2, 'pending')"
+            )
+        shutil.copy(MIGRATIONS_DIR / "008_event_registered_count.sql", tmp_path)
+        MigrationRunner(engine, tmp_path).migrate()
+
+    @staticmethod
+    def _counts(engine) -> dict[int, int]:
+        with engine.connect() as conn:
+            return dict(conn.exec_driver_sql("SELECT id, registered_count FROM saga.event").all())
+
+    def test_backfill_counts_seat_holding_rows(self, engine):
+        assert self._counts(engine) == {1: 1, 2: 1}
+
+    def test_insert_refund_and_delete_keep_count_in_step(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO saga.event_registration (event_id, payment_status) VALUES (1, 'pending')")
+            assert self._counts(engine)[1] == 1  # other connection doesn't see it until commit
+        assert self._counts(engine) == {1: 2, 2: 1}
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event_registration SET payment_status = 'paid' WHERE event_id = 1")
+            conn.exec_driver_sql("UPDATE saga.event_registration SET payment_status = 'refunded' WHERE event_id = 2")
+            conn.exec_driver_sql("UPDATE saga.event_registration SET event_id = 2 WHERE id = (SELECT min(id) FROM saga.event_registration WHERE event_id = 1)")
+        assert self._counts(engine) == {1: 2, 2: 1}
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM saga.event_registration WHERE event_id = 1")
+        assert self._counts(engine) == {1: 0, 2: 1}
+
+
+class TestSearchIndexes:
+    @pytest.fixture(autouse=True)
+    def searchable(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE saga.event_registration ADD COLUMN company_name VARCHAR NULL")
+            conn.exec_driver_sql("ALTER TABLE saga.guest ADD COLUMN first_name VARCHAR NOT NULL DEFAULT 'Pat'")
+            conn.exec_driver_sql("ALTER TABLE saga.guest ADD COLUMN last_name VARCHAR NOT NULL DEFAULT 'Golfer'")
+            conn.exec_driver_sql('CREATE TABLE saga."user" (id SERIAL PRIMARY KEY, first_name VARCHAR NOT NULL, last_name VARCHAR NOT NULL)')
+            conn.exec_driver_sql("CREATE TABLE saga.user_account (id SERIAL PRIMARY KEY, user_id INT, email VARCHAR NOT NULL)")
+            conn.exec_driver_sql("CREATE TABLE saga.event (id INT PRIMARY KEY, golf_course VARCHAR NOT NULL, township VARCHAR NOT NULL)")
+            conn.exec_driver_sql("""
+                UPDATE saga.guest SET first_name = 'First' || id, last_name = 'Last' || id
+            """)
+        shutil.copy(MIGRATIONS_DIR / "009_admin_search.sql", tmp_path)
+        MigrationRunner(engine, tmp_path).migrate()
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("ANALYZE saga.guest")
+
+    def test_generated_columns_follow_the_row(self, engine):
+        with engine.connect() as conn:
+            text, vector = conn.exec_driver_sql(
+                "SELECT search_text, search_vector::text FROM saga.guest WHERE id = 42"
+            ).one()
+        assert text == "first42 last42 guest42@example.com"
+        assert "'first42'" in vector
+
+    def test_prefix_match_uses_tsvector_index(self, engine):
+        plan = _plan(engine, "SELECT id FROM saga.guest WHERE search_vector @@ to_tsquery('simple', 'first42:*')")
+        assert "idx_guest_search_vector" in plan
+
+    def test_fuzzy_match_uses_trigram_index(self, engine):
+        plan = _plan(engine, "SELECT id FROM saga.guest WHERE search_text % 'frist42 last42'")
+        assert "idx_guest_search_trgm" in plan
+
+
+class TestRegistrationStatsRollups:
+    @pytest.fixture(autouse=True)
+    def rolled_up(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("TRUNCATE saga.event_registration")
+            conn.exec_driver_sql("""
+                ALTER TABLE saga.event_registration
+                    ADD COLUMN amount_paid NUMERIC(10, 2) NULL,
+                    ADD COLUMN is_sponsor BOOLEAN NOT NULL DEFAULT false,
+                    ADD COLUMN sponsor_amount NUMERIC(10, 2) NULL,
+                    ADD COLUMN created_at TIMESTAMP NOT NULL DEFAULT '2026-05-01 09:00'
+            """)
+            conn.exec_driver_sql("CREATE TABLE saga.event (id INT PRIMARY KEY)")
+            conn.exec_driver_sql("INSERT INTO saga.event (id) VALUES (1), (2)")
+            conn.exec_driver_sql("""
+                INSERT INTO saga.event_registration (event_id, user_id, payment_status, amount_paid)
+                VALUES (1, 10, 'paid', 100), (1, NULL, 'paid', 120), (1, 11, 'failed', 100)
+            """)
+        shutil.copy(MIGRATIONS_DIR / "010_registration_stats_rollups.sql", tmp_path)
+        MigrationRunner(engine, tmp_path).migrate()
+
+    @staticmethod
+    def _stats(engine) -> dict[int, tuple]:
+        with engine.connect() as conn:
+            return {
+                row[0]: tuple(row[1:])
+                for row in conn.exec_driver_sql(
+                    "SELECT event_id, registrations, members, guests, sponsors, "
+                    "revenue, sponsor_revenue, refunds, refunded_amount FROM saga.event_stats"
+                )
+            }
+
+    @staticmethod
+    def _daily(engine) -> list[tuple]:
+        with engine.connect() as conn:
+            return [
+                tuple(row) for row in conn.exec_driver_sql(
+                    "SELECT event_id, day::text, registrations, revenue "
+                    "FROM saga.event_registration_daily ORDER BY event_id, day"
+                )
+            ]
+
+    def test_backfill_counts_paid_rows(self, engine):
+        assert self._stats(engine) == {1: (2, 1, 1, 0, 220, 0, 0, 0)}
+        assert self._daily(engine) == [(1, "2026-05-01", 2, 220)]
+
+    def test_payment_sponsor_and_refund_update_incrementally(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("""
+                INSERT INTO saga.event_registration
+                    (event_id, user_id, payment_status, amount_paid, is_sponsor, sponsor_amount, created_at)
+                VALUES (2, 12, 'pending', 350, true, 250, '2026-05-03 18:00')
+            """)
+        assert 2 not in self._stats(engine)  # a hold isn't a registration yet
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event_registration SET payment_status = 'paid' WHERE event_id = 2")
+        assert self._stats(engine)[2] == (1, 1, 0, 1, 350, 250, 0, 0)
+        assert self._daily(engine)[-1] == (2, "2026-05-03", 1, 350)
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "UPDATE saga.event_registration SET payment_status = 'refunded' WHERE event_id = 1 AND user_id = 10"
+            )
+        assert self._stats(engine)[1] == (1, 0, 1, 0, 120, 0, 1, 100)
+        assert self._daily(engine)[0] == (1, "2026-05-01", 1, 120)
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM saga.event_registration")
+        assert self._stats(engine) == {1: (0, 0, 0, 0, 0, 0, 0, 0), 2: (0, 0, 0, 0, 0, 0, 0, 0)}
+
+    def test_rebuild_matches_incremental(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event_registration SET payment_status = 'voided' WHERE user_id IS NULL")
+        incremental = self._stats(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("SELECT saga.rebuild_registration_stats()")
+        assert self._stats(engine) == incremental
+
+
+class TestDataVersions:
+    @pytest.fixture(autouse=True)
+    def versioned(self, engine, tmp_path):
+        _create_hot_tables(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE saga.partners (id SERIAL PRIMARY KEY, name VARCHAR NOT NULL)")
+        shutil.copy(MIGRATIONS_DIR / "013_data_versions.sql", tmp_path)
+        MigrationRunner(engine, tmp_path).migrate()
+
+    @staticmethod
+    def _versions(engine) -> dict[str, int]:
+        with engine.connect() as conn:
+            return dict(conn.exec_driver_sql("SELECT name, version FROM saga.data_version").all())
+
+    def test_only_existing_tables_are_versioned(self, engine):
+        assert self._versions(engine) == {"partners": 1}
+
+    def test_each_write_statement_bumps_once(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO saga.partners (name) VALUES ('a'), ('b'), ('c')")
+            conn.exec_driver_sql("UPDATE saga.partners SET name = upper(name) WHERE false")
+        assert self._versions(engine) == {"partners": 3}
+
+    def test_applies_to_every_cached_table_and_feeds_table_versions(self, engine, tmp_path):
+        from sqlalchemy.orm import Session
+
+        from core.response_cache import table_versions
+
+        tables = ("photo_albums", "partners", "carousel_images", "banner_messages", "banner_settings")
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP SCHEMA saga CASCADE")
+            conn.exec_driver_sql("CREATE SCHEMA saga")
+            for table in tables:
+                conn.exec_driver_sql(f"CREATE TABLE saga.{table} (id SERIAL PRIMARY KEY)")
+        shutil.copy(MIGRATIONS_DIR / "013_data_versions.sql", tmp_path)
+        assert [m.version for m in MigrationRunner(engine, tmp_path).migrate()] == [13]
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO saga.carousel_images DEFAULT VALUES")
+        with Session(engine) as db:
+            assert table_versions(db, tables) == (1, 1, 2, 1, 1)
+
+
+class TestEventCalendarVersion:
+    @pytest.fixture(autouse=True)
+    def versioned(self, engine, tmp_path):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+            conn.exec_driver_sql("CREATE SCHEMA saga")
+            conn.exec_driver_sql("""
+                CREATE TABLE saga.event (
+                    id INT PRIMARY KEY, township VARCHAR, state VARCHAR, zipcode VARCHAR,
+                    golf_course VARCHAR, date DATE, start_time TIME,
+                    registered_count INT NOT NULL DEFAULT 0
+                )
+            """)
+            conn.exec_driver_sql("INSERT INTO saga.event (id, golf_course) VALUES (1, 'Pine Valley')")
+        for name in ("013_data_versions.sql", "014_event_calendar_version.sql"):
+            shutil.copy(MIGRATIONS_DIR / name, tmp_path)
+        MigrationRunner(engine, tmp_path).migrate()
+
+    @staticmethod
+    def _version(engine) -> int:
+        with engine.connect() as conn:
+            return conn.exec_driver_sql("SELECT version FROM saga.data_version WHERE name = 'event'").scalar()
+
+    def test_seat_counts_do_not_invalidate_the_feed(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event SET registered_count = registered_count + 1")
+        assert self._version(engine) == 1
+
+    def test_calendar_columns_do(self, engine):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event SET golf_course = 'Baltusrol'")
+            conn.exec_driver_sql("INSERT INTO saga.event (id, golf_course) VALUES (2, 'Ridgewood')")
+        assert self._version(engine) == 3
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+import src.services.north_payment_service as north
+from benchmarks.north_simulator import NorthSimulator, SimulatorConfig
+from benchmarks.postgres import free_port
+from benchmarks.run import serve_in_thread
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------- Circuit breaker ----------
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = north.CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=_FakeClock())
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(north.NorthUnavailableError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after == 30
+
+    def test_success_resets_failure_count(self):
+        breaker = north.CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=_FakeClock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_half_open_allows_single_probe(self):
+        clock = _FakeClock()
+        breaker = north.CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 30
+        assert breaker.state == "half_open"
+        breaker.before_call()
+        with pytest.raises(north.NorthUnavailableError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self):
+        clock = _FakeClock()
+        breaker = north.CircuitBreaker(failure_threshold=5, reset_timeout=30, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now += 31
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.retry_after() == 30
+
+    def test_aborted_probe_frees_slot(self):
+        clock = _FakeClock()
+        breaker = north.CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now += 10
+
+        breaker.before_call()
+        breaker.record_abort()
+        breaker.before_call()
+
+
+# ---------- Bulkhead ----------
+
+
+class TestBulkhead:
+    @pytest.mark.asyncio
+    async def test_fails_fast_when_full(self):
+        bulkhead = north.Bulkhead(max_concurrency=2, max_wait=0.05)
+        release = asyncio.Event()
+
+        async def hold():
+            async with bulkhead.slot():
+                await release.wait()
+
+        holders = [asyncio.create_task(hold()) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert bulkhead.in_flight == 2
+
+        with pytest.raises(north.NorthUnavailableError) as exc_info:
+            async with bulkhead.slot():
+                pass
+        assert exc_info.value.retry_after == 1
+
+        release.set()
+        await asyncio.gather(*holders)
+        assert bulkhead.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_freed_slot(self):
+        bulkhead = north.Bulkhead(max_concurrency=1, max_wait=1)
+
+        async def hold():
+            async with bulkhead.slot():
+                await asyncio.sleep(0.05)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        async with bulkhead.slot():
+            pass
+        await holder
+
+    def test_cap_is_shared_with_loops_in_other_threads(self):
+        bulkhead = north.Bulkhead(max_concurrency=2, max_wait=0.05)
+        held, release = threading.Event(), threading.Event()
+
+        async def hold_both():
+            async def hold():
+                async with bulkhead.slot():
+                    await asyncio.to_thread(release.wait, 5)
+
+            holders = [asyncio.create_task(hold()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            held.set()
+            await asyncio.gather(*holders)
+
+        async def take() -> bool:
+            async with bulkhead.slot():
+                return True
+
+        # A job's loop (asyncio.run in its own thread) fills the bulkhead
+        job = threading.Thread(target=asyncio.run, args=(hold_both(),))
+        job.start()
+        assert held.wait(5)
+        assert bulkhead.in_flight == 2
+        with pytest.raises(north.NorthUnavailableError):
+            asyncio.run(take())
+
+        # A waiter on this loop gets the slot the other loop frees
+        bulkhead.max_wait = 2
+        threading.Timer(0.05, release.set).start()
+        assert asyncio.run(take())
+        job.join(5)
+        assert bulkhead.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_keep_a_slot(self):
+        bulkhead = north.Bulkhead(max_concurrency=1, max_wait=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with bulkhead.slot():
+                await release.wait()
+
+        async def wait_for_slot():
+            async with bulkhead.slot():
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # The worker thread may take the freed slot after the cancel; it hands it straight back
+        await asyncio.sleep(0.1)
+        assert bulkhead.in_flight == 0
+
+
+# ---------- Guarded gateway calls ----------
+
+
+@pytest.fixture
+def sim(monkeypatch) -> NorthSimulator:
+    simulator = NorthSimulator(
+        SimulatorConfig(auth_latency_ms=0, charge_latency_ms=0, transaction_latency_ms=0)
+    )
+    port = free_port()
+    monkeypatch.setattr(north, "NORTH_BASE_URL", f"http://127.0.0.1:{port}")
+    monkeypatch.setattr(north, "NORTH_MID", simulator.config.mid)
+    monkeypatch.setattr(north, "NORTH_DEV_KEY", simulator.config.developer_key)
+    monkeypatch.setattr(north, "NORTH_PASSWORD", simulator.config.password)
+    monkeypatch.setattr(north, "_breaker", north.CircuitBreaker(2, 30))
+    monkeypatch.setattr(north, "_bulkhead", north.Bulkhead(2, 0.05))
+    with serve_in_thread(simulator.app, port):
+        yield simulator
+
+
+class TestGuardedCalls:
+    @pytest.mark.asyncio
+    async def test_gateway_errors_open_breaker_and_stop_calls(self, sim: NorthSimulator):
+        sim.script_outcomes("ERROR", "ERROR")
+        for _ in range(2):
+            with pytest.raises(north.NorthGatewayError):
+                await north.charge_card("tok_ok", 10)
+
+        with pytest.raises(north.NorthUnavailableError):
+            await north.charge_card("tok_ok", 10)
+        assert sim.calls["charge"] == 2
+
+    @pytest.mark.asyncio
+    async def test_proxy_error_pages_count_as_gateway_failures(self, sim: NorthSimulator):
+        sim.script_outcomes(*["PROXY_ERROR"] * 5)
+        for _ in range(2):
+            with pytest.raises(north.NorthGatewayError, match="status 502"):
+                await north.charge_card("tok_ok", 10)
+
+        assert north._breaker.state == "open"
+        with pytest.raises(north.NorthUnavailableError):
+            await north.charge_card("tok_ok", 10)
+        assert sim.calls["charge"] == 2
+
+    @pytest.mark.asyncio
+    async def test_declines_do_not_trip_breaker(self, sim: NorthSimulator):
+        for _ in range(3):
+            with pytest.raises(north.NorthDeclinedError):
+                await north.charge_card("tok_decline", 10)
+        assert north._breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_4xx_rejections_do_not_trip_breaker(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", 10)
+        for _ in range(3):
+            with pytest.raises(north.NorthRequestError):
+                await north.refund_transaction(charge.account_id, charge.transaction_id, 10, "a@b.c")
+        assert north._breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_caps_concurrent_charges(self, sim: NorthSimulator):
+        sim.config.charge_latency_ms = 300
+
+        results = await asyncio.gather(
+            *(north.charge_card("tok_ok", 10) for _ in range(4)), return_exceptions=True
+        )
+
+        rejected = [r for r in results if isinstance(r, north.NorthUnavailableError)]
+        assert len(rejected) == 2
+        assert sim.calls["charge"] == 2
+
+    @pytest.mark.asyncio
+    async def test_charge_phase_timeout(self, sim: NorthSimulator, monkeypatch):
+        monkeypatch.setattr(north, "NORTH_CHARGE_TIMEOUT", 0.1)
+        sim.config.charge_latency_ms = 500
+
+        with pytest.raises(north.NorthGatewayError, match="timed out"):
+            await north.charge_card("tok_ok", 10)
+
+
+# ---------- Reading responses ----------
+
+
+class TestRead:
+    @pytest.mark.parametrize("status", [200, 404, 502])
+    def test_non_json_body_is_a_gateway_failure_whatever_the_status(self, status):
+        resp = httpx.Response(status, text="<html>Bad Gateway</html>")
+        with pytest.raises(north.NorthGatewayError) as exc_info:
+            north._read(resp, "Refund failed.")
+        assert type(exc_info.value) is north.NorthGatewayError
+
+    @pytest.mark.parametrize("status, error", [(400, north.NorthRequestError), (503, north.NorthGatewayError)])
+    def test_json_error_carries_norths_message(self, status, error):
+        resp = httpx.Response(status, json={"message": "Refund exceeds captured amount"})
+        with pytest.raises(error, match="exceeds") as exc_info:
+            north._read(resp, "Refund failed.")
+        assert type(exc_info.value) is error
+
+    def test_json_list_is_not_a_response(self):
+        with pytest.raises(north.NorthGatewayError):
+            north._read(httpx.Response(200, json=[1, 2]), "Listing failed.")
+
+    def test_success(self):
+        assert north._read(httpx.Response(201, json={"uniq_id": "ccs_1"}), "Payment failed.") == {"uniq_id": "ccs_1"}
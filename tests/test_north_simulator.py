@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+
+import httpx
+import pytest
+
+import src.services.north_payment_service as north
+from benchmarks.north_simulator import NorthSimulator, SimulatorConfig
+from benchmarks.postgres import free_port
+from benchmarks.run import serve_in_thread
+
+
+def _config(**overrides) -> SimulatorConfig:
+    values = {
+        "auth_latency_ms": 0,
+        "charge_latency_ms": 0,
+        "transaction_latency_ms": 0,
+        **overrides,
+    }
+    return SimulatorConfig(**values)
+
+
+@pytest.fixture
+def sim(monkeypatch) -> NorthSimulator:
+    """Run a simulator over real HTTP and point north_payment_service at it."""
+    simulator = NorthSimulator(_config())
+    port = free_port()
+    monkeypatch.setattr(north, "NORTH_BASE_URL", f"http://127.0.0.1:{port}")
+    monkeypatch.setattr(north, "NORTH_MID", simulator.config.mid)
+    monkeypatch.setattr(north, "NORTH_DEV_KEY", simulator.config.developer_key)
+    monkeypatch.setattr(north, "NORTH_PASSWORD", simulator.config.password)
+    with serve_in_thread(simulator.app, port):
+        yield simulator
+
+
+# ---------- Charge ----------
+
+
+class TestCharge:
+    @pytest.mark.asyncio
+    async def test_approved_charge(self, sim: NorthSimulator):
+        result = await north.charge_card("tok_ok", Decimal("75.00"))
+
+        assert result.approved is True
+        assert result.uniq_id.startswith("ccs_")
+        assert result.transaction_id == result.uniq_id.removeprefix("ccs_")
+        assert result.account_id == sim.config.account_id
+        assert sim.transactions[int(result.transaction_id)].amount == Decimal("75.00")
+
+    @pytest.mark.asyncio
+    async def test_http_201_decline_body_raises_declined(self, sim: NorthSimulator):
+        with pytest.raises(north.NorthDeclinedError) as exc_info:
+            await north.charge_card("tok_decline_insufficient", 75)
+
+        assert exc_info.value.result.transaction_id is not None
+        assert sim.calls["charge"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scripted_outcomes_take_precedence(self, sim: NorthSimulator):
+        sim.script_outcomes("DECLINE", "APPROVAL")
+
+        with pytest.raises(north.NorthDeclinedError):
+            await north.charge_card("tok_ok", 10)
+        assert (await north.charge_card("tok_decline", 10)).approved is True
+
+    @pytest.mark.asyncio
+    async def test_processor_error_raises_gateway_error(self, sim: NorthSimulator):
+        sim.script_outcomes("ERROR")
+        with pytest.raises(north.NorthGatewayError, match="Processor unavailable"):
+            await north.charge_card("tok_ok", 10)
+
+    @pytest.mark.asyncio
+    async def test_bad_credentials(self, sim: NorthSimulator, monkeypatch):
+        monkeypatch.setattr(north, "NORTH_PASSWORD", "wrong")
+        with pytest.raises(north.NorthGatewayError, match="authentication failed"):
+            await north.charge_card("tok_ok", 10)
+
+    @pytest.mark.asyncio
+    async def test_latency_is_injected(self, sim: NorthSimulator):
+        sim.config.auth_latency_ms = 100
+        sim.config.charge_latency_ms = 150
+
+        start = time.perf_counter()
+        await north.charge_card("tok_ok", 10)
+
+        assert time.perf_counter() - start >= 0.25
+
+
+# ---------- Void / refund ----------
+
+
+class TestVoidAndRefund:
+    @pytest.mark.asyncio
+    async def test_void_before_settlement(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", 50)
+        result = await north.void_transaction(charge.account_id, charge.transaction_id, "a@b.c")
+
+        assert result.approved is True
+        assert sim.transactions[int(charge.transaction_id)].status == "voided"
+
+    @pytest.mark.asyncio
+    async def test_void_after_settlement_is_rejected(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", 50)
+        sim.settle()
+
+        with pytest.raises(north.NorthGatewayError, match="settled"):
+            await north.void_transaction(charge.account_id, charge.transaction_id, "a@b.c")
+
+    @pytest.mark.asyncio
+    async def test_refund_requires_settlement(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", 50)
+
+        with pytest.raises(north.NorthGatewayError, match="not settled"):
+            await north.refund_transaction(charge.account_id, charge.transaction_id, 50, "a@b.c")
+
+    @pytest.mark.asyncio
+    async def test_partial_then_full_refund(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", 50)
+        sim.settle()
+
+        await north.refund_transaction(charge.account_id, charge.transaction_id, 20, "a@b.c")
+        txn = sim.transactions[int(charge.transaction_id)]
+        assert (txn.status, txn.refunded_amount) == ("approved", Decimal("20"))
+
+        await north.refund_transaction(charge.account_id, charge.transaction_id, 30, "a@b.c")
+        assert txn.status == "refunded"
+
+        with pytest.raises(north.NorthGatewayError):
+            await north.refund_transaction(charge.account_id, charge.transaction_id, 1, "a@b.c")
+
+
+# ---------- Tokens and listing (in-process) ----------
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _client(sim: NorthSimulator) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=sim.app), base_url="http://north")
+
+
+async def _token(client: httpx.AsyncClient, sim: NorthSimulator) -> str:
+    resp = await client.post(
+        "/auth",
+        json={
+            "mid": sim.config.mid,
+            "developerKey": sim.config.developer_key,
+            "password": sim.config.password,
+        },
+    )
+    return resp.json()["token"]
+
+
+class TestTokenTtl:
+    @pytest.mark.asyncio
+    async def test_token_expires_after_ttl(self):
+        clock = _FakeClock()
+        sim = NorthSimulator(_config(token_ttl_s=60), clock=clock)
+
+        async with await _client(sim) as client:
+            headers = {"Authorization": f"Bearer {await _token(client, sim)}"}
+            url = f"/mids/{sim.config.mid}/gateways/payment"
+
+            assert (await client.post(url, json={"token": "t"}, headers=headers)).status_code == 201
+            clock.now = 61
+            resp = await client.post(url, json={"token": "t"}, headers=headers)
+
+        assert resp.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_expire_tokens_control_endpoint(self):
+        sim = NorthSimulator(_config())
+
+        async with await _client(sim) as client:
+            headers = {"Authorization": f"Bearer {await _token(client, sim)}"}
+            await client.post("/_sim/expire-tokens")
+            resp = await client.get(f"/accounts/{sim.config.account_id}/transactions", headers=headers)
+
+        assert resp.status_code == 401
+
+
+class TestListing:
+    @pytest.mark.asyncio
+    async def test_pages_through_transactions(self):
+        sim = NorthSimulator(_config())
+
+        async with await _client(sim) as client:
+            headers = {"Authorization": f"Bearer {await _token(client, sim)}"}
+            for i in range(5):
+                await client.post(
+                    f"/mids/{sim.config.mid}/gateways/payment",
+                    json={"token": "t", "amount": f"{10 + i}.00"},
+                    headers=headers,
+                )
+
+            url = f"/accounts/{sim.config.account_id}/transactions"
+            first = (await client.get(url, params={"pageSize": 3}, headers=headers)).json()
+            second = (await client.get(url, params={"pageSize": 3, "page": 2}, headers=headers)).json()
+
+        assert [len(first["transactions"]), first["hasMore"], first["total"]] == [3, True, 5]
+        assert [len(second["transactions"]), second["hasMore"]] == [2, False]
+        ids = [t["id"] for t in first["transactions"] + second["transactions"]]
+        assert ids == sorted(set(ids))
+
+    @pytest.mark.asyncio
+    async def test_iter_transactions_streams_pages(self, sim: NorthSimulator):
+        from datetime import date
+
+        for amount in ("10.00", "20.00", "30.00"):
+            await north.charge_card("tok_ok", Decimal(amount))
+        sim.expire_tokens()
+
+        pages = [page async for page in north.iter_transactions(date.today(), page_size=2)]
+
+        assert [len(page) for page in pages] == [2, 1]
+        assert [t.amount for page in pages for t in page] == [Decimal("10.00"), Decimal("20.00"), Decimal("30.00")]
+        assert all(t.status == "approved" and not t.transaction_id.startswith("ccs_") for page in pages for t in page)
+
+
+# ---------- Batch session ----------
+
+
+class TestNorthSession:
+    @pytest.mark.asyncio
+    async def test_one_token_for_many_voids(self, sim: NorthSimulator):
+        charges = [await north.charge_card("tok_ok", 25) for _ in range(6)]
+        sim.calls["auth"] = 0
+
+        async with north.NorthSession(max_connections=3) as session:
+            await asyncio.gather(*(
+                session.void_transaction(c.account_id, c.transaction_id, "admin@example.com")
+                for c in charges
+            ))
+
+        assert sim.calls["auth"] == 1
+        assert {t.status for t in sim.transactions.values()} == {"voided"}
+
+    @pytest.mark.asyncio
+    async def test_reauthenticates_once_when_token_expires(self, sim: NorthSimulator):
+        charges = [await north.charge_card("tok_ok", 25) for _ in range(4)]
+        sim.settle()
+
+        async with north.NorthSession() as session:
+            await session.refund_transaction(charges[0].account_id, charges[0].transaction_id, 25, "a")
+            sim.expire_tokens()
+            sim.calls["auth"] = 0
+            await asyncio.gather(*(
+                session.refund_transaction(c.account_id, c.transaction_id, 25, "a")
+                for c in charges[1:]
+            ))
+
+        assert sim.calls["auth"] == 1
+        assert {t.status for t in sim.transactions.values()} == {"refunded"}
+
+    @pytest.mark.asyncio
+    async def test_void_of_settled_charge_is_a_request_error(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", 25)
+        sim.settle()
+
+        async with north.NorthSession() as session:
+            with pytest.raises(north.NorthRequestError):
+                await session.void_transaction(charge.account_id, charge.transaction_id, "a")
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+import core.rate_limit as rate_limit_module
+from core.rate_limit import (
+    MemoryBucketStore,
+    Rate,
+    RateLimiter,
+    RedisBucketStore,
+    RouteLimit,
+    rate_limit,
+    set_limiter,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRate:
+    def test_parse(self):
+        assert Rate.parse("5/minute") == Rate(5, 60)
+        assert Rate.parse(" 3/hours ") == Rate(3, 3600)
+        assert Rate.parse("off") is None
+
+    def test_parse_rejects_unknown_periods(self):
+        with pytest.raises(ValueError, match="fortnight"):
+            Rate.parse("5/fortnight")
+
+
+class TestMemoryBucketStore:
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        store = MemoryBucketStore(clock=clock)
+        rate = Rate(3, 60)  # one token every 20s
+
+        assert [store.take("k", rate) for _ in range(3)] == [0, 0, 0]
+        assert store.take("k", rate) == pytest.approx(20)
+
+        clock.now += 5
+        assert store.take("k", rate) == pytest.approx(15)
+        clock.now += 15
+        assert store.take("k", rate) == 0
+
+    def test_keys_are_independent(self):
+        store = MemoryBucketStore(clock=FakeClock())
+        rate = Rate(1, 60)
+        assert store.take("a", rate) == 0
+        assert store.take("b", rate) == 0
+        assert store.take("a", rate) > 0
+
+    def test_full_buckets_are_pruned(self):
+        clock = FakeClock()
+        store = MemoryBucketStore(clock=clock, prune_every=3)
+        rate = Rate(2, 60)
+        store.take("idle", rate)
+        clock.now += 60
+        store.take("busy", rate)
+        store.take("busy", rate)
+        assert set(store._buckets) == {"busy"}
+
+
+class TestRateLimiter:
+    def limiter(self) -> RateLimiter:
+        limits = {"login": RouteLimit(per_ip=Rate(10, 60), per_identity=Rate(2, 60))}
+        return RateLimiter(MemoryBucketStore(clock=FakeClock()), limits)
+
+    def test_identity_bucket_spans_addresses(self):
+        limiter = self.limiter()
+        assert limiter.check("login", "10.0.0.1", "Ann@Example.com") == 0
+        assert limiter.check("login", "10.0.0.2", "ann@example.com ") == 0
+        assert limiter.check("login", "10.0.0.3", "ann@example.com") > 0
+        assert limiter.check("login", "10.0.0.3", "bob@example.com") == 0
+
+    def test_ip_bucket_spans_identities(self):
+        limiter = self.limiter()
+        waits = [limiter.check("login", "10.0.0.1", f"user{i}@example.com") for i in range(11)]
+        assert waits[:10] == [0] * 10
+        assert waits[10] == pytest.approx(6)
+
+
+class Credentials(BaseModel):
+    email: str
+
+
+class UnreachableStore:
+    """A shared store whose server is down until `up` is set."""
+
+    blocking = True
+
+    def __init__(self) -> None:
+        self.up = False
+        self.taken: list[str] = []
+
+    def take(self, key: str, rate: Rate) -> float:
+        if not self.up:
+            raise ConnectionError("Error 111 connecting to localhost:6379. Connection refused.")
+        self.taken.append(key)
+        return 0.0
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setitem(
+        rate_limit_module.ROUTE_LIMITS, "login", RouteLimit(per_ip=Rate(100, 60), per_identity=Rate(2, 60))
+    )
+    set_limiter(RateLimiter(MemoryBucketStore()))
+
+    app = FastAPI()
+
+    @app.post("/login", dependencies=[rate_limit("login", identity_field="email")])
+    def login(data: Credentials):
+        return {"email": data.email}
+
+    yield TestClient(app)
+    set_limiter(None)
+
+
+class TestRateLimitDependency:
+    def test_answers_429_with_retry_after(self, client):
+        assert client.post("/login", json={"email": "ann@example.com"}).status_code == 200
+        assert client.post("/login", json={"email": "ann@example.com"}).status_code == 200
+
+        response = client.post("/login", json={"email": "ann@example.com"})
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "30"
+
+        assert client.post("/login", json={"email": "bob@example.com"}).status_code == 200
+
+    def test_malformed_body_falls_through_to_validation(self, client):
+        response = client.post("/login", content=b"not json", headers={"Content-Type": "application/json"})
+        assert response.status_code == 422
+
+    def test_unknown_route_is_a_programming_error(self):
+        with pytest.raises(KeyError):
+            rate_limit("nope")
+
+    def test_disabled(self, client, monkeypatch):
+        monkeypatch.setattr(rate_limit_module, "RATE_LIMIT_ENABLED", False)
+        for _ in range(5):
+            assert client.post("/login", json={"email": "ann@example.com"}).status_code == 200
+
+    def test_unreachable_store_falls_back_to_memory(self, client, caplog):
+        store = UnreachableStore()
+        set_limiter(RateLimiter(store))
+
+        assert client.post("/login", json={"email": "ann@example.com"}).status_code == 200
+        assert client.post("/login", json={"email": "ann@example.com"}).status_code == 200
+        assert client.post("/login", json={"email": "ann@example.com"}).status_code == 429
+        # Logged once per outage, not per request
+        assert [r.getMessage() for r in caplog.records if r.levelname == "ERROR"] == [
+            "Rate limit store unavailable; limiting per worker until it recovers"
+        ]
+
+        store.up = True
+        assert client.post("/login", json={"email": "bob@example.com"}).status_code == 200
+        assert store.taken == ["login:ip:testclient", "login:id:bob@example.com"]
+
+
+# ---------- Against a real Redis ----------
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    pytest.importorskip("redis")
+    from benchmarks.redis_server import disposable_redis
+
+    try:
+        context = disposable_redis()
+        url = context.__enter__()
+    except (RuntimeError, OSError) as exc:
+        pytest.skip(f"Redis not available: {exc}")
+    try:
+        yield url
+    finally:
+        context.__exit__(None, None, None)
+
+
+class TestRedisBucketStore:
+    def test_buckets_are_shared_between_clients(self, redis_url):
+        first = RedisBucketStore.from_url(redis_url)
+        second = RedisBucketStore.from_url(redis_url)
+        rate = Rate(2, 60)
+
+        assert first.take("shared", rate) == 0
+        assert second.take("shared", rate) == 0
+        assert first.take("shared", rate) == pytest.approx(30, abs=1)
+        assert second.take("other", rate) == 0
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import shutil
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import services.reconciliation_service as reconciliation
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from services.north_payment_service import NorthTransaction
+from services.reconciliation_service import ISSUE_KINDS, ReconciliationService
+
+DAY = date(2026, 5, 2)
+
+GATEWAY = [
+    [
+        NorthTransaction("100", Decimal("40.00"), "approved"),                  # matches registration 1
+        NorthTransaction("102", Decimal("35.00"), "approved"),                  # we recorded 40.00
+        NorthTransaction("103", Decimal("40.00"), "voided"),                    # we still show paid
+        NorthTransaction("107", Decimal("40.00"), "approved"),                  # held the day before, charged today
+    ],
+    # A page with nothing North gave an id for stages nothing
+    [NorthTransaction("", Decimal("10.00"), "declined")],
+    [
+        NorthTransaction("104", Decimal("40.00"), "refunded", Decimal("40.00")),  # we still show paid
+        NorthTransaction("300", Decimal("60.00"), "approved"),                  # we have no record of it
+        NorthTransaction("301", Decimal("15.00"), "declined"),                  # nothing was captured
+    ],
+]
+
+
+@pytest.fixture
+def service(engine, tmp_path, monkeypatch):
+    """A day of registrations and payments, and North's listing of the same day."""
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event_registration (
+                id SERIAL PRIMARY KEY, transaction_id VARCHAR NULL, amount_paid NUMERIC(10, 2) NULL,
+                payment_status VARCHAR NOT NULL, created_at TIMESTAMP NOT NULL, paid_at TIMESTAMP NULL
+            )
+        """)
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.payment (
+                id SERIAL PRIMARY KEY, registration_id INT NULL, amount NUMERIC NOT NULL,
+                status VARCHAR NOT NULL, external_reference VARCHAR NULL, created_at TIMESTAMP NOT NULL
+            )
+        """)
+        conn.exec_driver_sql("""
+            INSERT INTO saga.event_registration (transaction_id, amount_paid, payment_status, created_at) VALUES
+                ('100', 40.00, 'paid',    '2026-05-02 09:00'),
+                ('101', 40.00, 'paid',    '2026-05-02 10:00'),
+                ('102', 40.00, 'paid',    '2026-05-02 11:00'),
+                ('103', 40.00, 'paid',    '2026-05-02 12:00'),
+                ('104', 40.00, 'paid',    '2026-05-02 13:00'),
+                ('105', 40.00, 'paid',    '2026-05-01 23:59:59'),
+                ('106', 40.00, 'paid',    '2026-05-03 00:00'),
+                (NULL,  NULL,  'pending', '2026-05-02 14:00');
+            UPDATE saga.event_registration SET paid_at = created_at WHERE transaction_id IS NOT NULL;
+            -- Declined late on the 1st, paid through retry-payment on the 2nd
+            INSERT INTO saga.event_registration (transaction_id, amount_paid, payment_status, created_at, paid_at)
+            VALUES ('107', 40.00, 'paid', '2026-05-01 23:00', '2026-05-02 08:00');
+            -- Standalone payment, and one that belongs to registration 1 (counted through it)
+            INSERT INTO saga.payment (registration_id, amount, status, external_reference, created_at) VALUES
+                (NULL, 25.00, 'paid', '200', '2026-05-02 15:00'),
+                (1,    40.00, 'paid', '100', '2026-05-02 09:00');
+        """)
+    shutil.copy(MIGRATIONS_DIR / "003_payment_reconciliation.sql", tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+
+    async def listing(day, page_size):
+        for page in GATEWAY if day == DAY else []:
+            yield page
+
+    monkeypatch.setattr(reconciliation, "iter_transactions", listing)
+    with Session(engine) as db:
+        yield ReconciliationService(db)
+
+
+def _issues(db: Session) -> list[tuple]:
+    return db.execute(text("""
+        SELECT kind, transaction_id, registration_id, payment_id, recorded_amount, gateway_amount,
+               recorded_status, gateway_status
+        FROM saga.reconciliation_issue
+        WHERE resolved_at IS NULL
+        ORDER BY transaction_id
+    """)).all()
+
+
+class TestReconcileDay:
+    @pytest.mark.asyncio
+    async def test_records_each_kind_of_discrepancy(self, service):
+        report = await service.reconcile_day(DAY)
+
+        assert report.gateway_transactions == 8
+        assert report.issues == {
+            "orphan_charge": 1,
+            "orphan_record": 2,
+            "amount_mismatch": 1,
+            "unrecorded_void": 1,
+            "unrecorded_refund": 1,
+        }
+        # 105 and 106 fall outside the day, so they aren't orphan records of it
+        assert _issues(service.db) == [
+            ("orphan_record", "101", 2, None, Decimal("40.00"), None, "paid", None),
+            ("amount_mismatch", "102", 3, None, Decimal("40.00"), Decimal("35.00"), "paid", "approved"),
+            ("unrecorded_void", "103", 4, None, Decimal("40.00"), Decimal("40.00"), "paid", "voided"),
+            ("unrecorded_refund", "104", 5, None, Decimal("40.00"), Decimal("40.00"), "paid", "refunded"),
+            ("orphan_record", "200", None, 1, Decimal("25.00"), None, "paid", None),
+            ("orphan_charge", "300", None, None, None, Decimal("60.00"), None, "approved"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rerunning_a_day_replaces_its_open_issues_and_keeps_resolved_ones(self, service):
+        await service.reconcile_day(DAY)
+        service.db.execute(text("UPDATE saga.reconciliation_issue SET resolved_at = now() WHERE kind = 'orphan_charge'"))
+        service.db.commit()
+
+        report = await service.reconcile_day(DAY)
+
+        assert sum(report.issues.values()) == 6
+        kinds = service.db.execute(text("""
+            SELECT kind, count(*) FILTER (WHERE resolved_at IS NULL), count(*) FILTER (WHERE resolved_at IS NOT NULL)
+            FROM saga.reconciliation_issue GROUP BY kind
+        """)).all()
+        assert sorted(kinds) == sorted(
+            (kind, 2 if kind == "orphan_record" else 1, 1 if kind == "orphan_charge" else 0) for kind in ISSUE_KINDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_a_retried_charge_belongs_to_the_day_it_was_paid(self, service):
+        # The 1st has no gateway transactions: only 105 was charged that day
+        report = await service.reconcile_day(date(2026, 5, 1))
+
+        assert report.issues["orphan_record"] == 1
+        assert [(kind, txn) for kind, txn, *_ in _issues(service.db)] == [("orphan_record", "105")]
+
+    @pytest.mark.asyncio
+    async def test_a_quiet_day_records_nothing(self, service, monkeypatch):
+        async def listing(day, page_size):
+            yield [NorthTransaction("", Decimal("10.00"), "declined")]
+
+        monkeypatch.setattr(reconciliation, "iter_transactions", listing)
+        report = await service.reconcile_day(date(2026, 6, 1))
+
+        assert report.issues == dict.fromkeys(ISSUE_KINDS, 0)
+        assert _issues(service.db) == []
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import shutil
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import services.north_payment_service as north
+from benchmarks.north_simulator import NorthSimulator, SimulatorConfig
+from benchmarks.postgres import free_port
+from benchmarks.run import serve_in_thread
+from core import events
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from services.registration_hold_service import confirm_hold
+from services.refund_job_service import RefundJobService, _Charge, choose_action, settles_at
+
+
+@pytest.fixture
+def sim(monkeypatch) -> NorthSimulator:
+    simulator = NorthSimulator(SimulatorConfig(auth_latency_ms=0, charge_latency_ms=0, transaction_latency_ms=0))
+    port = free_port()
+    monkeypatch.setattr(north, "NORTH_BASE_URL", f"http://127.0.0.1:{port}")
+    monkeypatch.setattr(north, "NORTH_MID", simulator.config.mid)
+    monkeypatch.setattr(north, "NORTH_DEV_KEY", simulator.config.developer_key)
+    monkeypatch.setattr(north, "NORTH_PASSWORD", simulator.config.password)
+    with serve_in_thread(simulator.app, port):
+        yield simulator
+
+
+# ---------- Void vs refund ----------
+
+
+class TestSettlement:
+    def test_midnight_cutoff(self):
+        assert settles_at(datetime(2026, 5, 2, 14, 30)) == datetime(2026, 5, 3, 0, 0)
+
+    def test_evening_cutoff_before_and_after(self):
+        assert settles_at(datetime(2026, 5, 2, 14, 30), cutoff_hour=20) == datetime(2026, 5, 2, 20, 0)
+        assert settles_at(datetime(2026, 5, 2, 21, 0), cutoff_hour=20) == datetime(2026, 5, 3, 20, 0)
+
+    def test_same_day_voids_older_refunds(self):
+        charged = datetime(2026, 5, 2, 9, 0)
+        assert choose_action(charged, now=datetime(2026, 5, 2, 23, 59)) == "void"
+        assert choose_action(charged, now=datetime(2026, 5, 3, 0, 0)) == "refund"
+
+
+# ---------- Reversal against the simulator ----------
+
+
+class TestReverse:
+    @pytest.mark.asyncio
+    async def test_void_falls_back_to_refund_when_already_settled(self, sim: NorthSimulator):
+        settled = await north.charge_card("tok_ok", Decimal("40.00"))
+        sim.settle()
+        fresh = await north.charge_card("tok_ok", Decimal("40.00"))
+        now = datetime.now()
+
+        service = RefundJobService(db=None)
+        async with north.NorthSession() as session:
+            outcomes = [
+                await service._reverse(
+                    session,
+                    _Charge(i, i, c.transaction_id, c.account_id, Decimal("40.00"), now),
+                    "admin@example.com",
+                    now,
+                )
+                for i, c in enumerate((settled, fresh))
+            ]
+
+        assert [(o.action, o.status) for o in outcomes] == [("refund", "refunded"), ("void", "voided")]
+        assert sim.transactions[int(settled.transaction_id)].status == "refunded"
+        assert sim.transactions[int(fresh.transaction_id)].status == "voided"
+
+    @pytest.mark.asyncio
+    async def test_gateway_rejection_marks_item_failed(self, sim: NorthSimulator):
+        charge = await north.charge_card("tok_ok", Decimal("40.00"))
+        sim.settle()
+        now = datetime.now()
+
+        async with north.NorthSession() as session:
+            outcome = await RefundJobService(db=None)._reverse(
+                session,
+                # Refund more than was captured — North rejects it
+                _Charge(1, 1, charge.transaction_id, charge.account_id, Decimal("90.00"), now),
+                "admin@example.com",
+                now,
+            )
+
+        assert (outcome.action, outcome.status) == ("refund", "failed")
+        assert outcome.error
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def db(engine, tmp_path, monkeypatch):
+    """One charge made before paid_at existed, and a seat held yesterday whose card is charged today."""
+    monkeypatch.setattr(events, "_handlers", defaultdict(list))
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event_registration (
+                id SERIAL PRIMARY KEY, payment_status VARCHAR NOT NULL, payment_method VARCHAR NULL,
+                amount_paid NUMERIC(10, 2) NULL, transaction_id VARCHAR NULL, north_uniq_id VARCHAR NULL,
+                north_account_id VARCHAR NULL, card_last_four VARCHAR NULL, hold_expires_at TIMESTAMP NULL,
+                created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NULL
+            )
+        """)
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.refund_job_item (
+                id SERIAL PRIMARY KEY, job_id INT NOT NULL, registration_id INT NOT NULL,
+                status VARCHAR NOT NULL DEFAULT 'pending'
+            )
+        """)
+        conn.exec_driver_sql("""
+            INSERT INTO saga.event_registration
+                (payment_status, amount_paid, transaction_id, north_account_id, hold_expires_at, created_at)
+            VALUES ('paid', 40.00, '500', 'acct-1', NULL, now() - interval '3 days'),
+                   ('pending', 40.00, NULL, NULL, now() + interval '10 minutes', now() - interval '1 day');
+        """)
+    shutil.copy(MIGRATIONS_DIR / "018_registration_paid_at.sql", tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+    with Session(engine) as session:
+        yield session
+
+
+class TestChargeTime:
+    def test_retried_charge_is_voided_not_refunded(self, db):
+        # retry-payment confirms yesterday's hold today
+        assert confirm_hold(db, 2, Decimal("40.00"), "501", "ccs_501", "acct-1", "4242")
+        db.execute(text("""
+            INSERT INTO saga.refund_job_item (job_id, registration_id) VALUES (1, 1), (1, 2)
+        """))
+        db.commit()
+
+        now = datetime.now()
+        charges = RefundJobService(db)._next_batch(1, 10)
+        created = dict(db.execute(text("SELECT id, created_at FROM saga.event_registration")).all())
+
+        # The pre-migration charge falls back to created_at; the retried one uses the charge time
+        assert charges[0].charged_at == created[1]
+        assert charges[1].charged_at > created[2]
+        assert [choose_action(charge.charged_at, now) for charge in charges] == ["refund", "void"]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import services.app_settings_service as app_settings
+import services.event_handlers  # noqa: F401  (subscribes the receipt handler)
+from benchmarks.seed import MODELS_COVER_MIGRATION, _import_models
+from core.database import Base
+from core.events import drain
+from core.migrations import MigrationRunner
+from services.north_payment_service import NorthChargeResult
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def db(engine, monkeypatch):
+    """
+    The full schema, one event, and two members whose profile ids and account
+    ids are crossed: profile 1 (Ann) logs in as account 2, profile 2 (Bob) as account 1.
+    """
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+    _import_models()
+    Base.metadata.create_all(engine)
+    runner = MigrationRunner(engine)
+    runner.baseline(MODELS_COVER_MIGRATION)
+    runner.migrate()
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO saga.event (township, state, zipcode, golf_course, date, start_time, member_price, guest_price, capacity)
+            VALUES ('Pine Valley', 'NJ', '08021', 'Pine Valley', '2026-06-04', '08:00', 75, 95, 10);
+            INSERT INTO saga."user" (id, first_name, last_name, phone_number) VALUES
+                (1, 'Ann', 'Member', '555-0101'),
+                (2, 'Bob', 'Member', '555-0102');
+            INSERT INTO saga.user_account (id, user_id, email, password_hash, token_version) VALUES
+                (1, 2, 'bob@example.com', 'x', 1),
+                (2, 1, 'ann@example.com', 'x', 1);
+        """))
+    monkeypatch.setattr(app_settings, "_cache", app_settings._SettingsCache())
+    with patch("core.database.SessionLocal", lambda: Session(engine)), Session(engine) as session:
+        yield session
+
+
+def _approved(transaction_id: str) -> NorthChargeResult:
+    return NorthChargeResult(
+        approved=True,
+        transaction_id=transaction_id,
+        uniq_id=f"ccs_{transaction_id}",
+        account_id="acct-1",
+        response_text="APPROVAL",
+        card_last_four="4242",
+        decline_reason=None,
+    )
+
+
+class TestMemberRegistration:
+    @pytest.mark.asyncio
+    @patch("services.email_service.EmailService.send_event_registration_receipt")
+    async def test_registration_and_receipt_belong_to_the_members_account(self, send_receipt, db):
+        from models.user import User
+        from routers.registrations import MemberRegistrationRequest, register_member
+
+        ann  = db.get(User, 1)
+        data = MemberRegistrationRequest(event_id=1, payment_token="tok_ok", idempotency_key="ann-key-0001")
+        with patch("routers.registrations.charge_card", AsyncMock(return_value=_approved("9001"))):
+            result = await register_member(data, Response(), current_user=ann, db=db)
+
+        row = db.execute(
+            text("SELECT user_id, email, phone, payment_status FROM saga.event_registration WHERE id = :id"),
+            {"id": result.registration_id},
+        ).one()
+        assert tuple(row) == (2, "ann@example.com", "555-0101", "paid")
+
+        assert drain(timeout=5)
+        assert send_receipt.call_args.kwargs["to_email"] == "ann@example.com"
+        assert send_receipt.call_args.kwargs["amount"] == Decimal("75")
+
+    @pytest.mark.asyncio
+    async def test_second_registration_by_the_same_member_is_a_duplicate(self, db):
+        from fastapi import HTTPException
+
+        from models.user import User
+        from routers.registrations import MemberRegistrationRequest, register_member
+
+        ann = db.get(User, 1)
+        with patch("routers.registrations.charge_card", AsyncMock(return_value=_approved("9001"))):
+            await register_member(
+                MemberRegistrationRequest(event_id=1, payment_token="tok_ok", idempotency_key="ann-key-0001"),
+                Response(), current_user=ann, db=db,
+            )
+            with pytest.raises(HTTPException) as exc:
+                await register_member(
+                    MemberRegistrationRequest(event_id=1, payment_token="tok_ok", idempotency_key="ann-key-0002"),
+                    Response(), current_user=ann, db=db,
+                )
+        assert exc.value.status_code == 409
+        assert exc.value.detail == "You are already registered for this event."
+
+
+class TestGuestRegistration:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("rate, charged", [("0", Decimal("95")), ("60.00", Decimal("60.00"))])
+    async def test_guest_event_rate_overrides_the_events_guest_price(self, db, rate, charged):
+        from routers.registrations import GuestRegistrationRequest, register_guest
+        from services.app_settings_service import AppSettingsService, cached_settings
+
+        AppSettingsService(db).update_setting("guest_event_rate", rate)
+        data = GuestRegistrationRequest(
+            event_id=1, payment_token="tok_ok", idempotency_key="guest-key-0001",
+            first_name="Gail", last_name="Guest", email="gail@example.com", phone="555-0199",
+        )
+        charge_card = AsyncMock(return_value=_approved("9002"))
+        with patch("routers.registrations.charge_card", charge_card):
+            result = await register_guest(data, Response(), app_settings=cached_settings(db), db=db)
+
+        assert result.amount_charged == float(charged)
+        assert charge_card.call_args.args[1] == float(charged)
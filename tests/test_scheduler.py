@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import threading
+from datetime import timedelta
+
+import pytest
+
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from core.scheduler import Job, JobStats, Scheduler
+
+
+def _counting_job(name: str = "job", **options) -> tuple[Job, list]:
+    calls = []
+    return Job(name, lambda: calls.append(1), **{"interval": timedelta(hours=1), **options}), calls
+
+
+# ---------- Without a database ----------
+
+
+class TestJob:
+    def test_rejects_unknown_misfire_policy(self):
+        with pytest.raises(ValueError):
+            Job("job", lambda: None, timedelta(minutes=1), misfire="later")
+
+    def test_stats(self):
+        stats = JobStats()
+        stats.record(0.2, None)
+        stats.record(0.4, "RuntimeError: boom")
+        assert (stats.runs, stats.failures, stats.max_seconds) == (2, 1, 0.4)
+        assert stats.mean_seconds == pytest.approx(0.3)
+        assert stats.last_error == "RuntimeError: boom"
+
+
+class TestPerWorkerJobs:
+    def test_run_every_time_without_the_database(self):
+        job, calls = _counting_job(exclusive=False)
+        scheduler = Scheduler([job], engine=object())
+        assert scheduler.run_once(job) == 3600
+        assert scheduler.run_once(job) == 3600
+        assert len(calls) == 2 and scheduler.stats["job"].runs == 2
+
+    def test_failures_are_counted_not_raised(self):
+        job = Job("job", lambda: 1 / 0, timedelta(minutes=1), exclusive=False)
+        scheduler = Scheduler([job], engine=object())
+        scheduler.run_once(job)
+        assert scheduler.stats["job"].failures == 1
+        assert scheduler.stats["job"].last_error.startswith("ZeroDivisionError")
+
+    @pytest.mark.asyncio
+    async def test_loop_runs_off_the_event_loop_until_stopped(self):
+        threads = []
+        job = Job("job", lambda: threads.append(threading.current_thread()), timedelta(seconds=0.01), exclusive=False)
+        scheduler = Scheduler([job], engine=object())
+        scheduler.start()
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        runs = len(threads)
+        assert runs >= 3
+        assert threading.main_thread() not in threads
+        await asyncio.sleep(0.05)
+        assert len(threads) == runs
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def engine_with_table(engine, tmp_path):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+    shutil.copy(MIGRATIONS_DIR / "016_scheduled_jobs.sql", tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+    return engine
+
+
+def _row(engine, name: str = "job"):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(
+            "SELECT *, next_run_at - LOCALTIMESTAMP AS until_next FROM saga.scheduled_job WHERE name = %s", (name,)
+        ).one()
+
+
+class TestClusterWideRuns:
+    def test_a_slot_runs_once_across_workers(self, engine_with_table):
+        job, calls = _counting_job()
+        first, second = Scheduler([job], engine_with_table), Scheduler([job], engine_with_table)
+
+        assert first.run_once(job) == pytest.approx(3600, abs=5)
+        # The second worker finds the slot taken and adopts the new due time
+        assert second.run_once(job) == pytest.approx(3600, abs=5)
+        assert len(calls) == 1
+
+        row = _row(engine_with_table)
+        assert (row.runs, row.failures, row.last_status) == (1, 0, "ok")
+        assert row.last_duration_ms is not None
+
+    def test_worker_without_the_lock_sits_the_run_out(self, engine_with_table):
+        started, release = threading.Event(), threading.Event()
+        slow = Job("job", lambda: (started.set(), release.wait(5)), timedelta(hours=1))
+        first, second = Scheduler([slow], engine_with_table), Scheduler([slow], engine_with_table)
+
+        runner = threading.Thread(target=first.run_once, args=(slow,))
+        runner.start()
+        assert started.wait(5)
+        assert second.run_once(slow) == 3600
+        release.set()
+        runner.join()
+        assert (first.stats["job"].runs, second.stats["job"].runs) == (1, 0)
+
+    @pytest.mark.parametrize("misfire, runs", [("coalesce", 1), ("skip", 0)])
+    def test_missed_runs(self, engine_with_table, misfire, runs):
+        job, calls = _counting_job(misfire=misfire, grace=timedelta(minutes=5))
+        with engine_with_table.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO saga.scheduled_job (name, next_run_at) VALUES ('job', LOCALTIMESTAMP - interval '3 hours')"
+            )
+
+        Scheduler([job], engine_with_table).run_once(job)
+
+        assert len(calls) == runs
+        # Either way the next run is an interval from now, not a burst of catch-ups
+        assert _row(engine_with_table).until_next > timedelta(minutes=59)
+
+    def test_failed_run_is_recorded(self, engine_with_table):
+        job = Job("job", lambda: 1 / 0, timedelta(minutes=1))
+        Scheduler([job], engine_with_table).run_once(job)
+
+        row = _row(engine_with_table)
+        assert (row.runs, row.failures, row.last_status) == (1, 1, "failed")
+        assert row.last_error.startswith("ZeroDivisionError")
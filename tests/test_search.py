@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from services.search_service import SEARCH_TYPES, _BRANCHES, prefix_tsquery
+
+
+class TestPrefixTsquery:
+    def test_every_word_becomes_a_prefix_term(self):
+        assert prefix_tsquery("Jo  Smi") == "jo:* & smi:*"
+
+    def test_strips_tsquery_operators(self):
+        assert prefix_tsquery("o'brien & (x | !y):*") == "o:* & brien:* & x:* & y:*"
+
+    def test_no_words_means_no_query(self):
+        assert prefix_tsquery("  -!& ") is None
+
+
+def test_every_search_type_has_a_branch():
+    assert set(_BRANCHES) == set(SEARCH_TYPES)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from core.migrations import MIGRATIONS_DIR, MigrationRunner
+from models.event import Event
+from models.event_waitlist import EventWaitlistEntry
+from services.registration_hold_service import release_hold
+from services.waitlist_service import WaitlistService
+
+
+# ---------- Against a real Postgres ----------
+
+
+@pytest.fixture
+def db(engine, tmp_path):
+    """A one-seat event whose seat was offered to the first of two waiting entries and claimed."""
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA IF EXISTS saga CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA saga")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event (
+                id SERIAL PRIMARY KEY, golf_course VARCHAR NOT NULL, township VARCHAR NOT NULL,
+                state VARCHAR NOT NULL, zipcode VARCHAR NOT NULL, date DATE NOT NULL, start_time TIME NOT NULL,
+                member_price NUMERIC NULL, guest_price NUMERIC NOT NULL, capacity INT NOT NULL,
+                image_url VARCHAR NULL, description VARCHAR NULL
+            )
+        """)
+        conn.exec_driver_sql("CREATE TABLE saga.user_account (id SERIAL PRIMARY KEY)")
+        conn.exec_driver_sql("""
+            CREATE TABLE saga.event_registration (
+                id SERIAL PRIMARY KEY, event_id INT NOT NULL, payment_status VARCHAR NOT NULL,
+                hold_expires_at TIMESTAMP NULL, updated_at TIMESTAMP NULL
+            )
+        """)
+        conn.exec_driver_sql("""
+            INSERT INTO saga.event (golf_course, township, state, zipcode, date, start_time, guest_price, capacity)
+            VALUES ('Pine Valley', 'Pine Valley', 'NJ', '08021', CURRENT_DATE + 7, '08:00', 95, 1)
+        """)
+    for name in ("005_event_waitlist.sql", "008_event_registered_count.sql"):
+        shutil.copy(MIGRATIONS_DIR / name, tmp_path)
+    MigrationRunner(engine, tmp_path).migrate()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("""
+            INSERT INTO saga.event_registration (event_id, payment_status, hold_expires_at)
+            VALUES (1, 'pending', now() + interval '10 minutes');
+            INSERT INTO saga.event_waitlist
+                (event_id, email, first_name, last_name, access_token, status, offered_at, offer_expires_at, registration_id)
+            VALUES (1, 'first@example.com', 'First', 'Inline', 'tok-first', 'claimed', now(), now() + interval '20 minutes', 1);
+            INSERT INTO saga.event_waitlist (event_id, email, first_name, last_name, access_token, status)
+            VALUES (1, 'second@example.com', 'Second', 'Inline', 'tok-second', 'waiting');
+        """)
+    with Session(engine) as session:
+        yield session
+
+
+def _statuses(db: Session) -> dict[str, str]:
+    db.expire_all()
+    return {entry.email: entry.status for entry in db.query(EventWaitlistEntry)}
+
+
+class TestDeclinedClaim:
+    def test_offer_goes_back_to_the_person_it_was_made_to(self, db):
+        release_hold(db, 1)
+
+        assert _statuses(db) == {"first@example.com": "offered", "second@example.com": "waiting"}
+        waitlist = WaitlistService(db)
+        assert waitlist.released_offer_token(1) == "tok-first"
+        # Still held for them, so the next in line isn't offered it
+        assert waitlist.seats_taken(db.get(Event, 1)) == 1
+        assert waitlist.find_offer(1, "tok-first").registration_id == 1
+
+    @patch("services.waitlist_service.EmailService.send_waitlist_offer")
+    def test_lapsed_offer_passes_to_the_next_in_line(self, send_offer, db):
+        db.execute(
+            EventWaitlistEntry.__table__.update()
+            .where(EventWaitlistEntry.access_token == "tok-first")
+            .values(offer_expires_at=EventWaitlistEntry.offered_at)
+        )
+        db.commit()
+        release_hold(db, 1)
+
+        assert WaitlistService(db).sweep() == 1
+        assert _statuses(db) == {"first@example.com": "expired", "second@example.com": "offered"}
+        assert send_offer.call_args.kwargs["to_email"] == "second@example.com"
+
+    def test_paid_registration_keeps_its_claim(self, db):
+        db.execute(EventWaitlistEntry.__table__.update().values(status="claimed"))
+        db.commit()
+        with db.get_bind().begin() as conn:
+            conn.exec_driver_sql("UPDATE saga.event_registration SET payment_status = 'paid'")
+
+        release_hold(db, 1)
+        assert _statuses(db)["first@example.com"] == "claimed"